@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Query Layer Benchmark for DeadStream
+
+Times every public function in src/database/queries.py against synthetic
+catalogues of increasing size and fails if any of them falls back to a
+full table scan (checked with EXPLAIN QUERY PLAN, see
+src/database/benchmark.py). Runs headless: no UI, no data/shows.db.
+
+Results are written to a JSON file so runs can be compared over time.
+
+Usage:
+    # 15k, 100k and 1M rows (catalogues are cached in data/benchmarks/)
+    python benchmark_queries.py
+
+    # Quick run on the real catalogue size only
+    python benchmark_queries.py --sizes 15000 --repeat 3
+
+    # Compare against an earlier run
+    python benchmark_queries.py --compare data/benchmarks/queries-20260101-120000.json
+"""
+
+import sys
+import os
+import argparse
+import json
+import platform
+import sqlite3
+import time
+from datetime import datetime
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.database.benchmark import run_benchmark, build_workload, missing_workload
+from src.database.migrations import LATEST_VERSION
+from src.database.synthetic import build_catalogue, DEFAULT_SEED
+
+
+BENCHMARK_DIR = os.path.join(project_root, 'data', 'benchmarks')
+DEFAULT_SIZES = [15000, 100000, 1000000]
+
+
+def get_catalogue(rows, seed, rebuild=False):
+    """
+    Get a synthetic catalogue file, building it if needed
+
+    Catalogues are named by size, seed and schema version, so an existing
+    file is only reused when it was generated the same way.
+
+    Returns:
+        Tuple of (path, build seconds or None if reused)
+    """
+    os.makedirs(BENCHMARK_DIR, exist_ok=True)
+    path = os.path.join(BENCHMARK_DIR, f'catalogue-{rows}-s{seed}-v{LATEST_VERSION}.db')
+    if os.path.exists(path) and not rebuild:
+        return path, None
+
+    print(f"[INFO] Building {rows:,}-row catalogue...")
+    start = time.perf_counter()
+    build_catalogue(path, rows, seed)
+    return path, time.perf_counter() - start
+
+
+def print_results(rows, results, previous=None):
+    """Print one catalogue's timings, with change vs a previous run if given"""
+    print(f"\n{rows:,} ROWS (median ms)")
+    print("-"*60)
+    for name, result in results.items():
+        line = f"{name:<30}{result['median_ms']:>10.3f}{result['rows']:>10,}"
+        if previous and name in previous:
+            before = previous[name]['median_ms']
+            if before:
+                line += f"{(result['median_ms'] - before) / before:>+9.0%}"
+        if result['full_scans']:
+            line += "  [FULL SCAN]"
+        print(line)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Time every query function and check for full table scans'
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Catalogue sizes in rows (default: 15000 100000 1000000)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Timed calls per function, median is reported (default: 5)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f'Catalogue random seed (default: {DEFAULT_SEED})')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Regenerate catalogues even if cached')
+    parser.add_argument('--output',
+                        help='Results file (default: data/benchmarks/queries-<timestamp>.json)')
+    parser.add_argument('--compare', help='Earlier results file to compare against')
+    args = parser.parse_args()
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = {run['rows']: run['functions'] for run in json.load(f)['catalogues']}
+
+    print("\n" + "="*60)
+    print("QUERY LAYER BENCHMARK")
+    print("="*60)
+    print(f"SQLite {sqlite3.sqlite_version}, Python {platform.python_version()}")
+
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'sqlite_version': sqlite3.sqlite_version,
+        'python_version': platform.python_version(),
+        'machine': platform.machine(),
+        'schema_version': LATEST_VERSION,
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'catalogues': [],
+    }
+    failures = []
+
+    for rows in args.sizes:
+        path, build_seconds = get_catalogue(rows, args.seed, args.rebuild)
+
+        conn = sqlite3.connect(path)
+        workload = build_workload(conn)
+        conn.close()
+        for name in missing_workload(workload):
+            failures.append(f"{name}: no benchmark workload entry")
+
+        results = run_benchmark(path, args.repeat, workload)
+        print_results(rows, results, previous.get(rows))
+
+        for name, result in results.items():
+            for scan in result['full_scans']:
+                failures.append(f"{name} ({rows:,} rows): {scan}")
+
+        report['catalogues'].append({
+            'rows': rows,
+            'size_bytes': os.path.getsize(path),
+            'build_seconds': round(build_seconds, 2) if build_seconds else None,
+            'functions': results,
+        })
+
+    output = args.output or os.path.join(
+        BENCHMARK_DIR, f"queries-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n[OK] Results written to {output}")
+
+    if failures:
+        print("\n[ERROR] Query plan regressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+    print("[OK] No full table scans")
+
+
+if __name__ == '__main__':
+    main()
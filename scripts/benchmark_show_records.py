@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Show Record Benchmark for DeadStream
+
+Compares the two in-memory representations of query results:
+- dict per row (the old row_to_dict() conversion)
+- Show records (src/database/models.py)
+
+Rows are read from a throwaway in-memory database filled with a synthetic
+catalogue (src/database/synthetic.py), so the numbers don't depend on
+data/shows.db.
+
+Usage:
+    # Default: 15,000 rows (roughly the full catalogue), 5 repeats
+    python benchmark_show_records.py
+
+    # Larger list, more repeats
+    python benchmark_show_records.py --rows 100000 --repeat 10
+"""
+
+import sys
+import os
+import argparse
+import sqlite3
+import time
+import tracemalloc
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.database.models import fetch_shows
+from src.database.synthetic import fill_catalogue
+
+
+def build_database(rows):
+    """Create an in-memory database with a synthetic catalogue"""
+    conn = sqlite3.connect(':memory:')
+    fill_catalogue(conn, rows)
+    return conn
+
+
+def load_dicts(conn):
+    """Old representation: sqlite3.Row converted to a dict per row"""
+    conn.row_factory = sqlite3.Row
+    cursor = conn.execute("SELECT * FROM shows")
+    return [{key: row[key] for key in row.keys()} for row in cursor.fetchall()]
+
+
+def load_records(conn):
+    """New representation: Show records"""
+    conn.row_factory = None
+    cursor = conn.execute("SELECT * FROM shows")
+    return fetch_shows(cursor)
+
+
+def measure(loader, conn, repeat):
+    """
+    Time a loader and measure the memory its result keeps alive
+
+    Returns:
+        Tuple of (best seconds, retained bytes)
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = loader(conn)
+        timings.append(time.perf_counter() - start)
+        del result
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = loader(conn)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    retained = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del result
+    return min(timings), retained
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Compare dict rows with Show records (time and memory)'
+    )
+    parser.add_argument('--rows', type=int, default=15000,
+                        help='Number of synthetic shows (default: 15000)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Timing repeats, best is reported (default: 5)')
+    args = parser.parse_args()
+
+    conn = build_database(args.rows)
+
+    print("\n" + "="*60)
+    print(f"SHOW RECORD BENCHMARK ({args.rows:,} rows)")
+    print("="*60)
+
+    results = {}
+    for name, loader in (('dict', load_dicts), ('Show', load_records)):
+        seconds, retained = measure(loader, conn, args.repeat)
+        results[name] = (seconds, retained)
+        print(f"{name:>6}: {seconds * 1000:8.1f} ms  "
+              f"{retained / 1024 / 1024:8.2f} MB  "
+              f"({retained / args.rows:.0f} bytes/row)")
+
+    dict_time, dict_mem = results['dict']
+    show_time, show_mem = results['Show']
+    print("-"*60)
+    print(f"Show records: {dict_time / show_time:.1f}x faster, "
+          f"{dict_mem / show_mem:.1f}x less memory")
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Snapshot Mode Benchmark for DeadStream
+
+Compares the regular read-write database with a read-only snapshot
+(src/database/snapshot.py) on a representative set of browse queries:
+- Cold start: open a new connection and run each query once
+- Warm queries: repeated runs on an already open connection
+
+Cold numbers include the connection setup, schema parse and first page
+reads. The OS page cache is not dropped between runs (that needs root),
+so "cold" here means cold for SQLite, not for the disk.
+
+Usage:
+    # Synthetic 15,000-show catalogue in a temp directory
+    python benchmark_snapshot.py
+
+    # Use a real database instead
+    python benchmark_snapshot.py --db data/shows.db --repeat 50
+"""
+
+import sys
+import os
+import argparse
+import statistics
+import tempfile
+import time
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.database.connection import ConnectionManager
+from src.database.snapshot import build_snapshot
+from src.database.synthetic import build_catalogue
+
+
+# Representative browse-screen queries: (name, sql, params)
+WORKLOAD = [
+    ('years', "SELECT year, show_count FROM stats_year ORDER BY year", ()),
+    ('top_rated', """
+        SELECT * FROM shows WHERE num_reviews >= 5
+        ORDER BY avg_rating DESC, num_reviews DESC LIMIT 50
+    """, ()),
+    ('year_1977', "SELECT * FROM shows WHERE year = 1977 ORDER BY date", ()),
+    ('on_this_day', "SELECT * FROM shows WHERE month = 5 AND day = 8 ORDER BY date", ()),
+    ('search', """
+        SELECT shows.* FROM shows JOIN shows_fts ON shows_fts.rowid = shows.rowid
+        WHERE shows_fts MATCH ? ORDER BY bm25(shows_fts) LIMIT 50
+    """, ('"winterland"*',)),
+]
+
+
+def run_workload(conn):
+    """Run every workload query once, returning seconds per query"""
+    timings = {}
+    for name, sql, params in WORKLOAD:
+        start = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        timings[name] = time.perf_counter() - start
+    return timings
+
+
+def benchmark_mode(db_path, read_only, repeat):
+    """
+    Measure cold-start and warm latency for one open mode
+
+    Returns:
+        Tuple of (cold timings, warm timings); each maps query name to
+        median seconds, cold timings also include 'open'
+    """
+    cold_runs = []
+    for _ in range(repeat):
+        manager = ConnectionManager(db_path, read_only=read_only)
+        start = time.perf_counter()
+        conn = manager.reader()
+        opened = time.perf_counter() - start
+        timings = run_workload(conn)
+        timings['open'] = opened
+        cold_runs.append(timings)
+        manager.close_all()
+
+    manager = ConnectionManager(db_path, read_only=read_only)
+    conn = manager.reader()
+    run_workload(conn)
+    warm_runs = [run_workload(conn) for _ in range(repeat)]
+    manager.close_all()
+
+    def medians(runs):
+        return {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+    return medians(cold_runs), medians(warm_runs)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Compare read-write and snapshot open modes'
+    )
+    parser.add_argument('--db', help='Existing database to benchmark (default: synthetic)')
+    parser.add_argument('--rows', type=int, default=15000,
+                        help='Synthetic shows when --db is not given (default: 15000)')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Runs per measurement, median is reported (default: 20)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = args.db
+        if not db_path:
+            db_path = os.path.join(temp_dir, 'shows.db')
+            build_catalogue(db_path, args.rows)
+
+        snapshot_path = os.path.join(temp_dir, 'shows.snapshot.db')
+        info = build_snapshot(db_path, snapshot_path)
+
+        print("\n" + "="*60)
+        print("SNAPSHOT MODE BENCHMARK")
+        print("="*60)
+        print(f"Database: {info['source_bytes'] / 1024:,.0f} KB, "
+              f"snapshot: {info['size_bytes'] / 1024:,.0f} KB "
+              f"(built in {info['seconds']:.2f}s)")
+
+        results = {
+            'readwrite': benchmark_mode(db_path, False, args.repeat),
+            'snapshot': benchmark_mode(snapshot_path, True, args.repeat),
+        }
+
+        for label, index in (('COLD START', 0), ('WARM QUERIES', 1)):
+            print(f"\n{label} (median ms)")
+            print("-"*60)
+            print(f"{'query':<14}{'readwrite':>12}{'snapshot':>12}")
+            for key in results['readwrite'][index]:
+                rw = results['readwrite'][index][key] * 1000
+                snap = results['snapshot'][index][key] * 1000
+                print(f"{key:<14}{rw:>12.3f}{snap:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Build a read-optimized DeadStream database snapshot.
+
+Copies data/shows.db into data/shows.snapshot.db, then VACUUMs it at the
+snapshot page size, rebuilds the search index and runs ANALYZE. The
+result is meant to be shipped to devices and opened read-only
+(database.open_mode: snapshot in settings).
+
+Usage:
+    # Default: data/shows.db -> data/shows.snapshot.db
+    python build_snapshot.py
+
+    # Custom paths and page size
+    python build_snapshot.py --source other.db --dest out.db --page-size 8192
+"""
+
+import sys
+import os
+import argparse
+import sqlite3
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.database.schema import DB_PATH, SNAPSHOT_PATH
+from src.database.snapshot import build_snapshot, SNAPSHOT_PAGE_SIZE
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Build a VACUUMed, ANALYZEd read-only database snapshot'
+    )
+    parser.add_argument('--source', default=DB_PATH,
+                        help='Database to copy (default: data/shows.db)')
+    parser.add_argument('--dest', default=SNAPSHOT_PATH,
+                        help='Snapshot to write (default: data/shows.snapshot.db)')
+    parser.add_argument('--page-size', type=int, default=SNAPSHOT_PAGE_SIZE,
+                        help=f'SQLite page size (default: {SNAPSHOT_PAGE_SIZE})')
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("BUILDING DATABASE SNAPSHOT")
+    print("="*60)
+    print(f"Source: {os.path.abspath(args.source)}")
+
+    try:
+        info = build_snapshot(args.source, args.dest, args.page_size)
+    except (ValueError, FileNotFoundError, sqlite3.Error) as e:
+        print(f"\n[ERROR] Snapshot build failed: {e}")
+        sys.exit(1)
+
+    print(f"Snapshot: {info['path']}")
+    print(f"Page size: {info['page_size']} bytes ({info['page_count']:,} pages)")
+    print(f"Size: {info['size_bytes'] / 1024 / 1024:.2f} MB "
+          f"(source {info['source_bytes'] / 1024 / 1024:.2f} MB)")
+    print(f"Built in {info['seconds']:.2f}s")
+    print("\n[OK] Snapshot ready")
+
+
+if __name__ == '__main__':
+    main()
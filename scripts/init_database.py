@@ -2,19 +2,66 @@
 """
 Initialize the DeadStream database.
 
-Creates the shows.db file with proper schema.
+Creates the shows.db file with proper schema, or upgrades an existing
+database by applying pending schema migrations.
 Safe to run multiple times.
+
+Usage:
+    # Create or upgrade the database
+    python init_database.py
+
+    # Show schema version and pending migrations without changing anything
+    python init_database.py --status
 """
 
 import sys
 import os
+import argparse
+import sqlite3
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.database import init_database, verify_database
+from src.database import init_database, verify_database, get_db_path
+from src.database.migrations import (
+    get_user_version, pending_migrations, LATEST_VERSION
+)
+
+
+def show_status():
+    """Print the database's migration version and pending steps"""
+    db_path = get_db_path()
+    if not os.path.exists(db_path):
+        print(f"Database not found: {db_path}")
+        print(f"All {LATEST_VERSION} migrations will run on first initialization")
+        return
+
+    conn = sqlite3.connect(db_path)
+    try:
+        print(f"Database: {db_path}")
+        print(f"Schema version: {get_user_version(conn)} (latest: {LATEST_VERSION})")
+
+        pending = pending_migrations(conn)
+        if not pending:
+            print("No pending migrations")
+        for migration in pending:
+            print(f"  Pending: {migration.version}. {migration.description}")
+    finally:
+        conn.close()
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description='Create or upgrade the DeadStream database'
+    )
+    parser.add_argument('--status', action='store_true',
+                        help='Show schema version and pending migrations only')
+    args = parser.parse_args()
+
+    if args.status:
+        show_status()
+        sys.exit(0)
+
     print("Initializing DeadStream database...\n")
     
     success = init_database()
@@ -15,6 +15,9 @@ Usage:
 
     # Specific year range
     python populate_database.py --years 1977-1980
+
+    # Store audio file lists for shows that don't have them yet
+    python populate_database.py --tracks
 """
 
 import sys
@@ -29,7 +32,14 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 from src.api.rate_limiter import ArchiveAPIClient
+from src.database.connection import checkpoint, open_update_connection
 from src.database.schema import DB_PATH
+from src.database.tracks import store_tracks
+from src.database.venues import apply_known_aliases, resolve_venue
+from src.selection.best_recording import refresh_best_recordings
+
+# Shows fetched concurrently per progress line in track population mode
+TRACK_BATCH_SIZE = 50
 
 
 class ShowValidator:
@@ -143,7 +153,7 @@ class DatabasePopulator:
     
     def __init__(self, db_path=DB_PATH):
         self.db_path = db_path
-        self.api_client = ArchiveAPIClient(requests_per_second=2.0)
+        self.api_client = ArchiveAPIClient()
         self.validator = ShowValidator()
         
         # Statistics
@@ -196,6 +206,9 @@ class DatabasePopulator:
         """
         Insert a single show into the database using idempotent INSERT OR IGNORE
         
+        The venue is resolved to its normalized venues row first, so the
+        show is stored with venue_id and the venue's canonical spelling.
+        
         Args:
             conn: SQLite connection
             show_data: Dictionary of show data
@@ -204,15 +217,21 @@ class DatabasePopulator:
             True if inserted, False if already exists or error
         """
         try:
+            venue_id, venue = resolve_venue(
+                conn, show_data['venue'], show_data['city'], show_data['state']
+            )
+            
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR IGNORE INTO shows 
-                (identifier, date, venue, city, state, avg_rating, num_reviews, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                (identifier, date, venue, venue_id, city, state, avg_rating, num_reviews,
+                 last_updated)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 show_data['identifier'],
                 show_data['date'],
-                show_data['venue'],
+                venue,
+                venue_id,
                 show_data['city'],
                 show_data['state'],
                 show_data['avg_rating'],
@@ -293,9 +312,10 @@ class DatabasePopulator:
             print(f"Processing years {start_year}-{end_year}")
             print("="*60)
         
-        # Connect to database
+        # Connect to database (WAL: the UI keeps reading while we write,
+        # and sees each year once it is committed)
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = open_update_connection(self.db_path)
         except sqlite3.Error as e:
             print(f"\nFatal error: Cannot connect to database: {e}")
             sys.exit(1)
@@ -315,6 +335,10 @@ class DatabasePopulator:
                 progress_pct = (years_done / total_years) * 100
                 print(f"Progress: {years_done}/{total_years} years ({progress_pct:.1f}%)")
             
+            # Fold known alternate venue names into their canonical venue
+            aliases = apply_known_aliases(conn)
+            conn.commit()
+            
             # Final statistics
             print("\n" + "="*60)
             print("POPULATION COMPLETE")
@@ -323,6 +347,7 @@ class DatabasePopulator:
             print(f"Shows inserted to DB:   {self.stats['shows_inserted']}")
             print(f"Shows skipped:          {self.stats['shows_skipped']}")
             print(f"Errors encountered:     {self.stats['errors']}")
+            print(f"Venue aliases applied:  {aliases['renamed'] + aliases['merged']}")
             
             # Final show count
             cursor = conn.cursor()
@@ -333,6 +358,94 @@ class DatabasePopulator:
             
         finally:
             conn.close()
+        
+        self.refresh_best_recordings()
+        self.checkpoint()
+
+
+    def populate_tracks(self, limit=None):
+        """
+        Fill the tracks table for shows that have no stored tracks
+        
+        One metadata request per show, fetched TRACK_BATCH_SIZE at a time
+        with requests overlapped up to the metadata_api max_concurrent
+        setting, so a full catalogue runs at the polite rate limit rather
+        than one round trip at a time. Safe to interrupt and re-run: shows
+        that already have tracks are skipped.
+        
+        Args:
+            limit: Maximum number of shows to process (None = all)
+        """
+        # Imported here: needs the playlist module's set detection
+        from src.api.metadata import metadata_to_tracks
+        from src.api.async_client import get_metadata_batch
+        
+        conn = sqlite3.connect(self.db_path)
+        try:
+            sql = """
+                SELECT identifier FROM shows
+                WHERE identifier NOT IN (SELECT DISTINCT identifier FROM tracks)
+                ORDER BY date
+            """
+            if limit:
+                sql += f" LIMIT {int(limit)}"
+            identifiers = [row[0] for row in conn.execute(sql).fetchall()]
+        finally:
+            conn.close()
+        
+        print("\n" + "="*60)
+        print("TRACK POPULATION MODE")
+        print(f"Shows without tracks: {len(identifiers)}")
+        print("="*60)
+        
+        stored_shows = 0
+        stored_tracks = 0
+        for start in range(0, len(identifiers), TRACK_BATCH_SIZE):
+            batch = identifiers[start:start + TRACK_BATCH_SIZE]
+            results = get_metadata_batch(batch, cache=self.api_client.cache)
+            for identifier in batch:
+                try:
+                    metadata = results[identifier]
+                    if isinstance(metadata, Exception):
+                        raise metadata
+                    stored_tracks += store_tracks(
+                        identifier, metadata_to_tracks(metadata), db_path=self.db_path
+                    )
+                    stored_shows += 1
+                except Exception as e:
+                    print(f"  Error fetching tracks for {identifier}: {e}")
+                    self.stats['errors'] += 1
+            
+            print(f"Progress: {start + len(batch)}/{len(identifiers)} shows "
+                  f"({stored_tracks} tracks)")
+        
+        print("\n" + "="*60)
+        print("TRACK POPULATION COMPLETE")
+        print("="*60)
+        print(f"Shows with tracks stored: {stored_shows}")
+        print(f"Tracks stored:            {stored_tracks}")
+        print(f"Metadata cache hit rate:  {self.api_client.cache.stats()['hit_rate']:.0%}")
+        print(f"Errors encountered:       {self.stats['errors']}")
+        print("="*60)
+        
+        # Stored tracks give the scorer each recording's audio format
+        self.refresh_best_recordings()
+        self.checkpoint()
+    
+    def refresh_best_recordings(self):
+        """Rescore the best recording of every date changed by this run"""
+        result = refresh_best_recordings(db_path=self.db_path)
+        print(f"[OK] Best recordings rescored for {result['scored']} date(s) "
+              f"in {result['seconds']:.2f}s")
+    
+    def checkpoint(self):
+        """Fold the write-ahead log back into shows.db after a run"""
+        result = checkpoint(self.db_path)
+        if result['busy']:
+            print("[WARN] Readers kept the WAL checkpoint from finishing; "
+                  "SQLite will complete it automatically")
+        else:
+            print(f"[OK] Checkpointed {result['checkpointed_frames']} WAL frame(s)")
 
 
 def parse_year_range(year_range_str):
@@ -381,6 +494,11 @@ def main():
         metavar='START-END',
         help='Process specific year range (e.g., --years 1977-1980)'
     )
+    mode_group.add_argument(
+        '--tracks',
+        action='store_true',
+        help='Store audio file lists for shows without tracks (one request per show)'
+    )
     
     args = parser.parse_args()
     
@@ -388,7 +506,9 @@ def main():
     populator = DatabasePopulator()
     
     # Run appropriate mode
-    if args.test:
+    if args.tracks:
+        populator.populate_tracks()
+    elif args.test:
         populator.populate_database(test_mode=True)
     elif args.full:
         populator.populate_database(start_year=1965, end_year=1995, test_mode=False)
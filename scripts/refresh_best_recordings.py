@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Rescore the stored best recording of each concert date.
+
+By default only dates queued since the last run are rescored: dates with
+new, removed or re-rated recordings or newly stored tracks, and dates
+scored with different weights than the current preferences. populate_
+database.py and update_database.py run this automatically.
+
+Usage:
+    # Incremental refresh of data/shows.db
+    python refresh_best_recordings.py
+
+    # Rescore every date (e.g. after changing the scoring code)
+    python refresh_best_recordings.py --full
+"""
+
+import sys
+import os
+import argparse
+import sqlite3
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.database.schema import DB_PATH
+from src.selection.best_recording import refresh_best_recordings
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Rescore the stored best recording of each concert date'
+    )
+    parser.add_argument('--db', default=DB_PATH,
+                        help='Database to refresh (default: data/shows.db)')
+    parser.add_argument('--full', action='store_true',
+                        help='Rescore every date, not just queued ones')
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("REFRESHING BEST RECORDINGS")
+    print("="*60)
+    print(f"Database: {os.path.abspath(args.db)}")
+    print(f"Mode: {'full' if args.full else 'incremental'}")
+
+    try:
+        result = refresh_best_recordings(db_path=args.db, full=args.full)
+    except sqlite3.Error as e:
+        print(f"\n[ERROR] Refresh failed: {e}")
+        sys.exit(1)
+
+    print(f"Dates scored: {result['scored']}")
+    print(f"Dates removed: {result['removed']}")
+    print(f"Finished in {result['seconds']:.2f}s")
+    print("\n[OK] Best recordings up to date")
+
+
+if __name__ == '__main__':
+    main()
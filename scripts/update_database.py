@@ -29,7 +29,10 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 from src.api.rate_limiter import ArchiveAPIClient
+from src.database.connection import checkpoint, open_update_connection
 from src.database.schema import DB_PATH
+from src.database.venues import apply_known_aliases, resolve_venue
+from src.selection.best_recording import refresh_best_recordings
 
 
 class DatabaseUpdater:
@@ -37,7 +40,7 @@ class DatabaseUpdater:
     
     def __init__(self, db_path=DB_PATH):
         self.db_path = db_path
-        self.api_client = ArchiveAPIClient(requests_per_second=2.0)
+        self.api_client = ArchiveAPIClient()
         
         # Statistics
         self.stats = {
@@ -185,6 +188,9 @@ class DatabaseUpdater:
         """
         Insert a show using idempotent INSERT OR IGNORE
         
+        The venue is resolved to its normalized venues row, so spelling
+        variants of a known venue are stored under its canonical name.
+        
         Args:
             conn: SQLite connection
             show_data: Dictionary of show data
@@ -193,15 +199,21 @@ class DatabaseUpdater:
             True if inserted, False if already exists
         """
         try:
+            venue_id, venue = resolve_venue(
+                conn, show_data['venue'], show_data['city'], show_data['state']
+            )
+            
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR IGNORE INTO shows 
-                (identifier, date, venue, city, state, avg_rating, num_reviews, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                (identifier, date, venue, venue_id, city, state, avg_rating, num_reviews,
+                 last_updated)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 show_data['identifier'],
                 show_data['date'],
-                show_data['venue'],
+                venue,
+                venue_id,
                 show_data['city'],
                 show_data['state'],
                 show_data['avg_rating'],
@@ -275,7 +287,9 @@ class DatabaseUpdater:
         # Insert new shows
         print("\nInserting new shows...")
         
-        conn = sqlite3.connect(self.db_path)
+        # WAL: the running UI keeps reading the previous generation and
+        # picks up the new shows once they are committed together
+        conn = open_update_connection(self.db_path)
         
         try:
             for raw_show in new_shows:
@@ -295,12 +309,21 @@ class DatabaseUpdater:
                     # Already exists
                     self.stats['shows_skipped'] += 1
             
+            # Fold known alternate venue names into their canonical venue
+            apply_known_aliases(conn)
+            
             # Commit all inserts
             conn.commit()
             
         finally:
             conn.close()
         
+        # New recordings may beat a date's stored best recording
+        if self.stats['new_shows_inserted'] > 0:
+            result = refresh_best_recordings(db_path=self.db_path)
+            print(f"[OK] Best recordings rescored for {result['scored']} date(s)")
+            checkpoint(self.db_path)
+        
         # Final statistics
         print("\n" + "="*60)
         print("UPDATE COMPLETE")
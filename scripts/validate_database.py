@@ -13,6 +13,10 @@ Usage:
 
     # Check for duplicates
     python validate_database.py --duplicates
+
+    # Only re-check shows added or changed since the last run,
+    # using 4 worker processes
+    python validate_database.py --incremental --jobs 4
 """
 
 import sys
@@ -31,15 +35,16 @@ from src.database.validation import (
 )
 
 
-def quick_check():
+def quick_check(incremental=False, jobs=1):
     """Run a quick validation check"""
     print("\n" + "="*60)
     print("QUICK DATABASE CHECK")
     print("="*60)
     
-    report = validate_database()
+    report = validate_database(incremental=incremental, jobs=jobs)
     
     print(f"\nTotal shows: {report.total_shows:,}")
+    print(f"Checked this run: {report.stats.get('Shows checked this run', 0):,}")
     print(f"Critical errors: {len(report.errors)}")
     print(f"Warnings: {len(report.warnings)}")
     
@@ -85,9 +90,9 @@ def check_duplicates():
     print("="*60)
 
 
-def full_report():
+def full_report(incremental=False, jobs=1):
     """Generate full data quality report"""
-    generate_quality_report()
+    generate_quality_report(incremental=incremental, jobs=jobs)
 
 
 def main():
@@ -108,15 +113,29 @@ def main():
         help='Check for duplicates only'
     )
     
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only re-check shows added or changed since the last validation'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Worker processes for checking shows (default: 1, 0 = one per CPU)'
+    )
+    
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
     
     if args.quick:
-        quick_check()
+        quick_check(args.incremental, jobs)
     elif args.duplicates:
         check_duplicates()
     else:
         # Full report
-        full_report()
+        full_report(args.incremental, jobs)
 
 
 if __name__ == '__main__':
@@ -4,9 +4,12 @@ Internet Archive API Client
 Simple client for searching the Grateful Dead collection
 """
 
-import requests
 from typing import List, Dict, Optional
 
+from . import transport
+from .cache import get_metadata_cache
+from .rate_limiter import limited
+
 
 class ArchiveClient:
     """Client for Internet Archive Grateful Dead collection"""
@@ -16,14 +19,56 @@ class ArchiveClient:
     BASE_METADATA_URL = "https://archive.org/metadata"
     BASE_DOWNLOAD_URL = "https://archive.org/download"
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: Optional[int] = None, cache=None):
         """
         Initialize the Archive client
         
+        Requests go through the shared keep-alive sessions in transport.py
+        and wait for the process-wide rate limits in rate_limiter.py.
+        
         Args:
-            timeout: Request timeout in seconds (default: 10)
+            timeout: Request timeout in seconds (default: transport config)
+            cache: MetadataCache for get_metadata() (default: shared cache)
         """
         self.timeout = timeout
+        self._cache = cache
+    
+    @property
+    def cache(self):
+        """Metadata cache used by get_metadata()"""
+        return self._cache or get_metadata_cache()
+    
+    def get_metadata(self, identifier: str, use_cache: bool = True) -> Dict:
+        """
+        Get the full metadata document for an item
+        
+        Served from the on-disk metadata cache when a fresh copy exists.
+        
+        Args:
+            identifier: Archive.org identifier
+            use_cache: False to always download (the result is still cached)
+        
+        Returns:
+            Metadata dictionary ('metadata', 'files', ...)
+        
+        Raises:
+            requests.exceptions.RequestException: On network errors
+        """
+        def fetch():
+            with limited('metadata_api'):
+                response = transport.get(
+                    f"{self.BASE_METADATA_URL}/{identifier}",
+                    timeout=self.timeout
+                )
+            response.raise_for_status()
+            return response.json()
+        
+        if not use_cache:
+            metadata = fetch()
+            self.cache.put(identifier, metadata)
+            return metadata
+        
+        return self.cache.get_or_fetch(identifier, fetch)
     
     def search_shows(
         self, 
@@ -60,11 +105,12 @@ class ArchiveClient:
         }
         
         # Make the request
-        response = requests.get(
-            self.BASE_SEARCH_URL,
-            params=params,
-            timeout=self.timeout
-        )
+        with limited('search_api'):
+            response = transport.get(
+                self.BASE_SEARCH_URL,
+                params=params,
+                timeout=self.timeout
+            )
         
         # Raise error for bad status codes
         response.raise_for_status()
@@ -91,11 +137,12 @@ class ArchiveClient:
             'output': 'json'
         }
         
-        response = requests.get(
-            self.BASE_SEARCH_URL,
-            params=params,
-            timeout=self.timeout
-        )
+        with limited('search_api'):
+            response = transport.get(
+                self.BASE_SEARCH_URL,
+                params=params,
+                timeout=self.timeout
+            )
         response.raise_for_status()
         
         data = response.json()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Asynchronous Internet Archive API Client
+
+ArchiveAPIClient fetches one show at a time, so a batch job (filling the
+tracks table, enriching or analysing many shows) takes the sum of every
+request's latency. AsyncArchiveClient has the same surface (search,
+get_metadata, get_files) as coroutines, plus gather_metadata() to fetch
+many shows at once.
+
+How requests are sent:
+- Each request runs ArchiveAPIClient.request() in a small worker pool,
+  so retries, 429 handling, the shared keep-alive sessions and the
+  process-wide rate limits (rate_limiter.py) all still apply; a batch
+  job and the UI share one polite budget
+- gather_metadata() bounds how many requests are outstanding with an
+  asyncio.Semaphore (default: metadata_api max_concurrent), so batch
+  wall-clock time approaches identifiers / requests_per_second instead
+  of the sum of latencies
+- Cached shows are returned without using a worker or a token
+
+requests has no asyncio support and the project avoids extra HTTP
+dependencies on the Pi, so the worker pool stands in for an async
+HTTP library.
+
+Usage:
+    # From synchronous code
+    from src.api.async_client import get_metadata_batch
+
+    results = get_metadata_batch(identifiers)
+
+    # From a coroutine
+    async with AsyncArchiveClient() as client:
+        results = await client.gather_metadata(identifiers)
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .config import get_endpoint_config
+from .rate_limiter import ArchiveAPIClient
+
+
+class AsyncArchiveClient:
+    """asyncio client for the Internet Archive API (see module docstring)"""
+
+    def __init__(self, max_concurrency: Optional[int] = None, max_retries=None,
+                 cache=None):
+        """
+        Initialize the async client
+
+        Args:
+            max_concurrency: Requests in flight at once (default: the
+                             metadata_api max_concurrent setting)
+            max_retries: Retry attempts per request (default: config)
+            cache: MetadataCache for get_metadata() (default: shared cache)
+        """
+        self.max_concurrency = max(1, max_concurrency or
+                                   get_endpoint_config('metadata_api').get('max_concurrent') or 1)
+        self._client = ArchiveAPIClient(max_retries=max_retries, cache=cache)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                            thread_name_prefix='archive-async')
+
+    @property
+    def cache(self):
+        """Metadata cache used by get_metadata()"""
+        return self._client.cache
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking ArchiveAPIClient call on the worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def search(self, query: str, fields: str = 'identifier,title,date,venue',
+                     rows: int = 50) -> Dict[str, Any]:
+        """
+        Search Archive.org (see ArchiveAPIClient.search)
+
+        Args:
+            query: Search query string
+            fields: Fields to return
+            rows: Number of results
+
+        Returns:
+            dict: JSON response
+        """
+        return await self._run(self._client.search, query, fields=fields, rows=rows)
+
+    async def get_metadata(self, identifier: str, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Get metadata for a show (see ArchiveAPIClient.get_metadata)
+
+        Args:
+            identifier: Archive.org identifier
+            use_cache: False to always download (the result is still cached)
+
+        Returns:
+            dict: JSON metadata
+        """
+        if use_cache:
+            cached = self.cache.get(identifier)
+            if cached is not None:
+                return cached
+        # Already a miss: download (and store) without a second lookup
+        return await self._run(self._client.get_metadata, identifier, use_cache=False)
+
+    async def get_files(self, identifier: str) -> List[Dict[str, Any]]:
+        """
+        Get the file list of a show
+
+        Args:
+            identifier: Archive.org identifier
+
+        Returns:
+            list of file dicts from the metadata 'files' section
+        """
+        metadata = await self.get_metadata(identifier)
+        return metadata.get('files', [])
+
+    async def gather_metadata(
+        self, identifiers: Iterable[str], use_cache: bool = True
+    ) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """
+        Fetch metadata for many shows concurrently
+
+        One failed show doesn't stop the batch: its exception is returned
+        in place of the metadata.
+
+        Args:
+            identifiers: Archive.org identifiers (duplicates fetched once)
+            use_cache: False to always download
+
+        Returns:
+            dict mapping identifier to metadata dict or the exception raised
+        """
+        identifiers = list(dict.fromkeys(identifiers))
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(identifier):
+            async with slots:
+                return await self.get_metadata(identifier, use_cache=use_cache)
+
+        results = await asyncio.gather(*(fetch(i) for i in identifiers),
+                                       return_exceptions=True)
+        return dict(zip(identifiers, results))
+
+    async def close(self):
+        """Shut down the worker pool (waits for requests in flight)"""
+        await asyncio.get_running_loop().run_in_executor(
+            None, partial(self._executor.shutdown, wait=True))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+def get_metadata_batch(identifiers: Iterable[str], max_concurrency: Optional[int] = None,
+                       use_cache: bool = True,
+                       cache=None) -> Dict[str, Union[Dict[str, Any], Exception]]:
+    """
+    Synchronous facade: fetch metadata for many shows concurrently
+
+    For scripts and other code without an event loop (asyncio.run() can't
+    be called from inside a running loop; await gather_metadata() there).
+
+    Args:
+        identifiers: Archive.org identifiers
+        max_concurrency: Requests in flight at once (default: config)
+        use_cache: False to always download
+        cache: MetadataCache (default: shared cache)
+
+    Returns:
+        dict mapping identifier to metadata dict or the exception raised
+    """
+    async def run():
+        async with AsyncArchiveClient(max_concurrency=max_concurrency, cache=cache) as client:
+            return await client.gather_metadata(identifiers, use_cache=use_cache)
+
+    return asyncio.run(run())
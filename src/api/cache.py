@@ -0,0 +1,58 @@
+"""
+Shared Archive.org Response Caches
+
+Every API entry point that fetches metadata (get_metadata(),
+ArchiveClient and ArchiveAPIClient) goes through the same on-disk cache,
+configured from the metadata_api section of config/rate_limit_config.yaml
+(cache_ttl_seconds, cache_max_mb).
+
+Usage:
+    from src.api.cache import get_metadata_cache
+
+    print(get_metadata_cache().stats())
+"""
+
+import threading
+from typing import Optional
+
+from src.database.metadata_cache import MetadataCache, METADATA_CACHE_PATH
+from .config import get_endpoint_config
+
+
+_metadata_cache: Optional[MetadataCache] = None
+_lock = threading.Lock()
+
+
+def get_metadata_cache() -> MetadataCache:
+    """
+    Get the process-wide metadata cache, creating it on first use
+
+    Returns:
+        MetadataCache configured from rate_limit_config.yaml
+    """
+    global _metadata_cache
+
+    with _lock:
+        if _metadata_cache is None:
+            config = get_endpoint_config('metadata_api')
+            _metadata_cache = MetadataCache(
+                METADATA_CACHE_PATH,
+                ttl_seconds=config.get('cache_ttl_seconds') or 0,
+                max_bytes=int((config.get('cache_max_mb') or 0) * 1024 * 1024),
+            )
+        return _metadata_cache
+
+
+def set_metadata_cache(cache: Optional[MetadataCache]):
+    """
+    Replace the shared metadata cache (tests, tools using another file)
+
+    Args:
+        cache: New cache, or None to recreate from config on next use
+    """
+    global _metadata_cache
+
+    with _lock:
+        if _metadata_cache is not None and _metadata_cache is not cache:
+            _metadata_cache.close()
+        _metadata_cache = cache
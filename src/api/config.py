@@ -0,0 +1,123 @@
+"""
+Internet Archive API Configuration
+
+Loads config/rate_limit_config.yaml, the single place where request
+rates, bursts, concurrency and cache lifetimes for each Archive.org
+endpoint are declared (enforced process-wide by rate_limiter.py). Missing files or keys fall back to DEFAULT_CONFIG, so the API
+modules work without any config on disk.
+
+Usage:
+    from src.api.config import get_endpoint_config
+
+    ttl = get_endpoint_config('metadata_api')['cache_ttl_seconds']
+"""
+
+import os
+from copy import deepcopy
+from typing import Any, Dict, Optional
+
+import yaml
+
+
+CONFIG_PATH = os.path.join(
+    os.path.dirname(__file__),  # src/api/
+    '..',  # src/
+    '..',  # deadstream/
+    'config',
+    'rate_limit_config.yaml'
+)
+
+# Used for anything the config file doesn't set
+DEFAULT_CONFIG = {
+    'default': {
+        'requests_per_second': 2,
+        'burst': 1,
+        'max_retries': 3,
+        'timeout_seconds': 10,
+        'retry_backoff_base': 2,
+    },
+    'search_api': {
+        'requests_per_second': 2,
+        'burst': 3,
+        'max_concurrent': 1,
+        'cache_ttl_seconds': 300,
+    },
+    'metadata_api': {
+        'requests_per_second': 5,
+        'burst': 10,
+        'max_concurrent': 3,
+        'cache_ttl_seconds': 3600,
+        'cache_max_mb': 64,
+        'memo_seconds': 30,
+    },
+    'streaming': {
+        'requests_per_second': None,
+        'max_concurrent': 1,
+        'chunk_size_kb': 1024,
+    },
+    'transport': {
+        'pool_maxsize': 4,
+        'connect_timeout_seconds': 5,
+        'user_agent': 'DeadStream/1.0 (Grateful Dead Concert Player; Educational Project)',
+    },
+}
+
+_config: Optional[Dict[str, Any]] = None
+
+
+def _merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge override into a copy of base"""
+    merged = deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_api_config(path: str = None, reload: bool = False) -> Dict[str, Any]:
+    """
+    Load the API configuration (cached after the first call)
+
+    Args:
+        path: YAML file to read (default: config/rate_limit_config.yaml)
+        reload: Re-read the file even if already loaded
+
+    Returns:
+        Config dict with DEFAULT_CONFIG filled in for missing keys
+    """
+    global _config
+
+    if _config is not None and not reload and path is None:
+        return _config
+
+    loaded = {}
+    config_path = path or CONFIG_PATH
+    try:
+        with open(config_path, 'r') as f:
+            loaded = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        pass
+    except yaml.YAMLError as e:
+        print(f"[WARN] Could not parse {config_path}: {e}")
+
+    config = _merge(DEFAULT_CONFIG, loaded if isinstance(loaded, dict) else {})
+    if path is None:
+        _config = config
+    return config
+
+
+def get_endpoint_config(endpoint: str) -> Dict[str, Any]:
+    """
+    Get the settings for one endpoint class, over the 'default' section
+
+    Args:
+        endpoint: Section name ('search_api', 'metadata_api', 'streaming',
+                  'transport')
+
+    Returns:
+        dict of settings for that endpoint
+    """
+    config = load_api_config()
+    return _merge(config.get('default', {}), config.get(endpoint) or {})
@@ -19,6 +19,9 @@ import time
 import sys
 from typing import Optional, Dict, Any
 
+from . import transport
+from .rate_limiter import endpoint_for_url, limited
+
 
 class NetworkError(Exception):
     """Raised when network connectivity is unavailable."""
@@ -42,7 +45,7 @@ def check_network(test_url='https://archive.org', timeout=5):
         bool: True if network is available, False otherwise
     """
     try:
-        response = requests.head(test_url, timeout=timeout)
+        response = transport.head(test_url, timeout=timeout)
         return True
     except requests.exceptions.RequestException:
         return False
@@ -76,7 +79,8 @@ def fetch_with_retry(url, params=None, max_retries=3, initial_delay=1,
             if verbose and attempt > 0:
                 print(f"  Retry attempt {attempt + 1}/{max_retries}...")
             
-            response = requests.get(url, params=params, timeout=timeout)
+            with limited(endpoint_for_url(url)):
+                response = transport.get(url, params=params, timeout=timeout)
             
             # Check for HTTP errors
             if response.status_code == 429:
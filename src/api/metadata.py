@@ -4,21 +4,171 @@ Internet Archive Metadata API
 
 This module provides functions for fetching show metadata from Archive.org.
 It wraps the ArchiveClient to provide a simple functional interface.
+
+The UI often asks for the same show several times within seconds (the
+show card loads the setlist, then the player loads the show on Play).
+get_metadata() and get_audio_files() are single-flight: concurrent
+callers for the same show share one lookup and its result or error, and
+results are kept in memory for memo_seconds (metadata_api section of
+config/rate_limit_config.yaml). get_request_stats() reports how many
+duplicate lookups were avoided.
+
+Returned dicts and lists may be shared between callers: treat them as
+read-only.
 """
 
+import sqlite3
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Hashable, List, Optional
 from .archive_client import ArchiveClient
+from .config import get_endpoint_config
+from src.database.tracks import get_tracks, store_tracks, is_audio_file
+
+
+# Most results kept in the single-flight memo at once
+MEMO_MAX_ENTRIES = 256
+
+
+class _Call:
+    """One in-flight lookup that other callers can wait on"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one.
+    
+    The first caller for a key runs fetch(); callers arriving while it
+    runs wait and get the same result (or exception). Successful results
+    are memoized for memo_seconds; errors are not.
+    """
+    
+    def __init__(self, memo_seconds: float = 0):
+        """
+        Args:
+            memo_seconds: How long a result is reused (0 = only coalesce)
+        """
+        self.memo_seconds = memo_seconds or 0
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._memo: Dict[Hashable, tuple] = {}  # key -> (expires, result)
+        self._stats = {'requests': 0, 'fetches': 0, 'coalesced': 0,
+                       'memo_hits': 0, 'errors': 0}
+    
+    def do(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        Get the result for a key, running fetch() only if nobody else is
+        
+        Args:
+            key: Identifies the lookup (e.g. the show identifier)
+            fetch: Called with no arguments by the first caller
+            
+        Returns:
+            fetch()'s result, possibly from another caller's call
+            
+        Raises:
+            Whatever fetch() raised, in every caller that waited on it
+        """
+        with self._lock:
+            self._stats['requests'] += 1
+            memo = self._memo.get(key)
+            if memo is not None and memo[0] > time.monotonic():
+                self._stats['memo_hits'] += 1
+                return memo[1]
+            
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats['fetches'] += 1
+            else:
+                self._stats['coalesced'] += 1
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fetch()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.error is not None:
+                    self._stats['errors'] += 1
+                elif self.memo_seconds > 0:
+                    self._remember(key, call.result)
+            call.done.set()
+        return call.result
+    
+    def _remember(self, key: Hashable, result: Any):
+        """Memoize a result, dropping expired then oldest entries past the cap"""
+        now = time.monotonic()
+        self._memo.pop(key, None)
+        self._memo[key] = (now + self.memo_seconds, result)
+        if len(self._memo) > MEMO_MAX_ENTRIES:
+            for stale in [k for k, (expires, _) in self._memo.items() if expires <= now]:
+                del self._memo[stale]
+            while len(self._memo) > MEMO_MAX_ENTRIES:
+                del self._memo[next(iter(self._memo))]
+    
+    def forget(self, key: Hashable = None):
+        """Drop one memoized result, or all of them if key is None"""
+        with self._lock:
+            if key is None:
+                self._memo.clear()
+            else:
+                self._memo.pop(key, None)
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters since startup
+        
+        Returns:
+            dict with requests, fetches, coalesced, memo_hits, errors and
+            avoided (coalesced + memo_hits: lookups that never ran)
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['avoided'] = stats['coalesced'] + stats['memo_hits']
+        return stats
 
 
 # Create a shared client instance
 _client = ArchiveClient()
 
+# Shared by every caller of get_metadata() / get_audio_files()
+_flight = SingleFlight(get_endpoint_config('metadata_api').get('memo_seconds'))
+
+
+def get_request_stats() -> Dict[str, int]:
+    """
+    Single-flight counters for get_metadata() and get_audio_files()
+    
+    Returns:
+        dict from SingleFlight.stats(); 'avoided' is the number of
+        duplicate lookups that were served by another caller or the memo
+    """
+    return _flight.stats()
+
 
 def get_metadata(identifier: str) -> Dict[str, Any]:
     """
     Get complete metadata for a show from Archive.org.
     
+    Repeat lookups are served from the on-disk metadata cache
+    (see src/api/cache.py) until the configured TTL expires.
+    
     Args:
         identifier: Show identifier (e.g., 'gd77-05-08.sbd.hicks.4982.sbeok.shnf')
         
@@ -32,12 +182,9 @@ def get_metadata(identifier: str) -> Dict[str, Any]:
         for file in metadata['files']:
             print(file['name'])
     """
-    url = f"{_client.BASE_METADATA_URL}/{identifier}"
-    
     try:
-        response = requests.get(url, timeout=_client.timeout)
-        response.raise_for_status()
-        return response.json()
+        return _flight.do(('metadata', identifier),
+                          lambda: _client.get_metadata(identifier))
         
     except requests.exceptions.Timeout:
         raise Exception(f"Timeout fetching metadata for {identifier}")
@@ -98,6 +245,90 @@ def extract_audio_files(metadata: Dict[str, Any],
     return audio_files
 
 
+def metadata_to_tracks(metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Convert Archive.org metadata into rows for the local tracks table.
+    
+    Args:
+        metadata: Full metadata dictionary from get_metadata()
+        
+    Returns:
+        List of track dicts (filename, title, set_name, track_number,
+        duration, format, size, md5) for every audio file
+    """
+    # Imported here: src.audio pulls in the VLC player
+    from src.audio.playlist import PlaylistBuilder
+    
+    rows = []
+    for file_info in metadata.get('files', []):
+        if not is_audio_file(file_info):
+            continue
+        
+        filename = file_info['name']
+        rows.append({
+            'filename': filename,
+            'title': (file_info.get('title') or '').strip(),
+            'set_name': PlaylistBuilder.detect_set(filename),
+            'track_number': file_info.get('track')
+                            or PlaylistBuilder.extract_track_number(filename),
+            'duration': file_info.get('length'),
+            'format': file_info.get('format'),
+            'size': file_info.get('size'),
+            'md5': file_info.get('md5'),
+        })
+    
+    return rows
+
+
+def cache_audio_files(identifier: str, metadata: Dict[str, Any],
+                      format_preference: str = 'MP3') -> list:
+    """
+    Store a show's audio files in the tracks table and return them.
+    
+    Storing is best effort: if the database can't be written (read-only
+    snapshot, not yet migrated) the files still come back from metadata.
+    
+    Args:
+        identifier: Show identifier
+        metadata: Full metadata dictionary from get_metadata()
+        format_preference: Preferred format ('MP3', 'FLAC', 'OGG')
+        
+    Returns:
+        List of audio file dictionaries
+    """
+    try:
+        store_tracks(identifier, metadata_to_tracks(metadata))
+    except sqlite3.Error as e:
+        print(f"[WARN] Could not store tracks for {identifier}: {e}")
+        return extract_audio_files(metadata, format_preference)
+    
+    return get_tracks(identifier, format_preference)
+
+
+def get_audio_files(identifier: str, format_preference: str = 'MP3') -> list:
+    """
+    Get a show's audio files, from the local tracks table when possible.
+    
+    Only the first request for a show goes to Archive.org; its file list
+    is stored so later setlists and playlists need no network round-trip.
+    Concurrent calls for the same show share one lookup.
+    
+    Args:
+        identifier: Show identifier
+        format_preference: Preferred format ('MP3', 'FLAC', 'OGG')
+        
+    Returns:
+        List of audio file dictionaries (same keys as extract_audio_files)
+    """
+    def lookup():
+        files = get_tracks(identifier, format_preference)
+        if files:
+            return files
+        return cache_audio_files(identifier, get_metadata(identifier), format_preference)
+    
+    return _flight.do(('audio_files', identifier, format_preference), lookup)
+
+
 def parse_setlist(files: list) -> Dict[str, list]:
     """
     Parse files into sets (Set I, Set II, Encore).
@@ -0,0 +1,191 @@
+"""
+Background Metadata Prefetcher
+
+Browse lists show hundreds of shows, but nothing was fetched until the
+user tapped one, and then the show card blocked on Archive.org. The
+prefetcher fetches the file lists of the shows the user can see (or is
+about to scroll to) ahead of time, so opening a show from a list is
+usually served from the tracks table and metadata cache.
+
+How it stays out of the way:
+- One worker thread, so at most one metadata request of the endpoint's
+  max_concurrent slots goes to prefetching
+- Low priority: it only sends a request while the shared metadata
+  limiter (rate_limiter.py) still holds reserve tokens, leaving the
+  burst for taps on the UI
+- prefetch() replaces the queue: only the latest visible range is
+  fetched, most important first; cancel() empties it when the user
+  navigates away (a request already sent still completes and is cached)
+- Shows that already have stored tracks are skipped without a request
+
+Usage:
+    from src.api.prefetch import get_prefetcher
+
+    get_prefetcher().prefetch(['gd77-05-08...', 'gd77-05-09...'])
+    get_prefetcher().cancel()
+"""
+
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+
+from src.database.tracks import get_tracks
+from .metadata import get_audio_files
+from .rate_limiter import get_limiter
+
+
+# Fraction of the metadata burst kept free for the user's own requests
+PREFETCH_RESERVE_FRACTION = 0.5
+
+# Seconds between checks while waiting for the rate limiter to refill
+IDLE_POLL_SECONDS = 0.2
+
+# Identifiers remembered as already prefetched
+DONE_MAX_ENTRIES = 2000
+
+
+class MetadataPrefetcher:
+    """Fetches show metadata on a low-priority background thread"""
+
+    def __init__(self, fetch: Optional[Callable[[str], object]] = None,
+                 needs_fetch: Optional[Callable[[str], bool]] = None,
+                 limiter=None, reserve: Optional[float] = None):
+        """
+        Initialize the prefetcher (the worker starts on first use)
+
+        Args:
+            fetch: Called with an identifier to fetch and store it
+                   (default: metadata.get_audio_files)
+            needs_fetch: False for shows already stored locally
+                         (default: no rows in the tracks table)
+            limiter: EndpointLimiter to yield to (default: metadata_api)
+            reserve: Tokens left for the UI before prefetching
+                     (default: PREFETCH_RESERVE_FRACTION of the burst)
+        """
+        self._fetch = fetch or get_audio_files
+        self._needs_fetch = needs_fetch or (lambda identifier: not get_tracks(identifier))
+        self._limiter = limiter or get_limiter('metadata_api')
+        burst = self._limiter.bucket.burst
+        if reserve is None:
+            reserve = burst * PREFETCH_RESERVE_FRACTION
+        self.reserve = max(0, min(reserve, burst - 1))  # A full bucket always allows one
+
+        self._cond = threading.Condition()
+        self._queue: List[str] = []
+        self._done = set()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._stats = {'queued': 0, 'fetched': 0, 'skipped': 0, 'failed': 0,
+                       'cancelled': 0}
+
+    def prefetch(self, identifiers: Iterable[str]):
+        """
+        Replace the pending queue with these shows, fetched in order
+
+        Args:
+            identifiers: Shows to fetch, most important first
+        """
+        with self._cond:
+            queue = [i for i in dict.fromkeys(identifiers) if i and i not in self._done]
+            self._stats['cancelled'] += len([i for i in self._queue if i not in queue])
+            self._stats['queued'] += len([i for i in queue if i not in self._queue])
+            self._queue = queue
+            if queue and self._thread is None and not self._stopped:
+                self._thread = threading.Thread(target=self._run, name='metadata-prefetch',
+                                                daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def cancel(self):
+        """Drop every pending show (the user navigated away)"""
+        self.prefetch([])
+
+    def pending(self) -> List[str]:
+        """Shows still waiting to be fetched, in order"""
+        with self._cond:
+            return list(self._queue)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters since startup
+
+        Returns:
+            dict with queued, fetched, skipped (already stored), failed,
+            cancelled and pending counts
+        """
+        with self._cond:
+            stats = dict(self._stats)
+            stats['pending'] = len(self._queue)
+        return stats
+
+    def shutdown(self, timeout: float = 2.0):
+        """Stop the worker (after the request in progress, if any)"""
+        with self._cond:
+            self._stopped = True
+            self._queue = []
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self):
+        """Worker loop: skip stored shows, wait for a spare token, fetch"""
+        while True:
+            with self._cond:
+                while not self._stopped and not self._queue:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                identifier = self._queue[0]
+
+            # Local database read, outside the lock so prefetch() never waits
+            stored = not self._needs_fetch(identifier)
+
+            with self._cond:
+                if not self._queue or self._queue[0] != identifier:
+                    continue  # Queue replaced meanwhile
+                if stored:
+                    self._queue.pop(0)
+                    self._mark_done(identifier, 'skipped')
+                    continue
+                # Yield to the UI: only spend tokens it isn't likely to need
+                if self._limiter.bucket.available() < self.reserve + 1:
+                    self._cond.wait(IDLE_POLL_SECONDS)
+                    continue
+                self._queue.pop(0)
+
+            try:
+                self._fetch(identifier)
+                outcome = 'fetched'
+            except Exception as e:
+                print(f"[WARN] Prefetch failed for {identifier}: {e}")
+                outcome = 'failed'
+
+            with self._cond:
+                self._mark_done(identifier, outcome)
+
+    def _mark_done(self, identifier: str, outcome: str):
+        """Count an outcome and remember the show (caller holds the lock)"""
+        self._stats[outcome] += 1
+        if outcome != 'failed':
+            if len(self._done) >= DONE_MAX_ENTRIES:
+                self._done.clear()
+            self._done.add(identifier)
+
+
+_prefetcher: Optional[MetadataPrefetcher] = None
+_lock = threading.Lock()
+
+
+def get_prefetcher() -> MetadataPrefetcher:
+    """
+    Get the process-wide prefetcher, creating it on first use
+
+    Returns:
+        MetadataPrefetcher shared by every browse list
+    """
+    global _prefetcher
+
+    with _lock:
+        if _prefetcher is None:
+            _prefetcher = MetadataPrefetcher()
+        return _prefetcher
@@ -2,13 +2,35 @@
 """
 Rate-limited request wrapper for Internet Archive API.
 Implements polite request patterns and automatic retry logic.
+
+Limits are process-wide: every client (the populate scripts, the UI's
+ArchiveClient, helpers.fetch_with_retry) draws from one EndpointLimiter
+per endpoint class, configured in config/rate_limit_config.yaml:
+- requests_per_second / burst: token bucket (bursts keep the UI snappy,
+  the long-run rate stays polite); null means no rate limit
+- max_concurrent: requests in flight at once
+A 429 from any caller pauses the whole endpoint class.
+
+Usage:
+    from src.api.rate_limiter import limited
+
+    with limited('metadata_api'):
+        response = transport.get(url)
 """
 
 import requests
+import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Dict
+from urllib.parse import urlsplit
 import logging
 
+from . import transport
+from .cache import get_metadata_cache
+from .config import get_endpoint_config, load_api_config
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -16,67 +38,264 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Endpoint classes, by Archive.org URL path
+ENDPOINT_PATHS = [
+    ('/advancedsearch.php', 'search_api'),
+    ('/metadata/', 'metadata_api'),
+    ('/download/', 'streaming'),
+]
+
 
 class RateLimiter:
     """
-    Simple rate limiter using token bucket algorithm.
-    Ensures we don't exceed specified requests per second.
+    Thread-safe token bucket.
+    Allows bursts of up to `burst` requests, refilled at requests_per_second.
     """
     
-    def __init__(self, requests_per_second=2):
+    def __init__(self, requests_per_second=2, burst=1):
         """
         Initialize rate limiter.
         
         Args:
-            requests_per_second: Maximum requests per second (default: 2)
+            requests_per_second: Refill rate (default: 2); None = unlimited
+            burst: Bucket size, requests allowed back to back (default: 1)
         """
         self.requests_per_second = requests_per_second
-        self.min_interval = 1.0 / requests_per_second
-        self.last_request_time = 0
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self):
+        """
+        Take a token without blocking.
+        
+        Tokens may go negative; each caller is told how long to wait for
+        its own token, so waiters are served in arrival order.
+        
+        Returns:
+            float: Seconds the caller must wait before sending
+        """
+        if not self.requests_per_second:
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._updated) * self.requests_per_second
+                )
+                self._updated = now
+            self._tokens -= 1
+            # _updated is in the future while paused
+            return (max(self._updated - now, 0.0)
+                    + max(-self._tokens, 0.0) / self.requests_per_second)
+    
+    def available(self):
+        """
+        Tokens in the bucket right now, without taking one.
+        
+        Returns:
+            float: Token count (negative while callers are queued or paused;
+                   infinite if unlimited)
+        """
+        if not self.requests_per_second:
+            return float('inf')
+        
+        with self._lock:
+            elapsed = time.monotonic() - self._updated
+            if elapsed <= 0:
+                return self._tokens
+            return min(self.burst, self._tokens + elapsed * self.requests_per_second)
     
     def wait_if_needed(self):
         """Wait if necessary to respect rate limit."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.min_interval:
-            sleep_time = self.min_interval - time_since_last
+        sleep_time = self.reserve()
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: waiting {sleep_time:.3f}s")
             time.sleep(sleep_time)
+        return sleep_time
+    
+    def pause(self, seconds):
+        """
+        Stop handing out tokens for a while (server asked us to back off).
+        
+        Args:
+            seconds: Pause length; the bucket refills from empty afterwards
+        """
+        with self._lock:
+            self._updated = max(self._updated, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+
+class EndpointLimiter:
+    """
+    Token bucket plus concurrency cap for one endpoint class.
+    """
+    
+    def __init__(self, name, requests_per_second=None, burst=1, max_concurrent=None):
+        """
+        Initialize endpoint limiter.
+        
+        Args:
+            name: Endpoint class ('search_api', 'metadata_api', ...)
+            requests_per_second: Token refill rate; None = unlimited
+            burst: Token bucket size
+            max_concurrent: Requests in flight at once; None = unlimited
+        """
+        self.name = name
+        self.bucket = RateLimiter(requests_per_second, burst)
+        self.max_concurrent = max_concurrent
+        self._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'waited': 0, 'wait_seconds': 0.0, 'pauses': 0}
+    
+    @contextmanager
+    def limit(self):
+        """Hold a concurrency slot and a token for the duration of a request."""
+        if self._slots:
+            self._slots.acquire()
+        try:
+            waited = self.bucket.wait_if_needed()
+            with self._lock:
+                self._stats['requests'] += 1
+                if waited > 0:
+                    self._stats['waited'] += 1
+                    self._stats['wait_seconds'] += waited
+            yield
+        finally:
+            if self._slots:
+                self._slots.release()
+    
+    def pause(self, seconds):
+        """Pause every caller of this endpoint class (e.g. after a 429)."""
+        logger.warning(f"{self.name}: backing off for {seconds}s")
+        self.bucket.pause(seconds)
+        with self._lock:
+            self._stats['pauses'] += 1
+    
+    def stats(self):
+        """
+        Limiter counters.
+        
+        Returns:
+            dict: requests, waited, wait_seconds, pauses
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+_limiters: Dict[str, EndpointLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(endpoint):
+    """
+    Get the process-wide limiter for an endpoint class.
+    
+    Args:
+        endpoint: Config section ('search_api', 'metadata_api', 'streaming',
+                  or 'default' for anything else)
         
-        self.last_request_time = time.time()
+    Returns:
+        EndpointLimiter shared by every caller in the process
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(endpoint)
+        if limiter is None:
+            config = get_endpoint_config(endpoint)
+            limiter = EndpointLimiter(
+                endpoint,
+                requests_per_second=config.get('requests_per_second'),
+                burst=config.get('burst') or 1,
+                max_concurrent=config.get('max_concurrent'),
+            )
+            _limiters[endpoint] = limiter
+        return limiter
+
+
+def endpoint_for_url(url):
+    """
+    Endpoint class of an Archive.org URL.
+    
+    Args:
+        url: Request URL
+        
+    Returns:
+        str: Config section name ('default' if the path isn't recognized)
+    """
+    path = urlsplit(url).path
+    for prefix, endpoint in ENDPOINT_PATHS:
+        if path.startswith(prefix):
+            return endpoint
+    return 'default'
+
+
+@contextmanager
+def limited(endpoint):
+    """
+    Context manager: wait for the endpoint's shared budget, then send.
+    
+    Args:
+        endpoint: Endpoint class (see endpoint_for_url())
+    """
+    with get_limiter(endpoint).limit():
+        yield
+
+
+def get_limiter_stats():
+    """
+    Counters for every limiter created so far.
+    
+    Returns:
+        dict mapping endpoint class to EndpointLimiter.stats()
+    """
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.name: limiter.stats() for limiter in limiters}
+
+
+def reset_limiters():
+    """Drop all limiters so the next request re-reads the config (tests, reload)."""
+    with _limiters_lock:
+        _limiters.clear()
 
 
 class ArchiveAPIClient:
     """
     Internet Archive API client with built-in rate limiting and retry logic.
+    
+    Rate limits are shared with every other client in the process (see
+    get_limiter()); retry and backoff settings come from the config file.
     """
     
-    def __init__(self, requests_per_second=2, max_retries=3):
+    def __init__(self, max_retries=None, cache=None):
         """
         Initialize API client.
         
         Args:
-            requests_per_second: Rate limit (default: 2 req/s)
-            max_retries: Maximum retry attempts (default: 3)
+            max_retries: Maximum retry attempts (default: config max_retries)
+            cache: MetadataCache for get_metadata() (default: shared cache)
         """
-        self.rate_limiter = RateLimiter(requests_per_second)
-        self.max_retries = max_retries
-        self.session = requests.Session()
-        
-        # Set a user-agent to identify our application
-        self.session.headers.update({
-            'User-Agent': 'DeadStream/1.0 (Grateful Dead Concert Player; Educational Project)'
-        })
+        self.max_retries = max_retries or get_endpoint_config('default')['max_retries']
+        self._cache = cache
+        # Shared keep-alive session (sets the DeadStream User-Agent)
+        self.session = transport.get_session('https://archive.org')
     
-    def request(self, url, params=None, timeout=10):
+    @property
+    def cache(self):
+        """Metadata cache used by get_metadata()"""
+        return self._cache or get_metadata_cache()
+    
+    def request(self, url, params=None, timeout=None):
         """
         Make a rate-limited request with retry logic.
         
         Args:
             url: API endpoint URL
             params: Query parameters
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds (default: transport config)
             
         Returns:
             requests.Response object
@@ -85,25 +304,29 @@ class ArchiveAPIClient:
             requests.exceptions.RequestException: If all retries fail
         """
         
+        limiter = get_limiter(endpoint_for_url(url))
+        errors = load_api_config().get('errors', {})
+        max_wait = errors.get('on_rate_limit', {}).get('max_wait_seconds', 60)
+        base_wait = errors.get('on_503', {}).get('base_wait_seconds', 5)
+        
         for attempt in range(self.max_retries):
             try:
-                # Wait to respect rate limit
-                self.rate_limiter.wait_if_needed()
-                
-                # Make the request
-                logger.info(f"Making request to {url} (attempt {attempt + 1}/{self.max_retries})")
-                response = self.session.get(url, params=params, timeout=timeout)
+                # Wait for the shared rate limit and a concurrency slot
+                with limiter.limit():
+                    logger.info(f"Making request to {url} (attempt {attempt + 1}/{self.max_retries})")
+                    response = transport.get(url, params=params, timeout=timeout)
                 
-                # Check for rate limiting
+                # Check for rate limiting (pauses every client of this endpoint)
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
+                    retry_after = min(int(response.headers.get('Retry-After', max_wait)),
+                                      max_wait)
                     logger.warning(f"Rate limited! Waiting {retry_after}s before retry")
-                    time.sleep(retry_after)
+                    limiter.pause(retry_after)
                     continue
                 
                 # Check for service unavailable
                 if response.status_code == 503:
-                    wait_time = 5 * (attempt + 1)  # Exponential backoff
+                    wait_time = min(base_wait * (attempt + 1), max_wait)  # Linear backoff
                     logger.warning(f"Service unavailable. Waiting {wait_time}s before retry")
                     time.sleep(wait_time)
                     continue
@@ -149,16 +372,36 @@ class ArchiveAPIClient:
         response = self.request(url, params=params)
         return response.json()
     
-    def get_metadata(self, identifier):
+    def get_metadata(self, identifier, use_cache=True):
         """
         Get metadata for a specific show with rate limiting.
         
+        Cache hits skip both the request and the rate limiter wait.
+        
         Args:
             identifier: Archive.org identifier
+            use_cache: False to always download (the result is still cached)
             
         Returns:
             dict: JSON metadata
         """
         url = f"https://archive.org/metadata/{identifier}"
-        response = self.request(url)
-        return response.json()
+        
+        if not use_cache:
+            metadata = self.request(url).json()
+            self.cache.put(identifier, metadata)
+            return metadata
+        
+        return self.cache.get_or_fetch(identifier, lambda: self.request(url).json())
+    
+    def get_files(self, identifier):
+        """
+        Get the file list of a show with rate limiting.
+        
+        Args:
+            identifier: Archive.org identifier
+            
+        Returns:
+            list: File dicts from the metadata 'files' section
+        """
+        return self.get_metadata(identifier).get('files', [])
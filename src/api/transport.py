@@ -0,0 +1,174 @@
+"""
+Shared HTTP Transport for the Internet Archive API
+
+Most API calls used to go through a bare requests.get(), which opens a
+new TCP connection (DNS lookup, TCP and TLS handshakes) for every
+request. On the Pi over Wi-Fi that handshake costs more than the
+metadata download itself.
+
+Every module in src/api/ sends its requests through this module instead:
+- One requests.Session per host (scheme + host + port), created on
+  first use and shared by all threads
+- Keep-alive connections pooled per host, so repeat requests reuse an
+  open TLS connection
+- Pool size, timeouts and User-Agent configured in the transport
+  section of config/rate_limit_config.yaml
+- Per-host metrics: requests, new connections and how many requests
+  reused an open connection
+
+Retries and rate limiting stay with the callers (helpers.py,
+rate_limiter.py); this layer only sends requests.
+
+Usage:
+    from src.api import transport
+
+    response = transport.get('https://archive.org/metadata/gd77-05-08...')
+    print(transport.get_transport_stats())
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import get_endpoint_config
+
+
+_sessions: Dict[str, requests.Session] = {}
+_counters: Dict[str, Dict[str, float]] = {}
+_lock = threading.Lock()
+
+
+def _host_key(url: str) -> str:
+    """scheme://host[:port] of a URL (the unit sessions are pooled by)"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def default_timeout() -> tuple:
+    """(connect, read) timeout in seconds from the transport config"""
+    config = get_endpoint_config('transport')
+    return (config['connect_timeout_seconds'], config['timeout_seconds'])
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Get the shared keep-alive session for a URL's host
+
+    Args:
+        url: Any URL on the host (path and query are ignored)
+
+    Returns:
+        requests.Session with a pooled HTTPAdapter for that host
+    """
+    key = _host_key(url)
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            config = get_endpoint_config('transport')
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=config['pool_maxsize'],
+                pool_block=False,
+                max_retries=0,  # Callers retry with their own backoff
+            )
+            session.mount(key + '/', adapter)
+            session.headers['User-Agent'] = config['user_agent']
+            _sessions[key] = session
+            _counters[key] = {'requests': 0, 'errors': 0, 'seconds': 0.0}
+        return session
+
+
+def request(method: str, url: str, timeout: Any = None,
+            **kwargs) -> requests.Response:
+    """
+    Send a request through the host's shared session
+
+    Args:
+        method: HTTP method ('GET', 'HEAD', ...)
+        url: Full URL
+        timeout: Seconds or (connect, read); None = configured timeouts
+        **kwargs: Passed to requests.Session.request (params, stream, ...)
+
+    Returns:
+        requests.Response (status is not checked)
+
+    Raises:
+        requests.exceptions.RequestException: On network errors
+    """
+    session = get_session(url)
+    counters = _counters[_host_key(url)]
+    start = time.perf_counter()
+    try:
+        return session.request(method, url, timeout=timeout or default_timeout(),
+                               **kwargs)
+    except requests.exceptions.RequestException:
+        with _lock:
+            counters['errors'] += 1
+        raise
+    finally:
+        with _lock:
+            counters['requests'] += 1
+            counters['seconds'] += time.perf_counter() - start
+
+
+def get(url: str, params: Optional[Dict] = None, timeout: Any = None,
+        **kwargs) -> requests.Response:
+    """GET through the shared session (see request())"""
+    return request('GET', url, params=params, timeout=timeout, **kwargs)
+
+
+def head(url: str, timeout: Any = None, **kwargs) -> requests.Response:
+    """HEAD through the shared session (see request())"""
+    return request('HEAD', url, timeout=timeout, **kwargs)
+
+
+def get_transport_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Connection reuse metrics per host
+
+    Connection counts come from the urllib3 pools behind each session,
+    so they include every request sent through get_session() directly.
+
+    Returns:
+        dict mapping host to requests, connections_opened, reused,
+        reuse_rate, errors and avg_ms
+    """
+    stats = {}
+    with _lock:
+        for key, session in _sessions.items():
+            opened = sent = 0
+            for adapter in session.adapters.values():
+                if not isinstance(adapter, HTTPAdapter):
+                    continue
+                pools = adapter.poolmanager.pools
+                for pool_key in pools.keys():
+                    pool = pools.get(pool_key)
+                    if pool is not None:
+                        opened += pool.num_connections
+                        sent += pool.num_requests
+            counters = _counters[key]
+            reused = max(sent - opened, 0)
+            stats[key] = {
+                'requests': sent,
+                'connections_opened': opened,
+                'reused': reused,
+                'reuse_rate': reused / sent if sent else 0.0,
+                'errors': int(counters['errors']),
+                'avg_ms': (counters['seconds'] * 1000 / counters['requests']
+                           if counters['requests'] else 0.0),
+            }
+    return stats
+
+
+def close_sessions():
+    """Close every pooled connection (shutdown, tests, config reload)"""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _counters.clear()
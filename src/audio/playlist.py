@@ -292,10 +292,10 @@ class PlaylistBuilder:
             
             # Extract track information
             track_number = file_info.get('track', PlaylistBuilder.extract_track_number(filename))
-            set_name = PlaylistBuilder.detect_set(filename)
+            set_name = file_info.get('set_name') or PlaylistBuilder.detect_set(filename)
             
             # Use title from metadata if available, otherwise clean filename
-            title = file_info.get('title', '').strip()
+            title = (file_info.get('title') or '').strip()
             if not title:
                 title = PlaylistBuilder.clean_title(filename)
             
@@ -335,21 +335,37 @@ class PlaylistBuilder:
         return playlist
     
     @staticmethod
-    def build_from_identifier(identifier: str, api_client) -> Playlist:
+    def build_from_identifier(identifier: str, api_client=None) -> Playlist:
         """
-        Build playlist by fetching metadata from Archive.org.
+        Build playlist from the local tracks table, fetching metadata from
+        Archive.org (and storing its tracks) only if none are stored yet.
         
         Args:
             identifier: Show identifier
-            api_client: ArchiveAPIClient instance (from Phase 2)
+            api_client: Unused, kept for backward compatibility
             
         Returns:
             Playlist object
         """
-        from src.api.metadata import get_metadata
+        from src.api.metadata import get_metadata, cache_audio_files
+        from src.database.queries import get_show_by_identifier
+        from src.database.tracks import get_tracks
         
-        # Fetch metadata
+        files = get_tracks(identifier, format_preference=None)
+        if files:
+            show = get_show_by_identifier(identifier) or {}
+            return PlaylistBuilder.build_from_metadata({
+                'metadata': {
+                    'identifier': identifier,
+                    'date': show.get('date', 'unknown'),
+                    'venue': show.get('venue') or 'Unknown Venue',
+                },
+                'files': files,
+            })
+        
+        # Fetch metadata and keep its tracks for next time
         metadata = get_metadata(identifier)
+        cache_audio_files(identifier, metadata)
         
         # Build playlist
         return PlaylistBuilder.build_from_metadata(metadata)
@@ -3,7 +3,7 @@ Database initialization and connection management for DeadStream.
 
 This module provides functions to:
 - Initialize the database with proper schema
-- Get database connections
+- Get database connections (pooled, see connection.py)
 - Verify database integrity
 
 Usage:
@@ -24,7 +24,9 @@ import sqlite3
 import os
 from pathlib import Path
 
-from .schema import SCHEMA_SQL, get_schema_info
+from .schema import get_schema_info
+from .migrations import migrate, get_user_version, LATEST_VERSION, MigrationError
+from .connection import get_manager, enable_wal
 
 
 # Database file location (relative to project root)
@@ -62,8 +64,10 @@ def init_database(force=False):
     """
     Initialize the database with schema.
     
-    Creates the database file and executes all schema SQL statements.
-    Safe to call multiple times (uses IF NOT EXISTS).
+    Creates the database file if needed and applies any pending schema
+    migrations (see migrations.py). Safe to call multiple times: an
+    up-to-date database is left untouched, and an older one is upgraded
+    in place without re-populating.
     
     Args:
         force (bool): If True, delete existing database and recreate.
@@ -88,7 +92,12 @@ def init_database(force=False):
     # Handle force flag
     if force and os.path.exists(db_path):
         print(f"Force flag set - deleting existing database...")
+        # Pooled connections would keep the old file open
+        get_manager(db_path).close_all()
         os.remove(db_path)
+        for suffix in ('-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
         print(f"Deleted: {db_path}")
         print()
     
@@ -96,7 +105,7 @@ def init_database(force=False):
     db_exists = os.path.exists(db_path)
     if db_exists:
         print(f"Database already exists: {db_path}")
-        print("Schema will be updated (IF NOT EXISTS protects existing data)")
+        print("Pending schema migrations will be applied (existing data is kept)")
     else:
         print(f"Creating new database: {db_path}")
     print()
@@ -109,19 +118,23 @@ def init_database(force=False):
         print("Connected")
         print()
         
-        # Execute schema SQL
-        print("Creating schema...")
-        for i, sql in enumerate(SCHEMA_SQL, 1):
-            # Get statement type for logging
-            statement_type = sql.strip().split()[0:3]
-            statement_desc = ' '.join(statement_type)
-            
-            print(f"  {i}. Executing: {statement_desc}...")
-            cursor.execute(sql)
+        # Apply schema migrations
+        current_version = get_user_version(conn)
+        print(f"Migrating schema (version {current_version} -> {LATEST_VERSION})...")
+        
+        def report_step(migration, seconds):
+            print(f"  {migration.version}. {migration.description}... {seconds:.2f}s")
+        
+        applied = migrate(conn, on_step=report_step)
+        if applied:
+            total = sum(seconds for _, _, seconds in applied)
+            print(f"\nApplied {len(applied)} migration(s) in {total:.2f}s")
+        else:
+            print("  Schema already up to date")
         
-        # Commit changes
-        conn.commit()
-        print(f"\nExecuted {len(SCHEMA_SQL)} SQL statements")
+        # Readers and the update scripts can then work side by side
+        if enable_wal(conn):
+            print("  Journal mode: WAL")
         print()
         
         # Verify schema
@@ -158,6 +171,10 @@ def init_database(force=False):
         
         return True
         
+    except MigrationError as e:
+        print(f"\nERROR: Schema migration failed")
+        print(f"{e}")
+        return False
     except sqlite3.Error as e:
         print(f"\nERROR: Database initialization failed")
         print(f"SQLite error: {e}")
@@ -168,12 +185,45 @@ def init_database(force=False):
         return False
 
 
+def upgrade_database():
+    """
+    Apply pending schema migrations to an existing database.
+    
+    Called at application startup so a device picks up schema changes
+    from a software update without re-running init or re-populating.
+    Does nothing if the database doesn't exist yet or is up to date.
+    
+    Returns:
+        bool: True if the database is usable (up to date or upgraded),
+              False if it doesn't exist or a migration failed
+    """
+    db_path = get_db_path()
+    if not os.path.exists(db_path):
+        return False
+    
+    conn = sqlite3.connect(db_path)
+    try:
+        def report_step(migration, seconds):
+            print(f"[INFO] Schema migration {migration.version} "
+                  f"({migration.description}) applied in {seconds:.2f}s")
+        
+        migrate(conn, on_step=report_step)
+        return True
+    except (MigrationError, sqlite3.Error) as e:
+        print(f"[ERROR] Schema migration failed: {e}")
+        return False
+    finally:
+        conn.close()
+
+
 def get_connection():
     """
     Get a connection to the database.
     
-    Returns a connection object that can be used for queries.
-    Caller is responsible for closing the connection.
+    Returns the calling thread's long-lived connection from the
+    ConnectionManager (see connection.py). PRAGMAs are already applied
+    and rows come back as sqlite3.Row. Calling close() is still fine:
+    it returns the connection to the pool instead of closing it.
     
     Returns:
         sqlite3.Connection: Database connection
@@ -198,12 +248,9 @@ def get_connection():
             f"Run init_database() first to create the database."
         )
     
-    # Connect and return
+    # Borrow the pooled connection
     try:
-        conn = sqlite3.connect(db_path)
-        # Enable foreign keys (good practice for future)
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        return get_manager(db_path).reader()
     except sqlite3.Error as e:
         raise sqlite3.Error(f"Failed to connect to database: {e}")
 
@@ -0,0 +1,281 @@
+"""
+Query Layer Benchmark and Query Plan Checks for DeadStream
+
+Times every public query function in src/database/queries.py against a
+database (usually a synthetic catalogue from synthetic.py) and checks,
+with EXPLAIN QUERY PLAN, that none of the SQL they run reads a large
+table from start to end.
+
+How it works:
+- build_workload() picks realistic arguments from the database itself
+  (a busy date, a popular venue, an existing identifier, ...)
+- Every call runs with the query cache cleared, so the SQL is timed
+  rather than the cache
+- The statements each call executes are captured with a trace callback
+  and re-run under EXPLAIN QUERY PLAN. On FULL_SCAN_TABLES, a "SCAN
+  <table>" step counts as a full scan, and so does walking a whole index
+  ("SCAN <table> USING INDEX ...") unless the statement has a LIMIT
+
+New public functions in queries.py must get a workload entry (or be
+listed in HELPER_FUNCTIONS); missing_workload() reports any that don't.
+
+Usage:
+    from src.database.benchmark import run_benchmark
+
+    results = run_benchmark('/tmp/shows_100k.db', repeat=5)
+    for name, result in results.items():
+        print(name, result['median_ms'], result['full_scans'])
+"""
+
+import inspect
+import re
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import queries
+from .cache import get_query_cache
+from .connection import get_manager
+from .models import Show
+from .snapshot import use_database
+
+
+# Tables that must never be read in full by a query (the summary tables
+# are small by design and may be scanned)
+FULL_SCAN_TABLES = ('shows', 'tracks')
+
+# Public names in queries.py that aren't queries
+HELPER_FUNCTIONS = ('cached_query', 'get_cache_stats', 'row_to_dict', 'build_match_query')
+
+# "SCAN shows" (table scan) or "SCAN shows USING [COVERING] INDEX idx"
+# (walks a whole index; only acceptable when a LIMIT stops it early)
+_FULL_SCAN = re.compile(r'^SCAN (\w+)(?: AS \w+)?( USING (?:COVERING )?INDEX \w+)?$')
+_LIMIT = re.compile(r'\bLIMIT\b', re.IGNORECASE)
+
+# A workload entry: (function name, positional args, keyword args)
+WorkloadEntry = Tuple[str, tuple, dict]
+
+
+def public_query_functions() -> List[str]:
+    """Names of the public query functions defined in queries.py"""
+    return sorted(
+        name for name, obj in vars(queries).items()
+        if inspect.isfunction(obj)
+        and obj.__module__ == queries.__name__
+        and not name.startswith('_')
+        and name not in HELPER_FUNCTIONS
+    )
+
+
+def _sample_arguments(conn) -> Dict[str, Any]:
+    """Pick realistic query arguments from the database"""
+    def one(sql, default, params=()):
+        row = conn.execute(sql, params).fetchone()
+        return row[0] if row and row[0] is not None else default
+
+    date = one("SELECT date FROM shows GROUP BY date ORDER BY COUNT(*) DESC LIMIT 1",
+               '1977-05-08')
+    year = int(date[:4])
+    month = int(date[5:7])
+    venue_id, venue, city = conn.execute(
+        "SELECT id, name, city FROM venues ORDER BY show_count DESC LIMIT 1"
+    ).fetchone() or (1, 'Winterland Arena', 'San Francisco')
+    # Misspelled like a user would: one letter dropped, cut short
+    venue_typo = (venue[:3] + venue[4:])[:12]
+    return {
+        'identifier': one("SELECT identifier FROM shows ORDER BY rowid LIMIT 1 OFFSET 7",
+                          'gd1977-05-08.sbd.hicks.4982'),
+        'date': date,
+        'year': year,
+        'month': month,
+        'day': int(date[8:10]),
+        'venue': venue,
+        'venue_word': venue.split()[0],
+        'venue_typo': venue_typo,
+        'venue_id': venue_id,
+        'city': city or 'San Francisco',
+        'state': one("SELECT state FROM stats_state ORDER BY show_count DESC LIMIT 1", 'CA'),
+        'identifiers': [row[0] for row in conn.execute(
+            "SELECT identifier FROM shows ORDER BY rowid LIMIT 50")],
+        'dates': [row[0] for row in conn.execute(
+            "SELECT DISTINCT date FROM shows WHERE year = ? ORDER BY date LIMIT 50", (year,))],
+        'venues': tuple(row[0] for row in conn.execute(
+            "SELECT name FROM venues ORDER BY show_count DESC LIMIT 20")),
+    }
+
+
+def build_workload(conn) -> List[WorkloadEntry]:
+    """
+    Build one representative call for every public query function
+
+    Args:
+        conn: Connection to the database the workload will run against
+
+    Returns:
+        List of (function name, args, kwargs)
+    """
+    a = _sample_arguments(conn)
+    end_date = f"{a['year']}-12-31"
+    return [
+        ('get_show_by_identifier', (a['identifier'],), {}),
+        ('get_show_by_date', (a['date'],), {}),
+        ('get_best_recording', (a['date'],), {}),
+        ('get_shows_by_identifiers', (a['identifiers'],), {}),
+        ('get_shows_by_dates', (a['dates'],), {}),
+        ('get_random_show', (), {'mode': 'top_rated'}),
+        ('search_by_date_range', (a['date'], end_date), {}),
+        ('search_by_year', (a['year'],), {}),
+        ('search_by_month', (a['year'], a['month']), {}),
+        ('get_shows_by_month', (a['year'], a['month']), {}),
+        ('get_show_dates_for_year', (a['year'],), {}),
+        ('get_on_this_day', (a['month'], a['day']), {}),
+        ('search_by_venue', (a['venue_word'],), {}),
+        ('get_venue', (a['venue_id'],), {}),
+        ('search_by_state', (a['state'],), {}),
+        ('search_by_city', (a['city'],), {}),
+        ('get_top_rated_shows', (), {'limit': 50, 'min_reviews': 5}),
+        ('get_top_rated_by_year', (a['year'],), {'limit': 10}),
+        ('get_show_count', (), {}),
+        ('get_show_count_by_year', (), {}),
+        ('get_show_count_for_year', (a['year'],), {}),
+        ('get_show_count_by_month', (a['year'],), {}),
+        ('get_venue_count', (), {}),
+        ('get_most_played_venues', (), {'limit': 20}),
+        ('get_show_count_by_venue', (None, a['venue_word']), {}),
+        ('get_show_counts_for_venues', (None, a['venues']), {}),
+        ('get_shows_by_state_stats', (), {}),
+        ('get_date_range', (), {}),
+        ('get_years_with_shows', (), {}),
+        ('search_shows', (), {'query': a['venue_word'], 'year': a['year'], 'limit': 50}),
+        ('search_text', (a['city'],), {'limit': 50}),
+        ('fuzzy_search_places', (a['venue_typo'],), {}),
+        ('fuzzy_search_shows', (a['venue_typo'],), {'limit': 50}),
+        ('iter_show_pages', ("shows.year = ?", (a['year'],)), {}),
+        ('iter_shows_by_year', (a['year'],), {}),
+        ('iter_shows_by_venue', (a['venue_word'],), {}),
+        ('iter_shows_by_venue_id', (a['venue_id'],), {}),
+        ('iter_shows_by_date_range', (a['date'], end_date), {}),
+        ('iter_top_rated_shows', (), {}),
+    ]
+
+
+def missing_workload(workload: List[WorkloadEntry]) -> List[str]:
+    """Public query functions that have no workload entry"""
+    covered = {name for name, _, _ in workload}
+    return [name for name in public_query_functions() if name not in covered]
+
+
+def find_full_scans(conn, sql: str) -> List[str]:
+    """
+    Run EXPLAIN QUERY PLAN on a statement and report full table scans
+
+    Args:
+        conn: Connection to the benchmarked database
+        sql: Statement with parameter values inlined
+
+    Returns:
+        List of plan details that read all of one of FULL_SCAN_TABLES
+        (empty if the plan is fine)
+    """
+    has_limit = bool(_LIMIT.search(sql))
+    scans = []
+    for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}"):
+        detail = row[3]
+        match = _FULL_SCAN.match(detail)
+        if not match or match.group(1) not in FULL_SCAN_TABLES:
+            continue
+        if match.group(2) and has_limit:
+            continue  # Ordered index walk cut short by LIMIT
+        scans.append(detail)
+    return scans
+
+
+def _consume(result) -> int:
+    """Materialize a query result, returning its size (rows or pages of rows)"""
+    if result is None:
+        return 0
+    if isinstance(result, Show):
+        return 1
+    if inspect.isgenerator(result) or hasattr(result, '__next__'):
+        return sum(len(page) for page in result)
+    if isinstance(result, (list, tuple, dict)):
+        return len(result)
+    return 1
+
+
+def _run_once(func: Callable, args: tuple, kwargs: dict) -> Tuple[float, int]:
+    """Call func with a cold query cache; returns (seconds, result size)"""
+    get_query_cache().clear()
+    start = time.perf_counter()
+    size = _consume(func(*args, **kwargs))
+    return time.perf_counter() - start, size
+
+
+def _capture_statements(conn, func: Callable, args: tuple, kwargs: dict) -> List[str]:
+    """SELECT statements executed by one call, with parameters inlined"""
+    statements = []
+
+    def trace(sql):
+        text = sql.strip()
+        if text.upper().startswith(('SELECT', 'WITH')) and text not in statements:
+            statements.append(text)
+
+    conn.set_trace_callback(trace)
+    try:
+        _run_once(func, args, kwargs)
+    finally:
+        conn.set_trace_callback(None)
+    return statements
+
+
+def run_benchmark(db_path: str, repeat: int = 5,
+                  workload: Optional[List[WorkloadEntry]] = None) -> Dict[str, Dict]:
+    """
+    Time every workload call and check its query plans
+
+    The query layer is pointed at db_path for the run and back at its
+    previous database afterwards.
+
+    Args:
+        db_path: Database to benchmark
+        repeat: Timed calls per function
+        workload: Calls to run (default: build_workload() on db_path)
+
+    Returns:
+        dict mapping function name to a result dict: args, rows,
+        median_ms, min_ms, max_ms, statements, full_scans
+    """
+    previous_path = queries.DB_PATH
+    use_database(db_path)
+    try:
+        conn = get_manager(db_path).reader()
+        if workload is None:
+            workload = build_workload(conn)
+
+        results = {}
+        for name, args, kwargs in workload:
+            func = getattr(queries, name)
+            # Warm-up: first-use setup (sampler arrays, statement cache)
+            _run_once(func, args, kwargs)
+
+            timings = []
+            size = 0
+            for _ in range(repeat):
+                seconds, size = _run_once(func, args, kwargs)
+                timings.append(seconds * 1000)
+
+            statements = _capture_statements(conn, func, args, kwargs)
+            full_scans = [scan for sql in statements for scan in find_full_scans(conn, sql)]
+
+            results[name] = {
+                'args': repr(args + tuple(kwargs.items()))[:200],
+                'rows': size,
+                'median_ms': round(statistics.median(timings), 3),
+                'min_ms': round(min(timings), 3),
+                'max_ms': round(max(timings), 3),
+                'statements': len(statements),
+                'full_scans': full_scans,
+            }
+        return results
+    finally:
+        use_database(previous_path)
@@ -0,0 +1,158 @@
+"""
+Query Result Cache for DeadStream
+
+The browse screens repeat the same handful of queries over and over
+(top rated shows, years with shows, show counts per year, calendar dates
+for a year). This module keeps recent results in a bounded in-process LRU
+cache keyed on query function and arguments.
+
+Invalidation is automatic:
+- PRAGMA data_version (ConnectionManager.data_version(), read on one
+  watcher connection) changes when another connection (for example the
+  populate or update scripts) commits to the database
+- ConnectionManager.generation changes when this process writes through
+  the pooled writer connection
+Either change drops every cached result for that database.
+
+Usage:
+    from src.database.cache import get_query_cache
+
+    stats = get_query_cache().stats()
+    print(f"Hit rate: {stats['hit_rate']:.0%}")
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+from .connection import get_manager
+
+
+# Maximum number of cached results
+MAX_ENTRIES = 256
+
+# Results with more rows than this are not cached (bounds memory per entry)
+MAX_CACHED_ROWS = 2000
+
+
+def _copy_result(value):
+    """
+    Copy a cached result so callers can't mutate the cached value
+
+    Lists are copied (dicts inside them one level deep); Show records,
+    tuples, ints and strings are immutable and shared as-is.
+    """
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+class QueryCache:
+    """Bounded LRU cache for query results with automatic invalidation"""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES,
+                 max_rows: int = MAX_CACHED_ROWS):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results (LRU eviction)
+            max_rows: Results longer than this are never cached
+        """
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Last (data_version, writer generation) seen per db_path
+        self._versions: Dict[str, tuple] = {}
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _check_valid(self, db_path: str):
+        """Drop all entries if the database changed since the last call"""
+        manager = get_manager(db_path)
+        version = (manager.data_version(), manager.generation)
+
+        with self._lock:
+            if self._versions.get(manager.db_path) != version:
+                if self._entries:
+                    self._entries.clear()
+                    self.invalidations += 1
+                self._versions[manager.db_path] = version
+
+    def call(self, db_path: str, func: Callable, args: tuple, kwargs: dict) -> Any:
+        """
+        Return func(*args, **kwargs), served from the cache when possible.
+
+        Args:
+            db_path: Database the query reads from
+            func: Query function
+            args: Positional arguments (must be hashable)
+            kwargs: Keyword arguments (values must be hashable)
+
+        Returns:
+            Query result (a private copy for list/dict results)
+        """
+        self._check_valid(db_path)
+        key = (db_path, func.__qualname__, args, tuple(sorted(kwargs.items())))
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy_result(self._entries[key])
+            self.misses += 1
+
+        # Run the query outside the lock so other threads aren't blocked
+        result = func(*args, **kwargs)
+
+        if isinstance(result, list) and len(result) > self.max_rows:
+            return result
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return _copy_result(result)
+
+    def clear(self):
+        """Drop every cached result (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache effectiveness counters.
+
+        Returns:
+            dict with hits, misses, hit_rate (0.0-1.0), entries,
+            evictions and invalidations
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+
+# Shared cache for the whole query layer
+_query_cache = QueryCache()
+
+
+def get_query_cache() -> QueryCache:
+    """Get the process-wide QueryCache used by src.database.queries"""
+    return _query_cache
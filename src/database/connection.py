@@ -0,0 +1,394 @@
+"""
+Persistent Connection Manager for DeadStream
+
+Opening a fresh sqlite3 connection for every query means paying the
+connect, schema-parse and page-cache warmup cost on every browse tap.
+On a Pi 4 reading from an SD card that cost dominates most queries.
+
+This module keeps connections open for the life of the process:
+- One long-lived read connection per thread, closed when the thread ends
+- One serialized writer connection guarded by a lock
+- PRAGMA setup applied once, when a connection is opened
+- Prepared statements reused through sqlite3's per-connection statement cache
+- Optional read-only snapshot mode for the shipped database (see snapshot.py)
+- Write-ahead logging on the read-write database, so the populate and
+  update scripts can write while the UI reads: readers keep seeing the
+  last committed generation, never a "database is locked" error, and
+  pick up each commit on their next query
+
+Usage:
+    from src.database.connection import get_manager
+
+    manager = get_manager()
+
+    # Reads (thread-local connection, never closed by callers)
+    cursor = manager.reader().cursor()
+    cursor.execute("SELECT COUNT(*) FROM shows")
+
+    # Writes (serialized, committed on success, rolled back on error)
+    with manager.writer() as conn:
+        conn.execute("UPDATE shows SET taper = ? WHERE identifier = ?", ...)
+
+    # Bulk writes from another process (scripts)
+    conn = open_update_connection(DB_PATH)
+    ...
+    conn.commit()
+    checkpoint(DB_PATH)
+"""
+
+import os
+import sqlite3
+import threading
+import weakref
+from urllib.parse import quote
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from .schema import DB_PATH
+
+
+# Number of compiled statements kept per connection.
+# The query layer uses a few dozen distinct SQL strings; this leaves headroom
+# for the dynamically built search_shows() variants.
+STATEMENT_CACHE_SIZE = 256
+
+# How long a statement waits for another connection's lock before
+# failing with "database is locked". In WAL mode only writers wait on
+# each other; this covers a script commit racing a UI write.
+BUSY_TIMEOUT_MS = 5000
+
+# PRAGMAs applied once when a connection is opened
+# cache_size is negative -> size in KiB (8 MB page cache per connection)
+CONNECTION_PRAGMAS = [
+    f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA cache_size = -8000",
+    "PRAGMA temp_store = MEMORY",
+]
+
+# Extra PRAGMAs for read-write connections (after WAL is enabled)
+# synchronous = NORMAL is durable against crashes in WAL mode and skips
+# an fsync per commit, which matters on an SD card.
+WRITE_PRAGMAS = [
+    "PRAGMA synchronous = NORMAL",
+]
+
+# Extra PRAGMAs for read-only snapshot connections
+# Pages are read through a memory map straight from the OS page cache, so
+# SQLite's own page cache only needs to hold a small working set.
+SNAPSHOT_MMAP_SIZE = 256 * 1024 * 1024
+SNAPSHOT_PRAGMAS = [
+    f"PRAGMA mmap_size = {SNAPSHOT_MMAP_SIZE}",
+    "PRAGMA cache_size = -2000",
+    "PRAGMA query_only = ON",
+]
+
+
+def enable_wal(conn) -> bool:
+    """
+    Switch a database to write-ahead logging (persists in the file).
+
+    With the default rollback journal a writer needs every reader out of
+    the file to commit, and readers fail while it commits. In WAL mode
+    readers and one writer run side by side.
+
+    Args:
+        conn: sqlite3.Connection to the database (no open transaction)
+
+    Returns:
+        bool: True if the database is in WAL mode
+    """
+    try:
+        mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+    except sqlite3.OperationalError:
+        # Another process is mid-switch; the file stays in its current mode
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    return mode.lower() == 'wal'
+
+
+def open_update_connection(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """
+    Open a standalone connection for bulk writes (populate/update scripts)
+
+    Uses the same PRAGMAs as pooled connections and enables WAL, so a
+    long import commits batch by batch while the UI keeps reading.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        sqlite3.Connection (the caller commits and closes it)
+    """
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    enable_wal(conn)
+    for pragma in WRITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def checkpoint(db_path: str = DB_PATH, mode: str = 'TRUNCATE') -> Dict[str, int]:
+    """
+    Copy the write-ahead log back into the database file
+
+    SQLite checkpoints automatically every 1000 pages, but a big import
+    leaves a large -wal file behind and a reader that stays open can hold
+    frames back. Call this once a script has finished writing.
+
+    Args:
+        db_path: Path to the SQLite database file
+        mode: PASSIVE (never waits), FULL, RESTART or TRUNCATE (waits
+              for readers up to BUSY_TIMEOUT_MS, then empties the log)
+
+    Returns:
+        dict with busy (1 if readers kept it from finishing), log_frames
+        and checkpointed_frames (-1 when not in WAL mode)
+    """
+    if mode.upper() not in ('PASSIVE', 'FULL', 'RESTART', 'TRUNCATE'):
+        raise ValueError(f"Invalid checkpoint mode: {mode}")
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000)
+    try:
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        busy, log_frames, checkpointed = conn.execute(
+            f"PRAGMA wal_checkpoint({mode.upper()})"
+        ).fetchone()
+    finally:
+        conn.close()
+    return {'busy': busy, 'log_frames': log_frames, 'checkpointed_frames': checkpointed}
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    sqlite3.Connection owned by a ConnectionManager.
+
+    close() returns the connection to the manager instead of closing it,
+    so existing code written as "connect, query, close" keeps working
+    without tearing down the shared connection. Any open transaction is
+    rolled back so the next user starts clean.
+    """
+
+    def close(self):
+        """Return connection to the pool (rolls back any open transaction)"""
+        if self.in_transaction:
+            self.rollback()
+
+    def shutdown(self):
+        """Really close the underlying sqlite3 connection"""
+        super().close()
+
+
+class _ReaderHolder:
+    """
+    Thread-local slot for a reader connection.
+
+    Python drops a thread's threading.local values when the thread ends;
+    a finalizer on this holder then closes the connection, so worker
+    threads that come and go (Qt pool, prefetch, validation) don't leave
+    SQLite handles behind.
+    """
+
+    __slots__ = ('conn', '__weakref__')
+
+    def __init__(self, conn):
+        self.conn = conn
+
+
+class ConnectionManager:
+    """Owns the long-lived connections for a single database file"""
+
+    def __init__(self, db_path: str = DB_PATH, read_only: bool = False):
+        """
+        Initialize the manager.
+
+        No connection is opened until the first reader() or writer() call.
+
+        Args:
+            db_path: Path to the SQLite database file
+            read_only: Open as an immutable snapshot (file:...?immutable=1).
+                       SQLite then skips all locking and change detection,
+                       so the file must not be modified while open.
+        """
+        self.db_path = os.path.abspath(db_path)
+        self.read_only = read_only
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._writer = None
+        self._connections: List[PooledConnection] = []
+        # Incremented after every committed write (used by the query cache)
+        self.generation = 0
+        # Reentrant: a reader finalizer can run (via GC) while it is held
+        self._registry_lock = threading.RLock()
+        # Connection that only polls PRAGMA data_version (see data_version())
+        self._watch = None
+        self._watch_lock = threading.Lock()
+
+    def _open(self) -> PooledConnection:
+        """Open a new connection with PRAGMAs applied"""
+        # check_same_thread=False lets close_all() shut down connections
+        # owned by other threads; each reader is still only used by its owner.
+        if self.read_only:
+            target = f"file:{quote(self.db_path)}?immutable=1"
+            pragmas = CONNECTION_PRAGMAS + SNAPSHOT_PRAGMAS
+        else:
+            target = self.db_path
+            pragmas = CONNECTION_PRAGMAS + WRITE_PRAGMAS
+
+        conn = sqlite3.connect(
+            target,
+            factory=PooledConnection,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            check_same_thread=False,
+            uri=self.read_only,
+        )
+        conn.row_factory = sqlite3.Row
+
+        if not self.read_only:
+            conn.execute(CONNECTION_PRAGMAS[0])  # busy_timeout first
+            enable_wal(conn)
+        for pragma in pragmas:
+            conn.execute(pragma)
+
+        with self._registry_lock:
+            self._connections.append(conn)
+        return conn
+
+    def reader(self) -> PooledConnection:
+        """
+        Get the read connection for the calling thread.
+
+        The connection is created on first use and reused afterwards.
+
+        Returns:
+            PooledConnection with row_factory set to sqlite3.Row
+        """
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            conn = self._open()
+            holder = _ReaderHolder(conn)
+            weakref.finalize(holder, self._release, conn)
+            self._local.holder = holder
+        return holder.conn
+
+    def _release(self, conn: PooledConnection):
+        """Close a reader whose thread has ended and forget it"""
+        with self._registry_lock:
+            try:
+                self._connections.remove(conn)
+            except ValueError:
+                return  # Already closed by close_all()
+        try:
+            conn.shutdown()
+        except sqlite3.Error:
+            pass
+
+    def open_connection_count(self) -> int:
+        """Number of open connections (readers, writer and watcher)"""
+        with self._registry_lock:
+            return len(self._connections)
+
+    def data_version(self) -> int:
+        """
+        Change counter for commits made by any other connection.
+
+        PRAGMA data_version is only comparable on one connection, so it is
+        always read from the same long-lived watcher connection. Readers
+        come and go with their threads, but a value returned here can be
+        compared with any earlier one (until close_all()).
+
+        Returns:
+            int: Changes whenever another connection or process commits
+        """
+        with self._watch_lock:
+            if self._watch is None:
+                self._watch = self._open()
+            return self._watch.execute("PRAGMA data_version").fetchone()[0]
+
+    @contextmanager
+    def writer(self):
+        """
+        Serialized access to the writer connection.
+
+        Only one thread can hold the writer at a time. The transaction is
+        committed when the block exits normally and rolled back on error.
+
+        Yields:
+            PooledConnection for INSERT/UPDATE/DELETE statements
+
+        Raises:
+            sqlite3.OperationalError: If the manager is in snapshot mode
+        """
+        if self.read_only:
+            raise sqlite3.OperationalError(
+                f"Database snapshot is read-only: {self.db_path}"
+            )
+
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._open()
+            try:
+                yield self._writer
+                self._writer.commit()
+                self.generation += 1
+            except Exception:
+                self._writer.rollback()
+                raise
+
+    def close_all(self):
+        """
+        Close every connection owned by this manager.
+
+        Needed before the database file is deleted or replaced.
+        Connections are reopened lazily on next use.
+        """
+        with self._write_lock, self._registry_lock:
+            for conn in self._connections:
+                try:
+                    conn.shutdown()
+                except sqlite3.Error:
+                    pass
+            self._connections = []
+            self._writer = None
+            with self._watch_lock:
+                self._watch = None
+            # Threads holding a stale reference reopen on next reader() call
+            self._local = threading.local()
+
+
+# One manager per database file, shared across the process
+_managers: Dict[str, ConnectionManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_manager(db_path: str = DB_PATH,
+                read_only: Optional[bool] = None) -> ConnectionManager:
+    """
+    Get the shared ConnectionManager for a database file.
+
+    Args:
+        db_path: Path to the SQLite database file
+        read_only: True/False to (re)open the file in that mode; None keeps
+                   the existing manager's mode (read-write for a new one)
+
+    Returns:
+        ConnectionManager (created on first request for that path)
+    """
+    key = os.path.abspath(db_path)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is not None and read_only is not None \
+                and manager.read_only != read_only:
+            manager.close_all()
+            manager = None
+        if manager is None:
+            manager = ConnectionManager(key, read_only=bool(read_only))
+            _managers[key] = manager
+        return manager
+
+
+def close_all_connections():
+    """Close every managed connection for every database file"""
+    with _managers_lock:
+        managers = list(_managers.values())
+    for manager in managers:
+        manager.close_all()
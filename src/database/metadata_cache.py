@@ -0,0 +1,303 @@
+"""
+Persistent Metadata Cache for DeadStream
+
+Archive.org metadata documents are large (the files list alone is often
+hundreds of KB) and were downloaded again every time a show was viewed
+or played. This cache keeps them on disk between runs:
+- One row per identifier in its own SQLite file (data/metadata_cache.db),
+  separate from shows.db so it works alongside read-only snapshots
+- JSON is stored zlib-compressed; metadata compresses roughly 10:1
+- Entries older than the TTL are treated as misses and dropped
+- When the stored size passes the cap, least recently used entries are
+  evicted
+- Hits, misses, expirations and evictions are counted for stats()
+
+Cache failures never break a lookup: errors are reported and the caller
+falls back to fetching from the network.
+
+Usage:
+    from src.database.metadata_cache import MetadataCache
+
+    cache = MetadataCache(ttl_seconds=3600, max_bytes=64 * 1024 * 1024)
+    metadata = cache.get_or_fetch(identifier, lambda: fetch(identifier))
+    print(cache.stats()['hit_rate'])
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Optional
+
+
+METADATA_CACHE_PATH = os.path.join(
+    os.path.dirname(__file__),  # src/database/
+    '..',  # src/
+    '..',  # deadstream/
+    'data',
+    'metadata_cache.db'
+)
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# zlib level: 6 is within a few percent of 9 at a fraction of the CPU on the Pi
+COMPRESSION_LEVEL = 6
+
+CREATE_METADATA_CACHE_TABLE = """
+CREATE TABLE IF NOT EXISTS metadata_cache (
+    identifier TEXT PRIMARY KEY,
+    data BLOB NOT NULL,              -- zlib-compressed JSON
+    raw_size INTEGER NOT NULL,       -- Uncompressed JSON bytes
+    stored_size INTEGER NOT NULL,    -- Compressed bytes (counted against the cap)
+    fetched_at REAL NOT NULL,        -- Unix time the document was downloaded
+    accessed_at REAL NOT NULL        -- Unix time of the last hit (LRU order)
+)
+"""
+
+CREATE_ACCESSED_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_metadata_cache_accessed
+ON metadata_cache(accessed_at)
+"""
+
+
+class MetadataCache:
+    """
+    Compressed, size-capped, TTL-expiring store of metadata documents.
+
+    Thread-safe: one connection shared behind a lock, so UI and worker
+    threads can use the same instance.
+    """
+
+    def __init__(self, path: str = METADATA_CACHE_PATH,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache (the file is opened on first use)
+
+        Args:
+            path: SQLite file for the cache
+            ttl_seconds: Entry lifetime; 0 or less disables caching
+            max_bytes: Cap on total compressed size
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._conn = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """False when the TTL disables caching"""
+        return self.ttl_seconds is not None and self.ttl_seconds > 0
+
+    def _connection(self):
+        """Open (and create) the cache database on first use"""
+        if self._conn is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False,
+                                   isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(CREATE_METADATA_CACHE_TABLE)
+            conn.execute(CREATE_ACCESSED_INDEX)
+            self._conn = conn
+        return self._conn
+
+    def get(self, identifier: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached metadata document
+
+        Args:
+            identifier: Show identifier
+
+        Returns:
+            Decoded metadata dict, or None on a miss or expired entry
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT data, fetched_at FROM metadata_cache WHERE identifier = ?",
+                    (identifier,)
+                ).fetchone()
+
+                if row is None:
+                    self.misses += 1
+                    return None
+
+                data, fetched_at = row
+                if now - fetched_at > self.ttl_seconds:
+                    conn.execute("DELETE FROM metadata_cache WHERE identifier = ?",
+                                 (identifier,))
+                    self.expired += 1
+                    self.misses += 1
+                    return None
+
+                conn.execute(
+                    "UPDATE metadata_cache SET accessed_at = ? WHERE identifier = ?",
+                    (now, identifier)
+                )
+            except sqlite3.Error as e:
+                print(f"[WARN] Metadata cache read failed for {identifier}: {e}")
+                self.misses += 1
+                return None
+
+            try:
+                metadata = json.loads(zlib.decompress(data))
+            except (zlib.error, ValueError):
+                # Corrupt entry: drop it and refetch
+                conn.execute("DELETE FROM metadata_cache WHERE identifier = ?",
+                             (identifier,))
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return metadata
+
+    def put(self, identifier: str, metadata: Dict[str, Any]):
+        """
+        Store a metadata document, evicting old entries past the size cap
+
+        Args:
+            identifier: Show identifier
+            metadata: Decoded metadata dict (must be JSON-serializable)
+        """
+        if not self.enabled:
+            return
+
+        raw = json.dumps(metadata, separators=(',', ':')).encode('utf-8')
+        data = zlib.compress(raw, COMPRESSION_LEVEL)
+        if len(data) > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute("""
+                    INSERT OR REPLACE INTO metadata_cache
+                    (identifier, data, raw_size, stored_size, fetched_at, accessed_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (identifier, data, len(raw), len(data), now, now))
+                self._evict(conn)
+            except sqlite3.Error as e:
+                print(f"[WARN] Metadata cache write failed for {identifier}: {e}")
+
+    def _evict(self, conn):
+        """Delete least recently used entries until under max_bytes"""
+        total = conn.execute(
+            "SELECT COALESCE(SUM(stored_size), 0) FROM metadata_cache"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        victims = []
+        for identifier, size in conn.execute(
+            "SELECT identifier, stored_size FROM metadata_cache ORDER BY accessed_at"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((identifier,))
+            total -= size
+
+        conn.executemany("DELETE FROM metadata_cache WHERE identifier = ?", victims)
+        self.evictions += len(victims)
+
+    def get_or_fetch(self, identifier: str,
+                     fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Get a document from the cache, calling fetch() and storing on a miss
+
+        Args:
+            identifier: Show identifier
+            fetch: Called with no arguments to download the document
+
+        Returns:
+            Metadata dict
+        """
+        metadata = self.get(identifier)
+        if metadata is None:
+            metadata = fetch()
+            self.put(identifier, metadata)
+        return metadata
+
+    def invalidate(self, identifier: str):
+        """Drop one entry (e.g. after the show was updated upstream)"""
+        with self._lock:
+            try:
+                self._connection().execute(
+                    "DELETE FROM metadata_cache WHERE identifier = ?", (identifier,)
+                )
+            except sqlite3.Error as e:
+                print(f"[WARN] Metadata cache invalidate failed for {identifier}: {e}")
+
+    def purge_expired(self) -> int:
+        """
+        Delete every expired entry
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            cursor = self._connection().execute(
+                "DELETE FROM metadata_cache WHERE fetched_at < ?",
+                (time.time() - self.ttl_seconds,)
+            )
+            self.expired += cursor.rowcount
+            return cursor.rowcount
+
+    def clear(self):
+        """Delete every entry and reset the counters"""
+        with self._lock:
+            self._connection().execute("DELETE FROM metadata_cache")
+            self.hits = self.misses = self.expired = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            dict with entries, raw_bytes, stored_bytes, hits, misses,
+            expired, evictions and hit_rate (0.0-1.0, counts since start)
+        """
+        with self._lock:
+            try:
+                entries, raw_bytes, stored_bytes = self._connection().execute("""
+                    SELECT COUNT(*), COALESCE(SUM(raw_size), 0),
+                           COALESCE(SUM(stored_size), 0)
+                    FROM metadata_cache
+                """).fetchone()
+            except sqlite3.Error:
+                entries = raw_bytes = stored_bytes = 0
+
+            lookups = self.hits + self.misses
+            return {
+                'entries': entries,
+                'raw_bytes': raw_bytes,
+                'stored_bytes': stored_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def close(self):
+        """Close the cache database"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
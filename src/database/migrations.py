@@ -0,0 +1,264 @@
+"""
+Schema Migrations for DeadStream
+
+init_database used to re-run every CREATE ... IF NOT EXISTS statement,
+which can't add columns, can't tell which upgrades a device already has,
+and rebuilt the search index and statistics on every run.
+
+This module applies ordered migration steps instead:
+- The applied version is stored in PRAGMA user_version (0 = never migrated)
+- Each step runs in its own transaction together with the version bump,
+  so an interrupted upgrade leaves the database at the previous version
+- Steps are idempotent, so a database created before migrations existed
+  (user_version 0, any older schema) is brought up to date safely
+- Each step is timed so slow upgrades on the Pi are visible
+
+New indexes and tables are added in place; the shows table is only
+rebuilt when a step genuinely can't be done with CREATE/ALTER (STORED
+generated columns).
+
+Adding a migration: write a function taking a connection, append a
+Migration with the next version number. Never edit a released step.
+
+Usage:
+    from src.database.migrations import migrate
+
+    conn = sqlite3.connect(DB_PATH)
+    for version, description, seconds in migrate(conn):
+        print(f"{version}: {description} ({seconds:.2f}s)")
+"""
+
+import sqlite3
+import time
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from . import schema
+from .venues import apply_known_aliases
+
+
+class MigrationError(Exception):
+    """A migration step failed or the database is newer than this build"""
+    pass
+
+
+class Migration(NamedTuple):
+    """One ordered schema upgrade step"""
+    version: int            # Value stored in PRAGMA user_version once applied
+    schema_version: str     # Human-readable schema version ('X.Y')
+    description: str
+    apply: Callable[[sqlite3.Connection], None]
+
+
+def _execute_all(conn, statements):
+    """Execute a list of SQL statements on conn"""
+    for sql in statements:
+        conn.execute(sql)
+
+
+def _create_shows_table(conn):
+    """Base shows table; older tables gain the year/month/day columns"""
+    conn.execute(schema.CREATE_SHOWS_TABLE)
+    schema.add_date_part_columns(conn)
+
+
+def _create_browse_indexes(conn):
+    """Indexes for date, venue, rating and year/month/day lookups"""
+    _execute_all(conn, [
+        schema.CREATE_DATE_INDEX,
+        schema.CREATE_VENUE_INDEX,
+        schema.CREATE_RATING_INDEX,
+        schema.CREATE_YEAR_INDEX,
+        schema.CREATE_YEAR_RATING_INDEX,
+        schema.CREATE_MONTH_DAY_INDEX,
+        schema.CREATE_STATE_INDEX,
+        schema.CREATE_DATE_RATING_INDEX,
+    ])
+
+
+def _create_search_index(conn):
+    """FTS5 index over venue/city/state, filled from existing rows"""
+    _execute_all(conn, [
+        schema.CREATE_SEARCH_TABLE,
+        schema.CREATE_SEARCH_INSERT_TRIGGER,
+        schema.CREATE_SEARCH_DELETE_TRIGGER,
+        schema.CREATE_SEARCH_UPDATE_TRIGGER,
+        schema.REBUILD_SEARCH_INDEX,
+    ])
+
+
+def _create_stats_tables(conn):
+    """Materialized per-year/month/venue/state counts"""
+    _execute_all(conn, [
+        schema.CREATE_STATS_YEAR_TABLE,
+        schema.CREATE_STATS_MONTH_TABLE,
+        schema.CREATE_STATS_VENUE_TABLE,
+        schema.CREATE_STATS_STATE_TABLE,
+        schema.CREATE_STATS_VENUE_COUNT_INDEX,
+        schema.CREATE_STATS_INSERT_TRIGGER,
+        schema.CREATE_STATS_DELETE_TRIGGER,
+        schema.CREATE_STATS_UPDATE_TRIGGER,
+    ] + schema.REBUILD_STATS_SQL)
+
+
+def _create_tracks_table(conn):
+    """Per-show audio file list, filled lazily"""
+    _execute_all(conn, [
+        schema.CREATE_TRACKS_TABLE,
+        schema.CREATE_TRACKS_DELETE_TRIGGER,
+    ])
+
+
+def _create_best_recording_table(conn):
+    """Stored best recording per date, with every existing date queued"""
+    _execute_all(conn, [
+        schema.CREATE_BEST_RECORDING_TABLE,
+        schema.CREATE_BEST_RECORDING_PENDING_TABLE,
+        schema.CREATE_BEST_RECORDING_INSERT_TRIGGER,
+        schema.CREATE_BEST_RECORDING_DELETE_TRIGGER,
+        schema.CREATE_BEST_RECORDING_UPDATE_TRIGGER,
+        schema.CREATE_BEST_RECORDING_TRACKS_TRIGGER,
+        schema.QUEUE_ALL_BEST_RECORDINGS,
+    ])
+
+
+def _create_place_search_index(conn):
+    """Trigram index over venue and city/state names, filled from existing rows"""
+    _execute_all(conn, [
+        schema.CREATE_CITY_STATE_INDEX,
+        schema.CREATE_SEARCH_PLACES_TABLE,
+        schema.CREATE_SEARCH_TRIGRAMS_TABLE,
+        schema.CREATE_TRIGRAM_POSITIONS_TABLE,
+        schema.FILL_TRIGRAM_POSITIONS,
+        schema.CREATE_SEARCH_PLACES_INSERT_TRIGGER,
+        schema.CREATE_SEARCH_PLACES_DELETE_TRIGGER,
+        schema.CREATE_PLACES_INSERT_TRIGGER,
+        schema.CREATE_PLACES_DELETE_TRIGGER,
+        schema.CREATE_PLACES_UPDATE_TRIGGER,
+    ] + schema.REBUILD_SEARCH_PLACES_SQL)
+
+
+def _create_venues_table(conn):
+    """Normalized venues, linked from every existing show"""
+    _execute_all(conn, [
+        schema.CREATE_VENUES_TABLE,
+        schema.CREATE_VENUE_ALIASES_TABLE,
+        schema.CREATE_VENUES_NAME_INDEX,
+        schema.CREATE_VENUES_COUNT_INDEX,
+    ])
+    schema.add_venue_id_column(conn)
+    # Backfill before the triggers exist, then count in one pass
+    _execute_all(conn, schema.BACKFILL_VENUES_SQL + [
+        schema.CREATE_VENUE_ID_INDEX,
+        schema.DROP_VENUE_TEXT_INDEX,
+        """
+        UPDATE venues SET show_count =
+            (SELECT COUNT(*) FROM shows WHERE shows.venue_id = venues.id)
+        """,
+        schema.CREATE_VENUES_RESOLVE_INSERT_TRIGGER,
+        schema.CREATE_VENUES_RESOLVE_UPDATE_TRIGGER,
+        schema.CREATE_VENUES_COUNT_INSERT_TRIGGER,
+        schema.CREATE_VENUES_COUNT_UPDATE_TRIGGER,
+        schema.CREATE_VENUES_COUNT_DELETE_TRIGGER,
+    ])
+    apply_known_aliases(conn)
+
+
+def _create_validation_state_table(conn):
+    """Per-show validation outcomes for incremental validation runs"""
+    _execute_all(conn, [
+        schema.CREATE_VALIDATION_STATE_TABLE,
+        schema.CREATE_VALIDATION_STATE_DELETE_TRIGGER,
+    ])
+
+
+# Ordered list of every migration. Versions must be consecutive from 1.
+MIGRATIONS = [
+    Migration(1, "1.0", "Create shows table", _create_shows_table),
+    Migration(2, "1.1", "Create browse indexes", _create_browse_indexes),
+    Migration(3, "1.2", "Create full-text search index", _create_search_index),
+    Migration(4, "1.3", "Create statistics tables", _create_stats_tables),
+    Migration(5, "1.4", "Create tracks table", _create_tracks_table),
+    Migration(6, "1.5", "Create best recording table", _create_best_recording_table),
+    Migration(7, "1.6", "Create fuzzy place search index", _create_place_search_index),
+    Migration(8, "1.7", "Create venues table", _create_venues_table),
+    Migration(9, "1.8", "Create validation state table", _create_validation_state_table),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def get_user_version(conn) -> int:
+    """Get the migration version recorded in the database (0 = none)"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def pending_migrations(conn) -> List[Migration]:
+    """
+    Get the migrations not yet applied to a database
+
+    Raises:
+        MigrationError: If the database was migrated by a newer build
+    """
+    current = get_user_version(conn)
+    if current > LATEST_VERSION:
+        raise MigrationError(
+            f"Database schema version {current} is newer than this build "
+            f"supports ({LATEST_VERSION})"
+        )
+    return [m for m in MIGRATIONS if m.version > current]
+
+
+def migrate(conn, target: Optional[int] = None,
+            on_step: Optional[Callable[[Migration, float], None]] = None
+            ) -> List[Tuple[int, str, float]]:
+    """
+    Apply pending migrations in order.
+
+    Each step and its user_version bump commit together; a failing step
+    is rolled back and stops the run, leaving earlier steps applied.
+
+    Args:
+        conn: sqlite3.Connection (no transaction may be open)
+        target: Stop after this version (None = latest)
+        on_step: Called as on_step(migration, seconds) after each step
+
+    Returns:
+        List of (version, description, seconds) for the steps applied
+
+    Raises:
+        MigrationError: If a step fails or the database is too new
+    """
+    if conn.in_transaction:
+        conn.commit()
+
+    # Manage transactions explicitly so DDL runs inside them
+    saved_isolation = conn.isolation_level
+    conn.isolation_level = None
+    applied = []
+
+    try:
+        for migration in pending_migrations(conn):
+            if target is not None and migration.version > target:
+                break
+
+            start = time.perf_counter()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                migration.apply(conn)
+                # PRAGMA arguments can't be bound parameters
+                conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+                conn.execute("COMMIT")
+            except Exception as e:
+                conn.execute("ROLLBACK")
+                raise MigrationError(
+                    f"Migration {migration.version} ({migration.description}) failed: {e}"
+                ) from e
+
+            elapsed = time.perf_counter() - start
+            applied.append((migration.version, migration.description, elapsed))
+            if on_step:
+                on_step(migration, elapsed)
+    finally:
+        conn.isolation_level = saved_isolation
+
+    return applied
@@ -0,0 +1,204 @@
+"""
+Compact Show Records for DeadStream
+
+Query results used to be converted from sqlite3.Row into a fresh dict per
+row, each carrying its own hash table of ~14 string keys. Browse lists,
+BrowseScreen.current_shows and the selection code hold hundreds of these
+at a time, which adds up on a 2 GB Pi.
+
+Show is an immutable tuple of column values. The column names live once
+on the class (one class per distinct SELECT column list), so a row costs
+a single tuple allocation. Mapping-style access is kept so existing code
+written against dicts keeps working:
+
+    show['venue'], show.get('taper'), 'date' in show, show.keys(),
+    show.items(), dict(show), show == {...}
+
+Attribute access (show.venue) also works. Records can't be modified; use
+show.replace(taper='...') or dict(show) for an edited copy.
+
+Usage:
+    from src.database.models import fetch_shows
+
+    cursor.execute("SELECT * FROM shows WHERE year = ?", (1977,))
+    shows = fetch_shows(cursor)   # list of Show
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class Show(tuple):
+    """Immutable show record with dict-style read access"""
+
+    __slots__ = ()
+
+    # Set on the per-column-list subclasses created by show_type()
+    _fields: Tuple[str, ...] = ()
+    _index: Dict[str, int] = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return tuple.__getitem__(self, self._index[key])
+            except KeyError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return tuple.__getitem__(self, self._index[name])
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self) -> Iterator[str]:
+        # Iterate keys, like a dict
+        return iter(self._fields)
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Show):
+            return self._fields == other._fields and tuple.__eq__(self, other)
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{key}={value!r}' for key, value in self.items())
+        return f'Show({fields})'
+
+    def __reduce__(self):
+        # Per-column-list classes are created at runtime, so pickle by fields
+        return (_rebuild_show, (self._fields, tuple(self.values())))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a column value, or default if the column isn't present"""
+        index = self._index.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    def keys(self) -> Tuple[str, ...]:
+        """Column names, in SELECT order"""
+        return self._fields
+
+    def values(self) -> Iterator[Any]:
+        """Column values, in SELECT order"""
+        return tuple.__iter__(self)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """(column, value) pairs, in SELECT order"""
+        return zip(self._fields, tuple.__iter__(self))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable dict copy of this record"""
+        return dict(self.items())
+
+    def replace(self, **changes) -> 'Show':
+        """
+        Return a copy with some columns changed.
+
+        Args:
+            **changes: column=value pairs (columns must already exist)
+
+        Raises:
+            KeyError: If a column name is not part of this record
+        """
+        values = list(tuple.__iter__(self))
+        for key, value in changes.items():
+            values[self._index[key]] = value
+        return tuple.__new__(type(self), values)
+
+
+# collections.abc.Mapping can't be a base class alongside tuple's layout,
+# so register Show as a virtual subclass for isinstance() checks
+Mapping.register(Show)
+
+
+# One Show subclass per distinct column list
+_show_types: Dict[Tuple[str, ...], type] = {}
+_show_types_lock = threading.Lock()
+
+
+def show_type(fields: Tuple[str, ...]) -> type:
+    """
+    Get the Show subclass for a column list.
+
+    Args:
+        fields: Column names in SELECT order
+
+    Returns:
+        Show subclass whose records have exactly those columns
+    """
+    cls = _show_types.get(fields)
+    if cls is None:
+        with _show_types_lock:
+            cls = _show_types.get(fields)
+            if cls is None:
+                cls = type('Show', (Show,), {
+                    '__slots__': (),
+                    '_fields': fields,
+                    '_index': {name: i for i, name in enumerate(fields)},
+                })
+                _show_types[fields] = cls
+    return cls
+
+
+def make_show(mapping: Mapping) -> Show:
+    """
+    Build a Show from a dict (or any mapping, e.g. sqlite3.Row).
+
+    Args:
+        mapping: Column name -> value
+
+    Returns:
+        Show record with the mapping's keys as columns
+    """
+    fields = tuple(mapping.keys())
+    return tuple.__new__(show_type(fields), [mapping[key] for key in fields])
+
+
+def fetch_shows(cursor) -> List[Show]:
+    """
+    Fetch every remaining row of a cursor as Show records.
+
+    The cursor should return plain tuples (row_factory None); column names
+    are read once from cursor.description rather than per row.
+
+    Args:
+        cursor: Executed sqlite3 cursor
+
+    Returns:
+        List of Show records (may be empty)
+    """
+    cls = show_type(tuple(column[0] for column in cursor.description))
+    return [tuple.__new__(cls, row) for row in cursor.fetchall()]
+
+
+def fetch_show(cursor) -> Optional[Show]:
+    """
+    Fetch the next row of a cursor as a Show record.
+
+    Args:
+        cursor: Executed sqlite3 cursor (row_factory None)
+
+    Returns:
+        Show record, or None if there are no more rows
+    """
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    cls = show_type(tuple(column[0] for column in cursor.description))
+    return tuple.__new__(cls, row)
+
+
+def _rebuild_show(fields: Tuple[str, ...], values: tuple) -> Show:
+    """Unpickle helper for Show.__reduce__"""
+    return tuple.__new__(show_type(fields), values)
@@ -7,35 +7,72 @@ ready for use by the UI or other application components.
 
 Query functions include:
 - Search by identifier, date, date range, venue, year, state
+- Normalized venues (venues table, joined on shows.venue_id)
+- Best recording of a date (stored by the best_recording batch job)
+- Batch lookups of many dates or identifiers in one statement
+- Typo-tolerant venue/city search (trigram index)
 - Get top rated shows
 - Get shows on "this day in history"
 - Statistical queries
+- Paginated (keyset) iterators for long lists
 """
 
+import functools
+import json
+import re
 import sqlite3
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-from .schema import DB_PATH
+from typing import List, Dict, Optional, Tuple, Iterator, Iterable
+from .schema import DB_PATH, VENUE_NAME_KEY_SQL
+from .connection import get_manager
+from .sampler import get_sampler
+from .cache import get_query_cache
+from .models import Show, fetch_show, fetch_shows, make_show
 
 
 class DatabaseConnection:
-    """Context manager for database connections"""
+    """
+    Context manager for database access
+
+    Borrows the calling thread's long-lived read connection from the
+    ConnectionManager instead of opening a new one for every query.
+    """
     
-    def __init__(self, db_path=DB_PATH):
-        self.db_path = db_path
+    def __init__(self, db_path=None):
+        # Resolve at call time so DB_PATH can be redirected (tests, snapshots)
+        self.db_path = db_path or DB_PATH
         self.conn = None
         self.cursor = None
     
     def __enter__(self):
-        self.conn = sqlite3.connect(self.db_path)
-        # Return rows as dictionaries instead of tuples
-        self.conn.row_factory = sqlite3.Row
+        self.conn = get_manager(self.db_path).reader()
         self.cursor = self.conn.cursor()
+        # Plain tuples; show rows are wrapped by fetch_show()/fetch_shows()
+        self.cursor.row_factory = None
         return self.cursor
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.conn:
-            self.conn.close()
+        # Connection stays open for reuse; only release the cursor
+        if self.cursor:
+            self.cursor.close()
+
+
+def cached_query(func):
+    """
+    Decorator: serve repeated calls from the shared query cache
+    
+    Results are invalidated automatically when the database changes
+    (see cache.py). Arguments must be hashable.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return get_query_cache().call(DB_PATH, func, args, kwargs)
+    return wrapper
+
+
+def get_cache_stats() -> Dict:
+    """Get query cache hit/miss counters (see QueryCache.stats)"""
+    return get_query_cache().stats()
 
 
 def row_to_dict(row: sqlite3.Row) -> Dict:
@@ -43,11 +80,43 @@ def row_to_dict(row: sqlite3.Row) -> Dict:
     return {key: row[key] for key in row.keys()}
 
 
+def build_match_query(text: str, columns: Optional[List[str]] = None,
+                      prefix: bool = True) -> Optional[str]:
+    """
+    Build an FTS5 MATCH expression from free text typed by the user
+    
+    Every word must match (implicit AND). Words are quoted so punctuation
+    and FTS5 operators in user input can't break the query.
+    
+    Args:
+        text: User input (e.g., 'fill west')
+        columns: Restrict to these shows_fts columns (None = venue, city, state)
+        prefix: If True, each word matches as a prefix ('fill' -> 'Fillmore')
+        
+    Returns:
+        MATCH expression string, or None if text contains no searchable words
+        
+    Example:
+        build_match_query('barton hall', ['venue'])
+        -> '{venue} : ("barton"* "hall"*)'
+    """
+    words = re.findall(r'\w+', text or '')
+    if not words:
+        return None
+    
+    star = '*' if prefix else ''
+    terms = ' '.join(f'"{word}"{star}' for word in words)
+    
+    if columns:
+        return f"{{{' '.join(columns)}}} : ({terms})"
+    return terms
+
+
 # ============================================================================
 # BASIC QUERIES - Get individual shows
 # ============================================================================
 
-def get_show_by_identifier(identifier: str) -> Optional[Dict]:
+def get_show_by_identifier(identifier: str) -> Optional[Show]:
     """
     Get a specific show by its Archive.org identifier
     
@@ -55,7 +124,7 @@ def get_show_by_identifier(identifier: str) -> Optional[Dict]:
         identifier: Archive.org identifier (e.g., 'gd77-05-08.sbd.hicks.4982')
         
     Returns:
-        Dictionary with show data, or None if not found
+        Show record, or None if not found
     """
     with DatabaseConnection() as cursor:
         cursor.execute("""
@@ -63,11 +132,11 @@ def get_show_by_identifier(identifier: str) -> Optional[Dict]:
             WHERE identifier = ?
         """, (identifier,))
         
-        row = cursor.fetchone()
-        return row_to_dict(row) if row else None
+        return fetch_show(cursor)
 
 
-def get_show_by_date(date: str) -> List[Dict]:
+@cached_query
+def get_show_by_date(date: str) -> List[Show]:
     """
     Get all shows on a specific date
     
@@ -77,7 +146,7 @@ def get_show_by_date(date: str) -> List[Dict]:
         date: Date in YYYY-MM-DD format (e.g., '1977-05-08')
         
     Returns:
-        List of show dictionaries (may be empty)
+        List of Show records (may be empty)
     """
     with DatabaseConnection() as cursor:
         cursor.execute("""
@@ -86,32 +155,151 @@ def get_show_by_date(date: str) -> List[Dict]:
             ORDER BY avg_rating DESC
         """, (date,))
         
-        return [row_to_dict(row) for row in cursor.fetchall()]
+        return fetch_shows(cursor)
 
 
-def get_random_show() -> Optional[Dict]:
+@cached_query
+def get_best_recording(date: str) -> Optional[Show]:
     """
-    Get a random show from the database
-    
+    Get the best recording of a concert date
+
+    Reads the winner stored in the best_recording table (scored in batch
+    by src/selection/best_recording.py), so no scoring happens here.
+    Dates that haven't been scored yet fall back to the best rated
+    recording.
+
+    Args:
+        date: Date in YYYY-MM-DD format (e.g., '1977-05-08')
+
     Returns:
-        Dictionary with show data
+        Show record with recording_score and the component scores
+        (source_score, format_score, ...) added, or the best rated Show
+        without them if the date isn't scored; None if no shows
     """
     with DatabaseConnection() as cursor:
+        try:
+            cursor.execute("""
+                SELECT shows.*, best.total_score AS recording_score,
+                       best.source_score, best.format_score, best.rating_score,
+                       best.lineage_score, best.taper_score, best.recording_count
+                FROM best_recording AS best
+                JOIN shows ON shows.identifier = best.identifier
+                WHERE best.date = ?
+            """, (date,))
+            show = fetch_show(cursor)
+        except sqlite3.OperationalError as e:
+            if 'no such table' not in str(e):
+                raise
+            show = None  # Database predates the best_recording table
+
+        if show is not None:
+            return show
+
         cursor.execute("""
             SELECT * FROM shows
-            ORDER BY RANDOM()
+            WHERE date = ?
+            ORDER BY avg_rating DESC
             LIMIT 1
-        """)
+        """, (date,))
+        return fetch_show(cursor)
+
+
+# ============================================================================
+# BATCH LOOKUPS - many keys in one statement
+# ============================================================================
+
+def _unique_keys(keys: Iterable[str]) -> List[str]:
+    """Keys in first-seen order, without duplicates or None"""
+    return [key for key in dict.fromkeys(keys) if key is not None]
+
+
+def get_shows_by_identifiers(identifiers: Iterable[str]) -> Dict[str, Optional[Show]]:
+    """
+    Get many shows by identifier in one query
+    
+    The identifiers are passed as a single JSON array and joined through
+    json_each(), so one statement (one index seek per key) replaces a
+    get_show_by_identifier() call per identifier.
+    
+    Args:
+        identifiers: Archive.org identifiers (duplicates are ignored)
         
-        row = cursor.fetchone()
-        return row_to_dict(row) if row else None
+    Returns:
+        Dict mapping each requested identifier to its Show record, or to
+        None if not in the database (in request order)
+    """
+    keys = _unique_keys(identifiers)
+    result = dict.fromkeys(keys)
+    if not keys:
+        return result
+    
+    with DatabaseConnection() as cursor:
+        cursor.execute("""
+            SELECT shows.* FROM json_each(?) AS requested
+            JOIN shows ON shows.identifier = requested.value
+        """, (json.dumps(keys),))
+        
+        for show in fetch_shows(cursor):
+            result[show['identifier']] = show
+    
+    return result
+
+
+def get_shows_by_dates(dates: Iterable[str]) -> Dict[str, List[Show]]:
+    """
+    Get the shows on many dates in one query
+    
+    Batch version of get_show_by_date(): one statement for all dates
+    instead of one per date.
+    
+    Args:
+        dates: Dates in YYYY-MM-DD format (duplicates are ignored)
+        
+    Returns:
+        Dict mapping each requested date to its list of Show records,
+        best rated first (empty list if no shows), in request order
+    """
+    keys = _unique_keys(dates)
+    result = {date: [] for date in keys}
+    if not keys:
+        return result
+    
+    with DatabaseConnection() as cursor:
+        cursor.execute("""
+            SELECT shows.* FROM json_each(?) AS requested
+            JOIN shows ON shows.date = requested.value
+            ORDER BY shows.date, shows.avg_rating DESC
+        """, (json.dumps(keys),))
+        
+        for show in fetch_shows(cursor):
+            result[show['date']].append(show)
+    
+    return result
+
+
+def get_random_show(mode: str = 'uniform') -> Optional[Show]:
+    """
+    Get a random show from the database
+    
+    Picks from the sampler's in-memory rowid array instead of sorting the
+    whole table with ORDER BY RANDOM(). Recently drawn shows are skipped.
+    
+    Args:
+        mode: 'uniform', 'top_rated' (favour highly rated shows) or
+              'soundboard' (favour soundboard recordings)
+    
+    Returns:
+        Show record, or None if the database is empty
+    """
+    row = get_sampler(DB_PATH).draw(mode)
+    return make_show(row) if row else None
 
 
 # ============================================================================
 # DATE-BASED SEARCHES
 # ============================================================================
 
-def search_by_date_range(start_date: str, end_date: str) -> List[Dict]:
+def search_by_date_range(start_date: str, end_date: str) -> List[Show]:
     """
     Get all shows within a date range
     
@@ -120,7 +308,7 @@ def search_by_date_range(start_date: str, end_date: str) -> List[Dict]:
         end_date: End date in YYYY-MM-DD format
         
     Returns:
-        List of show dictionaries, sorted by date
+        List of Show records, sorted by date
     """
     with DatabaseConnection() as cursor:
         cursor.execute("""
@@ -129,10 +317,10 @@ def search_by_date_range(start_date: str, end_date: str) -> List[Dict]:
             ORDER BY date ASC
         """, (start_date, end_date))
         
-        return [row_to_dict(row) for row in cursor.fetchall()]
+        return fetch_shows(cursor)
 
 
-def search_by_year(year: int) -> List[Dict]:
+def search_by_year(year: int) -> List[Show]:
     """
     Get all shows from a specific year
     
@@ -140,14 +328,19 @@ def search_by_year(year: int) -> List[Dict]:
         year: Year (e.g., 1977)
         
     Returns:
-        List of show dictionaries, sorted by date
+        List of Show records, sorted by date
     """
-    start_date = f"{year}-01-01"
-    end_date = f"{year}-12-31"
-    return search_by_date_range(start_date, end_date)
+    with DatabaseConnection() as cursor:
+        cursor.execute("""
+            SELECT * FROM shows
+            WHERE year = ?
+            ORDER BY date ASC
+        """, (year,))
+        
+        return fetch_shows(cursor)
 
 
-def search_by_month(year: int, month: int) -> List[Dict]:
+def search_by_month(year: int, month: int) -> List[Show]:
     """
     Get all shows from a specific month
     
@@ -156,23 +349,13 @@ def search_by_month(year: int, month: int) -> List[Dict]:
         month: Month (1-12)
         
     Returns:
-        List of show dictionaries, sorted by date
+        List of Show records, sorted by date
     """
-    # Calculate last day of month
-    if month == 12:
-        end_month = 1
-        end_year = year + 1
-    else:
-        end_month = month + 1
-        end_year = year
-    
-    start_date = f"{year}-{month:02d}-01"
-    end_date = f"{end_year}-{end_month:02d}-01"
-    
-    return search_by_date_range(start_date, end_date)
+    return get_shows_by_month(year, month)
 
 
-def get_shows_by_month(year: int, month: int) -> List[Dict]:
+@cached_query
+def get_shows_by_month(year: int, month: int) -> List[Show]:
     """
     Get all shows from a specific month.
     
@@ -181,26 +364,19 @@ def get_shows_by_month(year: int, month: int) -> List[Dict]:
         month: Month (1-12)
         
     Returns:
-        List of show dictionaries, sorted by date
+        List of Show records, sorted by date
     """
     with DatabaseConnection() as cursor:
-        # Calculate date range for month
-        start_date = f"{year}-{month:02d}-01"
-        
-        if month == 12:
-            end_date = f"{year + 1}-01-01"
-        else:
-            end_date = f"{year}-{month + 1:02d}-01"
-        
         cursor.execute("""
             SELECT * FROM shows
-            WHERE date >= ? AND date < ?
+            WHERE year = ? AND month = ?
             ORDER BY date ASC
-        """, (start_date, end_date))
+        """, (year, month))
         
-        return [row_to_dict(row) for row in cursor.fetchall()]
+        return fetch_shows(cursor)
 
 
+@cached_query
 def get_show_dates_for_year(year: int) -> List[str]:
     """
     Get all dates that have shows for a given year.
@@ -215,14 +391,15 @@ def get_show_dates_for_year(year: int) -> List[str]:
     with DatabaseConnection() as cursor:
         cursor.execute("""
             SELECT DISTINCT date FROM shows
-            WHERE date LIKE ?
+            WHERE year = ?
             ORDER BY date ASC
-        """, (f"{year}%",))
+        """, (year,))
         
         return [row[0] for row in cursor.fetchall()]
 
 
-def get_on_this_day(month: int, day: int) -> List[Dict]:
+@cached_query
+def get_on_this_day(month: int, day: int) -> List[Show]:
     """
     Get all shows that occurred on this day in history (across all years)
     
@@ -231,55 +408,88 @@ def get_on_this_day(month: int, day: int) -> List[Dict]:
         day: Day (1-31)
         
     Returns:
-        List of show dictionaries, sorted by year (oldest first)
+        List of Show records, sorted by year (oldest first)
     """
     with DatabaseConnection() as cursor:
-        # Use SQL pattern matching for MM-DD
-        date_pattern = f"%-{month:02d}-{day:02d}"
-        
         cursor.execute("""
             SELECT * FROM shows
-            WHERE date LIKE ?
+            WHERE month = ? AND day = ?
             ORDER BY date ASC
-        """, (date_pattern,))
+        """, (month, day))
         
-        return [row_to_dict(row) for row in cursor.fetchall()]
+        return fetch_shows(cursor)
 
 
 # ============================================================================
 # VENUE-BASED SEARCHES
 # ============================================================================
 
-def search_by_venue(venue_name: str, exact_match: bool = False) -> List[Dict]:
+# Normalized name_key of one bound venue name (see src/database/venues.py);
+# spelling variants of a venue share it
+_VENUE_NAME_KEY = f"""(
+    SELECT {VENUE_NAME_KEY_SQL.format(name='requested.name')}
+    FROM (SELECT ? AS name) AS requested
+)"""
+
+
+def search_by_venue(venue_name: str, exact_match: bool = False) -> List[Show]:
     """
     Search for shows at a specific venue
     
     Args:
         venue_name: Venue name or partial name
-        exact_match: If True, match exact name; if False, partial match
+        exact_match: If True, match the venue name (ignoring case,
+                     punctuation and spelling variants); if False,
+                     partial match
         
     Returns:
-        List of show dictionaries, sorted by date
+        List of Show records, sorted by date
     """
     with DatabaseConnection() as cursor:
         if exact_match:
-            cursor.execute("""
-                SELECT * FROM shows
-                WHERE venue = ?
-                ORDER BY date ASC
+            cursor.execute(f"""
+                SELECT shows.* FROM venues
+                JOIN shows ON shows.venue_id = venues.id
+                WHERE venues.name_key = {_VENUE_NAME_KEY}
+                ORDER BY shows.date ASC
             """, (venue_name,))
         else:
-            # Case-insensitive partial match
+            # Case-insensitive word-prefix match through the FTS index
+            match = build_match_query(venue_name, ['venue'])
+            if not match:
+                return []
             cursor.execute("""
-                SELECT * FROM shows
-                WHERE venue LIKE ?
-                ORDER BY date ASC
-            """, (f"%{venue_name}%",))
+                SELECT shows.* FROM shows
+                JOIN shows_fts ON shows_fts.rowid = shows.rowid
+                WHERE shows_fts MATCH ?
+                ORDER BY shows.date ASC
+            """, (match,))
         
-        return [row_to_dict(row) for row in cursor.fetchall()]
+        return fetch_shows(cursor)
+
+
+@cached_query
+def get_venue(venue_id: int) -> Optional[Dict]:
+    """
+    Get one normalized venue
 
+    Args:
+        venue_id: venues.id (shows.venue_id)
 
-def search_by_state(state: str) -> List[Dict]:
+    Returns:
+        dict with id, name, city, state and show_count, or None
+    """
+    with DatabaseConnection() as cursor:
+        cursor.execute("""
+            SELECT id, name, city, state, show_count FROM venues WHERE id = ?
+        """, (venue_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip(('id', 'name', 'city', 'state', 'show_count'), row))
+
+
+def search_by_state(state: str) -> List[Show]:
     """
     Get all shows from a specific state
     
@@ -287,43 +497,55 @@ def search_by_state(state: str) -> List[Dict]:
         state: State abbreviation (e.g., 'CA', 'NY') or full name
         
     Returns:
-        List of show dictionaries, sorted by date
+        List of Show records, sorted by date
     """
+    # Whole-word match: 'CA' should not also match 'Canada'
+    match = build_match_query(state, ['state'], prefix=False)
+    if not match:
+        return []
+    
     with DatabaseConnection() as cursor:
         cursor.execute("""
-            SELECT * FROM shows
-            WHERE state = ? OR state LIKE ?
-            ORDER BY date ASC
-        """, (state, f"%{state}%"))
+            SELECT shows.* FROM shows
+            JOIN shows_fts ON shows_fts.rowid = shows.rowid
+            WHERE shows_fts MATCH ?
+            ORDER BY shows.date ASC
+        """, (match,))
         
-        return [row_to_dict(row) for row in cursor.fetchall()]
+        return fetch_shows(cursor)
 
 
-def search_by_city(city: str) -> List[Dict]:
+def search_by_city(city: str) -> List[Show]:
     """
     Get all shows from a specific city
     
     Args:
-        city: City name (partial match supported)
+        city: City name (word-prefix match supported, e.g. 'san fran')
         
     Returns:
-        List of show dictionaries, sorted by date
+        List of Show records, sorted by date
     """
+    match = build_match_query(city, ['city'])
+    if not match:
+        return []
+    
     with DatabaseConnection() as cursor:
         cursor.execute("""
-            SELECT * FROM shows
-            WHERE city LIKE ?
-            ORDER BY date ASC
-        """, (f"%{city}%",))
+            SELECT shows.* FROM shows
+            JOIN shows_fts ON shows_fts.rowid = shows.rowid
+            WHERE shows_fts MATCH ?
+            ORDER BY shows.date ASC
+        """, (match,))
         
-        return [row_to_dict(row) for row in cursor.fetchall()]
+        return fetch_shows(cursor)
 
 
 # ============================================================================
 # RATING-BASED SEARCHES
 # ============================================================================
 
-def get_top_rated_shows(limit: int = 50, min_reviews: int = 5) -> List[Dict]:
+@cached_query
+def get_top_rated_shows(limit: int = 50, min_reviews: int = 5) -> List[Show]:
     """
     Get the highest-rated shows
     
@@ -332,7 +554,7 @@ def get_top_rated_shows(limit: int = 50, min_reviews: int = 5) -> List[Dict]:
         min_reviews: Minimum number of reviews required (filters out unreviewed shows)
         
     Returns:
-        List of show dictionaries, sorted by rating (highest first)
+        List of Show records, sorted by rating (highest first)
     """
     with DatabaseConnection() as cursor:
         cursor.execute("""
@@ -342,10 +564,11 @@ def get_top_rated_shows(limit: int = 50, min_reviews: int = 5) -> List[Dict]:
             LIMIT ?
         """, (min_reviews, limit))
         
-        return [row_to_dict(row) for row in cursor.fetchall()]
+        return fetch_shows(cursor)
 
 
-def get_top_rated_by_year(year: int, limit: int = 10) -> List[Dict]:
+@cached_query
+def get_top_rated_by_year(year: int, limit: int = 10) -> List[Show]:
     """
     Get the highest-rated shows from a specific year
     
@@ -354,30 +577,35 @@ def get_top_rated_by_year(year: int, limit: int = 10) -> List[Dict]:
         limit: Maximum number of shows to return
         
     Returns:
-        List of show dictionaries, sorted by rating
+        List of Show records, sorted by rating
     """
     with DatabaseConnection() as cursor:
         cursor.execute("""
             SELECT * FROM shows
-            WHERE date LIKE ?
+            WHERE year = ?
             ORDER BY avg_rating DESC, num_reviews DESC
             LIMIT ?
-        """, (f"{year}%", limit))
+        """, (year, limit))
         
-        return [row_to_dict(row) for row in cursor.fetchall()]
+        return fetch_shows(cursor)
 
 
 # ============================================================================
 # STATISTICAL QUERIES
 # ============================================================================
 
+# Counts come from the stats_* summary tables (see schema.py), which are
+# kept up to date by triggers, so none of these scan the shows table.
+
+@cached_query
 def get_show_count() -> int:
     """Get total number of shows in database"""
     with DatabaseConnection() as cursor:
-        cursor.execute("SELECT COUNT(*) FROM shows")
+        cursor.execute("SELECT COALESCE(SUM(show_count), 0) FROM stats_year")
         return cursor.fetchone()[0]
 
 
+@cached_query
 def get_show_count_by_year() -> List[Tuple[str, int]]:
     """
     Get show count for each year
@@ -386,26 +614,56 @@ def get_show_count_by_year() -> List[Tuple[str, int]]:
         List of tuples: [(year, count), ...]
     """
     with DatabaseConnection() as cursor:
+        # Year kept as a string ('1977') for existing callers
         cursor.execute("""
-            SELECT substr(date, 1, 4) as year, COUNT(*) as count
-            FROM shows
-            GROUP BY year
+            SELECT CAST(year AS TEXT), show_count
+            FROM stats_year
             ORDER BY year
         """)
         
         return [(row[0], row[1]) for row in cursor.fetchall()]
 
 
+@cached_query
+def get_show_count_for_year(year: int) -> int:
+    """Get number of shows in a single year"""
+    with DatabaseConnection() as cursor:
+        cursor.execute("SELECT show_count FROM stats_year WHERE year = ?", (year,))
+        row = cursor.fetchone()
+        return row[0] if row else 0
+
+
+@cached_query
+def get_show_count_by_month(year: int) -> List[Tuple[int, int]]:
+    """
+    Get show count for each month of a year
+
+    Args:
+        year: Year as integer (e.g., 1977)
+
+    Returns:
+        List of tuples: [(month, count), ...] for months with shows
+    """
+    with DatabaseConnection() as cursor:
+        cursor.execute("""
+            SELECT month, show_count
+            FROM stats_month
+            WHERE year = ?
+            ORDER BY month
+        """, (year,))
+
+        return [(row[0], row[1]) for row in cursor.fetchall()]
+
+
+@cached_query
 def get_venue_count() -> int:
     """Get number of unique venues"""
     with DatabaseConnection() as cursor:
-        cursor.execute("""
-            SELECT COUNT(DISTINCT venue) FROM shows
-            WHERE venue IS NOT NULL
-        """)
+        cursor.execute("SELECT COUNT(*) FROM venues WHERE show_count > 0")
         return cursor.fetchone()[0]
 
 
+@cached_query
 def get_most_played_venues(limit: int = 20) -> List[Tuple[str, int]]:
     """
     Get venues with the most shows
@@ -418,39 +676,68 @@ def get_most_played_venues(limit: int = 20) -> List[Tuple[str, int]]:
     """
     with DatabaseConnection() as cursor:
         cursor.execute("""
-            SELECT venue, COUNT(*) as count
-            FROM shows
-            WHERE venue IS NOT NULL
-            GROUP BY venue
-            ORDER BY count DESC
+            SELECT name, show_count
+            FROM venues
+            ORDER BY show_count DESC, name
             LIMIT ?
         """, (limit,))
 
         return [(row[0], row[1]) for row in cursor.fetchall()]
 
 
+@cached_query
 def get_show_count_by_venue(db_path: str, venue_name: str) -> int:
     """
     Get number of shows at a specific venue
 
     Args:
-        db_path: Path to database file
-        venue_name: Name of venue (case-insensitive partial match)
+        db_path: Path to database file (None for the default database)
+        venue_name: Name of venue (case-insensitive word-prefix match)
 
     Returns:
         Number of shows at that venue
     """
+    return get_show_counts_for_venues(db_path, (venue_name,))[venue_name]
+
+
+@cached_query
+def get_show_counts_for_venues(db_path: str, venue_names: Tuple[str, ...]) -> Dict[str, int]:
+    """
+    Get number of shows at each of several venues in one pass
+
+    Matching follows search_by_venue(): every word of the name must be the
+    start of a word in the venue (case-insensitive), so "Barton Hall" also
+    counts "Barton Hall, Cornell University". Counts are summed from the
+    venues table, which holds one row per normalized venue.
+
+    Args:
+        db_path: Path to database file (None for the default database)
+        venue_names: Tuple of venue names
+
+    Returns:
+        dict of {venue_name: show_count}
+    """
+    patterns = {}
+    for name in venue_names:
+        words = re.findall(r'\w+', name.lower())
+        patterns[name] = [
+            re.compile(r'\b' + re.escape(word)) for word in words
+        ]
+
+    counts = {name: 0 for name in venue_names}
+
     with DatabaseConnection(db_path) as cursor:
-        cursor.execute("""
-            SELECT COUNT(*) as count
-            FROM shows
-            WHERE venue LIKE ?
-        """, (f'%{venue_name}%',))
+        cursor.execute("SELECT name, show_count FROM venues WHERE show_count > 0")
+        for venue, show_count in cursor.fetchall():
+            venue_lower = venue.lower()
+            for name, words in patterns.items():
+                if words and all(word.search(venue_lower) for word in words):
+                    counts[name] += show_count
 
-        result = cursor.fetchone()
-        return result[0] if result else 0
+    return counts
 
 
+@cached_query
 def get_shows_by_state_stats() -> List[Tuple[str, int]]:
     """
     Get show count for each state
@@ -460,11 +747,9 @@ def get_shows_by_state_stats() -> List[Tuple[str, int]]:
     """
     with DatabaseConnection() as cursor:
         cursor.execute("""
-            SELECT state, COUNT(*) as count
-            FROM shows
-            WHERE state IS NOT NULL
-            GROUP BY state
-            ORDER BY count DESC
+            SELECT state, show_count
+            FROM stats_state
+            ORDER BY show_count DESC
         """)
         
         return [(row[0], row[1]) for row in cursor.fetchall()]
@@ -474,6 +759,7 @@ def get_shows_by_state_stats() -> List[Tuple[str, int]]:
 # UTILITY FUNCTIONS
 # ============================================================================
 
+@cached_query
 def get_date_range() -> Tuple[str, str]:
     """
     Get the earliest and latest show dates in the database
@@ -482,13 +768,16 @@ def get_date_range() -> Tuple[str, str]:
         Tuple of (earliest_date, latest_date) in YYYY-MM-DD format
     """
     with DatabaseConnection() as cursor:
+        # Separate subqueries: each is a single index seek, whereas
+        # MIN() and MAX() together scan the whole date index
         cursor.execute("""
-            SELECT MIN(date), MAX(date) FROM shows
+            SELECT (SELECT MIN(date) FROM shows), (SELECT MAX(date) FROM shows)
         """)
         row = cursor.fetchone()
         return (row[0], row[1])
 
 
+@cached_query
 def get_years_with_shows() -> List[int]:
     """
     Get list of all years that have shows
@@ -498,12 +787,12 @@ def get_years_with_shows() -> List[int]:
     """
     with DatabaseConnection() as cursor:
         cursor.execute("""
-            SELECT DISTINCT substr(date, 1, 4) as year
-            FROM shows
+            SELECT year
+            FROM stats_year
             ORDER BY year
         """)
         
-        return [int(row[0]) for row in cursor.fetchall()]
+        return [row[0] for row in cursor.fetchall()]
 
 
 # ============================================================================
@@ -517,71 +806,396 @@ def search_shows(
     state: Optional[str] = None,
     min_rating: Optional[float] = None,
     limit: Optional[int] = None
-) -> List[Dict]:
+) -> List[Show]:
     """
     Flexible search with multiple criteria (all optional)
     
+    Text criteria (query, venue) go through the shows_fts index. When a
+    text query is given, results are ranked by relevance (venue matches
+    outrank city matches), otherwise they are sorted newest first.
+    
     Args:
-        query: Text search in venue or city
+        query: Text search in venue, city or state (word-prefix match)
         year: Filter by year
-        venue: Filter by venue (partial match)
+        venue: Filter by venue (word-prefix match)
         state: Filter by state
         min_rating: Minimum average rating
         limit: Maximum results to return
         
     Returns:
-        List of show dictionaries matching all criteria
+        List of Show records matching all criteria
     """
     conditions = []
     params = []
+    match_parts = []
     
-    if year:
-        conditions.append("date LIKE ?")
-        params.append(f"{year}%")
+    if query:
+        match = build_match_query(query, ['venue', 'city', 'state'])
+        if not match:
+            return []
+        match_parts.append(match)
     
     if venue:
-        conditions.append("venue LIKE ?")
-        params.append(f"%{venue}%")
+        match = build_match_query(venue, ['venue'])
+        if not match:
+            return []
+        match_parts.append(match)
+    
+    if match_parts:
+        conditions.append("shows_fts MATCH ?")
+        params.append(' AND '.join(match_parts))
+    
+    if year:
+        conditions.append("shows.year = ?")
+        params.append(year)
     
     if state:
-        conditions.append("state = ?")
+        conditions.append("shows.state = ?")
         params.append(state)
     
-    if query:
-        conditions.append("(venue LIKE ? OR city LIKE ?)")
-        params.extend([f"%{query}%", f"%{query}%"])
-    
     if min_rating:
-        conditions.append("avg_rating >= ?")
+        conditions.append("shows.avg_rating >= ?")
         params.append(min_rating)
     
     where_clause = " AND ".join(conditions) if conditions else "1=1"
-    limit_clause = f"LIMIT {limit}" if limit else ""
+    limit_clause = f"LIMIT {int(limit)}" if limit else ""
+    
+    if match_parts:
+        # bm25 weights: venue, city, state
+        from_clause = "shows JOIN shows_fts ON shows_fts.rowid = shows.rowid"
+        order_clause = "bm25(shows_fts, 10.0, 5.0, 1.0), shows.date DESC"
+    else:
+        from_clause = "shows"
+        order_clause = "shows.date DESC"
     
     with DatabaseConnection() as cursor:
         cursor.execute(f"""
-            SELECT * FROM shows
+            SELECT shows.* FROM {from_clause}
             WHERE {where_clause}
-            ORDER BY date DESC
+            ORDER BY {order_clause}
             {limit_clause}
         """, params)
         
-        return [row_to_dict(row) for row in cursor.fetchall()]
+        return fetch_shows(cursor)
+
 
+def search_text(text: str, limit: int = 50) -> List[Show]:
     """
-    Get all dates that have shows for a given year.
+    Ranked free-text search across venue, city and state
+    
+    Each word is matched as a prefix, so partial input works while typing
+    ('winter' -> Winterland, 'san fran' -> San Francisco).
     
     Args:
-        year: Year to search (e.g., 1977)
+        text: Search text
+        limit: Maximum results to return
         
     Returns:
-        List of date strings in YYYY-MM-DD format
+        List of Show records, best matches first
     """
+    if not build_match_query(text):
+        return []
+    return search_shows(query=text, limit=limit)
+
+
+# ============================================================================
+# FUZZY SEARCH - typo-tolerant venue/city matching (trigram index)
+# ============================================================================
+
+# A place matches when it contains at least this share of the query's trigrams
+FUZZY_THRESHOLD = 0.5
+
+# Places whose shows fuzzy_search_shows() returns
+FUZZY_PLACE_LIMIT = 5
+
+
+def _place_search_key(text: str) -> str:
+    """Normalize text the way the search_places triggers do (see schema.py)"""
+    text = ' '.join(text.split())
+    return '  ' + re.sub(r"[,.']", '', text.lower()) + ' '
+
+
+def _trigrams(key: str) -> List[str]:
+    """Distinct 3-character slices of a search key, in order"""
+    return list(dict.fromkeys(key[i:i + 3] for i in range(len(key) - 2)))
+
+
+@cached_query
+def fuzzy_search_places(text: str, limit: int = 10,
+                        threshold: float = FUZZY_THRESHOLD) -> List[Dict]:
+    """
+    Find venues and cities similar to (possibly misspelled) text
+
+    The query is split into trigrams and looked up in search_trigrams;
+    places are ranked by the share of the query's trigrams they contain,
+    so 'winterlnd' still finds Winterland Arena and 'barton hal' finds
+    Barton Hall. Ties go to the closer overall match (fewer extra
+    trigrams), then the place with more shows.
+
+    Args:
+        text: Search text (a venue, city or "city state")
+        limit: Maximum places to return
+        threshold: Minimum share (0-1) of the query's trigrams a place
+                   must contain
+
+    Returns:
+        List of dicts with kind ('venue' or 'city'), name, state ('' for
+        venues), show_count and similarity (0-1), best match first
+    """
+    if not re.search(r'\w', text or ''):
+        return []
+
+    grams = _trigrams(_place_search_key(text))
+    min_shared = max(1, int(len(grams) * threshold + 0.999))
+
     with DatabaseConnection() as cursor:
         cursor.execute("""
-            SELECT DISTINCT date FROM shows
-            WHERE date LIKE ?
-            ORDER BY date ASC
-        """, (f"{year}%",))
+            SELECT places.kind, places.name, places.state, places.show_count,
+                   COUNT(*) AS shared
+            FROM json_each(?) AS requested
+            JOIN search_trigrams AS grams ON grams.trigram = requested.value
+            JOIN search_places AS places ON places.id = grams.place_id
+            GROUP BY grams.place_id
+            HAVING shared >= ?
+            ORDER BY shared DESC,
+                     places.trigram_count - shared,
+                     places.show_count DESC
+            LIMIT ?
+        """, (json.dumps(grams), min_shared, limit))
+
+        return [
+            {'kind': kind, 'name': name, 'state': state, 'show_count': show_count,
+             'similarity': round(shared / len(grams), 3)}
+            for kind, name, state, show_count, shared in cursor.fetchall()
+        ]
+
+
+def fuzzy_search_shows(
+    query: Optional[str] = None,
+    year: Optional[int] = None,
+    state: Optional[str] = None,
+    min_rating: Optional[float] = None,
+    limit: Optional[int] = None
+) -> List[Show]:
+    """
+    Typo-tolerant version of search_shows()
+
+    The text query is matched against venue and city names with
+    fuzzy_search_places(); shows at the best matching places come first
+    (newest first within a place). Without a text query this is the same
+    as search_shows().
+
+    Args:
+        query: Venue or city text, misspellings allowed
+        year: Filter by year
+        state: Filter by state
+        min_rating: Minimum average rating
+        limit: Maximum results to return
+
+    Returns:
+        List of Show records, best matching place first
+    """
+    if not query:
+        return search_shows(year=year, state=state, min_rating=min_rating, limit=limit)
+
+    filters = []
+    filter_params = []
+    if year:
+        filters.append("year = ?")
+        filter_params.append(year)
+    if state:
+        filters.append("state = ?")
+        filter_params.append(state)
+    if min_rating:
+        filters.append("avg_rating >= ?")
+        filter_params.append(min_rating)
+
+    results = {}
+    with DatabaseConnection() as cursor:
+        for place in fuzzy_search_places(query, limit=FUZZY_PLACE_LIMIT):
+            if place['kind'] == 'venue':
+                conditions = [f"venue_id IN (SELECT id FROM venues "
+                              f"WHERE name_key = {_VENUE_NAME_KEY})"]
+                params = [place['name']]
+            else:
+                # Cities are stored with '' for a missing state
+                conditions = ["city = ?", "coalesce(state, '') = ?"]
+                params = [place['name'], place['state']]
+
+            # A full limit per place: some rows may already be in results
+            cursor.execute(f"""
+                SELECT * FROM shows
+                WHERE {' AND '.join(conditions + filters)}
+                ORDER BY date DESC
+                {f'LIMIT {int(limit)}' if limit else ''}
+            """, params + filter_params)
+
+            for show in fetch_shows(cursor):
+                results.setdefault(show['identifier'], show)
+            if limit and len(results) >= limit:
+                break
+
+    shows = list(results.values())
+    return shows[:limit] if limit else shows
+
+
+# ============================================================================
+# PAGINATED QUERIES - keyset cursors for long lists
+# ============================================================================
+
+# Default number of shows per page (about two screenfuls on the 7" display)
+PAGE_SIZE = 25
+
+# Keyset orderings: (sort column, direction)
+# identifier breaks ties so every row has a unique position
+_PAGE_ORDERINGS = {
+    'date': ('date', 'ASC'),
+    'rating': ('avg_rating', 'DESC'),
+}
+
+
+def iter_show_pages(
+    where: str = "1=1",
+    params: Tuple = (),
+    order: str = 'date',
+    page_size: int = PAGE_SIZE,
+    join_fts: bool = False
+) -> Iterator[List[Show]]:
+    """
+    Yield pages of shows lazily using keyset pagination
+    
+    Each page is fetched with its own short query that resumes after the
+    last (sort key, identifier) seen, so no cursor or read transaction is
+    held between pages and the cost of page N does not grow with N
+    (unlike LIMIT/OFFSET).
+    
+    Args:
+        where: SQL condition on shows (columns prefixed with 'shows.')
+        params: Parameters for the where condition
+        order: 'date' (oldest first) or 'rating' (highest first)
+        page_size: Maximum shows per page
+        join_fts: Join shows_fts so the condition can use MATCH
+        
+    Yields:
+        Lists of Show records (never empty)
+        
+    Raises:
+        ValueError: If order is not 'date' or 'rating'
+    """
+    if order not in _PAGE_ORDERINGS:
+        raise ValueError(f"Unknown page order: {order}")
+    
+    column, direction = _PAGE_ORDERINGS[order]
+    compare = '>' if direction == 'ASC' else '<'
+    from_clause = "shows"
+    if join_fts:
+        from_clause = "shows JOIN shows_fts ON shows_fts.rowid = shows.rowid"
+    if order == 'rating':
+        # NULL ratings can't take part in row-value comparisons
+        where = f"({where}) AND shows.avg_rating IS NOT NULL"
+    
+    last_key = None
+    while True:
+        if last_key is None:
+            keyset_clause = ""
+            page_params = tuple(params)
+        else:
+            keyset_clause = f"AND (shows.{column}, shows.identifier) {compare} (?, ?)"
+            page_params = tuple(params) + last_key
+        
+        with DatabaseConnection() as cursor:
+            cursor.execute(f"""
+                SELECT shows.* FROM {from_clause}
+                WHERE ({where}) {keyset_clause}
+                ORDER BY shows.{column} {direction}, shows.identifier {direction}
+                LIMIT ?
+            """, page_params + (page_size,))
+            page = fetch_shows(cursor)
+        
+        if not page:
+            return
+        
+        yield page
+        
+        if len(page) < page_size:
+            return
+        last_key = (page[-1][column], page[-1]['identifier'])
+
+
+def iter_shows_by_year(year: int, page_size: int = PAGE_SIZE) -> Iterator[List[Show]]:
+    """
+    Yield pages of shows from a specific year, oldest first
+    
+    Args:
+        year: Year (e.g., 1977)
+        page_size: Maximum shows per page
+        
+    Yields:
+        Lists of Show records
+    """
+    return iter_show_pages("shows.year = ?", (year,), 'date', page_size)
+
+
+def iter_shows_by_venue(venue_name: str, page_size: int = PAGE_SIZE) -> Iterator[List[Show]]:
+    """
+    Yield pages of shows at a venue (word-prefix match), oldest first
+    
+    Args:
+        venue_name: Venue name or partial name
+        page_size: Maximum shows per page
+        
+    Yields:
+        Lists of Show records
+    """
+    match = build_match_query(venue_name, ['venue'])
+    if not match:
+        return iter(())
+    return iter_show_pages("shows_fts MATCH ?", (match,), 'date', page_size,
+                           join_fts=True)
+
+
+def iter_shows_by_venue_id(venue_id: int, page_size: int = PAGE_SIZE) -> Iterator[List[Show]]:
+    """
+    Yield pages of shows at one normalized venue, oldest first
+    
+    Args:
+        venue_id: venues.id (see get_venue())
+        page_size: Maximum shows per page
         
-        return [row[0] for row in cursor.fetchall()]
\ No newline at end of file
+    Yields:
+        Lists of Show records
+    """
+    return iter_show_pages("shows.venue_id = ?", (venue_id,), 'date', page_size)
+
+
+def iter_shows_by_date_range(start_date: str, end_date: str,
+                             page_size: int = PAGE_SIZE) -> Iterator[List[Show]]:
+    """
+    Yield pages of shows within a date range, oldest first
+    
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+        page_size: Maximum shows per page
+        
+    Yields:
+        Lists of Show records
+    """
+    return iter_show_pages("shows.date BETWEEN ? AND ?", (start_date, end_date),
+                           'date', page_size)
+
+
+def iter_top_rated_shows(min_reviews: int = 5,
+                         page_size: int = PAGE_SIZE) -> Iterator[List[Show]]:
+    """
+    Yield pages of rated shows, highest rating first
+    
+    Args:
+        min_reviews: Minimum number of reviews required
+        page_size: Maximum shows per page
+        
+    Yields:
+        Lists of Show records
+    """
+    return iter_show_pages("shows.num_reviews >= ?", (min_reviews,), 'rating',
+                           page_size)
@@ -0,0 +1,193 @@
+"""
+Random Show Sampler for DeadStream
+
+ORDER BY RANDOM() LIMIT 1 generates a random key for every row and sorts
+them all on each press of the Random Show button. This module instead keeps
+a compact in-memory array of rowids (plus per-mode weights) and picks from
+it directly, then fetches the single chosen row by rowid.
+
+Sampling modes:
+- 'uniform'    - every recording equally likely
+- 'top_rated'  - favour highly rated shows (weight grows with avg_rating)
+- 'soundboard' - favour soundboard recordings
+
+Recently drawn shows are skipped so repeated presses don't bring back the
+same show. The arrays are rebuilt automatically when the database changes
+(detected with PRAGMA data_version).
+
+Usage:
+    from src.database.sampler import get_sampler
+
+    show = get_sampler().draw('top_rated')
+"""
+
+import os
+import random
+import sqlite3
+import threading
+from collections import deque
+from itertools import accumulate
+from typing import Dict, List, Optional
+
+from .schema import DB_PATH
+from .connection import get_manager
+
+
+SAMPLING_MODES = ('uniform', 'top_rated', 'soundboard')
+
+# How many recent draws to avoid repeating
+RECENT_HISTORY_SIZE = 50
+
+# Extra weight given to soundboard recordings in 'soundboard' mode
+SOUNDBOARD_WEIGHT = 4.0
+
+
+def _rating_weight(avg_rating: Optional[float]) -> float:
+    """
+    Weight for 'top_rated' mode.
+
+    rating^4 makes a 5.0 show ~2.4x as likely as a 4.0 show and ~8x as
+    likely as a 3.0 show. Unrated shows keep a small non-zero chance.
+    """
+    return max(avg_rating or 0.0, 0.5) ** 4
+
+
+class ShowSampler:
+    """Picks random shows from an in-memory rowid array"""
+
+    def __init__(self, db_path: str = DB_PATH,
+                 history_size: int = RECENT_HISTORY_SIZE):
+        """
+        Initialize the sampler.
+
+        Arrays are loaded lazily on the first draw.
+
+        Args:
+            db_path: Path to the SQLite database file
+            history_size: Number of recent draws to avoid repeating
+        """
+        self.db_path = db_path
+        self.recent = deque(maxlen=history_size)
+        self._rowids: List[int] = []
+        self._cum_weights: Dict[str, List[float]] = {}
+        self._data_version = None
+        self._lock = threading.Lock()
+        self._random = random.Random()
+
+    def _load(self, conn):
+        """Read rowids and weights for every show (one pass over the table)"""
+        rows = conn.execute("""
+            SELECT rowid, avg_rating,
+                   (source_type = 'sbd' OR identifier LIKE '%sbd%') AS is_sbd
+            FROM shows
+        """).fetchall()
+
+        self._rowids = [row[0] for row in rows]
+        self._cum_weights = {
+            'top_rated': list(accumulate(_rating_weight(row[1]) for row in rows)),
+            'soundboard': list(accumulate(
+                SOUNDBOARD_WEIGHT if row[2] else 1.0 for row in rows
+            )),
+        }
+
+    def _refresh_if_stale(self, conn):
+        """Reload the arrays if another connection has written to the DB"""
+        # data_version is only comparable on the same connection, and each
+        # thread has its own reader
+        version = (id(conn), conn.execute("PRAGMA data_version").fetchone()[0])
+        if version != self._data_version or not self._rowids:
+            self._load(conn)
+            self._data_version = version
+
+    def _pick(self, mode: str) -> int:
+        """Pick one rowid according to mode"""
+        if mode == 'uniform':
+            return self._rowids[self._random.randrange(len(self._rowids))]
+        return self._random.choices(
+            self._rowids, cum_weights=self._cum_weights[mode]
+        )[0]
+
+    def draw_rowid(self, mode: str = 'uniform', max_attempts: int = 10) -> Optional[int]:
+        """
+        Draw a random rowid, avoiding recently drawn shows.
+
+        Args:
+            mode: One of SAMPLING_MODES
+            max_attempts: Weighted redraws allowed when a recent show comes
+                          up before falling back to a uniform pick among
+                          the shows not drawn recently
+
+        Returns:
+            rowid of the chosen show, or None if the database is empty
+
+        Raises:
+            ValueError: If mode is not a known sampling mode
+        """
+        if mode not in SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling mode: {mode} (expected one of {SAMPLING_MODES})")
+
+        conn = get_manager(self.db_path).reader()
+
+        with self._lock:
+            self._refresh_if_stale(conn)
+            if not self._rowids:
+                return None
+
+            rowid = self._pick(mode)
+            for _ in range(max_attempts):
+                if rowid not in self.recent:
+                    break
+                rowid = self._pick(mode)
+            else:
+                # Unlucky streak: take any show not drawn recently, if one exists
+                recent = set(self.recent)
+                fresh = [r for r in self._rowids if r not in recent]
+                if fresh:
+                    rowid = self._random.choice(fresh)
+
+            self.recent.append(rowid)
+            return rowid
+
+    def draw(self, mode: str = 'uniform') -> Optional[sqlite3.Row]:
+        """
+        Draw a random show.
+
+        Args:
+            mode: One of SAMPLING_MODES
+
+        Returns:
+            sqlite3.Row for the chosen show, or None if the database is empty
+        """
+        rowid = self.draw_rowid(mode)
+        if rowid is None:
+            return None
+
+        conn = get_manager(self.db_path).reader()
+        return conn.execute("SELECT * FROM shows WHERE rowid = ?", (rowid,)).fetchone()
+
+
+# One sampler per database file
+_samplers: Dict[str, ShowSampler] = {}
+_samplers_lock = threading.Lock()
+
+
+def get_sampler(db_path: str = DB_PATH) -> ShowSampler:
+    """
+    Get the shared ShowSampler for a database file.
+
+    Sharing one sampler keeps the recent-draw history common to every
+    Random Show entry point (welcome screen, browse screen, random screen).
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        ShowSampler instance
+    """
+    key = os.path.abspath(db_path)
+    with _samplers_lock:
+        sampler = _samplers.get(key)
+        if sampler is None:
+            sampler = ShowSampler(key)
+            _samplers[key] = sampler
+        return sampler
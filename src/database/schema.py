@@ -6,7 +6,7 @@ show information. The schema is designed to support browsing and searching
 shows by date, venue, year, and rating.
 
 Schema Design Philosophy:
-- Shows-only table for Phase 3 (tracks deferred to Phase 4)
+- Shows table plus a lazily filled tracks table (audio files per show)
 - Minimal fields for initial population (lazy load additional metadata)
 - Indexes on common search fields for performance
 - Simple, maintainable structure
@@ -27,6 +27,9 @@ DB_PATH = os.path.join(
     'shows.db'
 )
 
+# Read-optimized copy of shows.db for distribution (see snapshot.py)
+SNAPSHOT_PATH = os.path.join(os.path.dirname(DB_PATH), 'shows.snapshot.db')
+
 # SQL statement to create the shows table
 CREATE_SHOWS_TABLE = """
 CREATE TABLE IF NOT EXISTS shows (
@@ -38,10 +41,13 @@ CREATE TABLE IF NOT EXISTS shows (
     -- Example: '1977-05-08'
     date TEXT NOT NULL,
     
-    -- Venue name
+    -- Venue name (canonical spelling from venues.name)
     -- Example: 'Barton Hall, Cornell University'
     venue TEXT,
     
+    -- Normalized venue (venues.id), set by trigger from venue/city/state
+    venue_id INTEGER REFERENCES venues(id),
+    
     -- City where show took place
     -- Parsed from 'coverage' field in API response
     -- Example: 'Ithaca'
@@ -74,10 +80,25 @@ CREATE TABLE IF NOT EXISTS shows (
     -- Timestamp of last database update for this show
     -- ISO 8601 format: 'YYYY-MM-DDTHH:MM:SS'
     -- Example: '2025-12-20T15:30:00'
-    last_updated TEXT
+    last_updated TEXT,
+    
+    -- Date parts as integers, derived from date by SQLite on write
+    -- Indexed for year/month/day queries (no LIKE on date strings)
+    -- Example: '1977-05-08' -> 1977, 5, 8
+    year INTEGER GENERATED ALWAYS AS (CAST(substr(date, 1, 4) AS INTEGER)) STORED,
+    month INTEGER GENERATED ALWAYS AS (CAST(substr(date, 6, 2) AS INTEGER)) STORED,
+    day INTEGER GENERATED ALWAYS AS (CAST(substr(date, 9, 2) AS INTEGER)) STORED
 );
 """
 
+# Columns stored in shows, in table order (generated columns excluded)
+# Used when copying rows during a table rebuild. venue_id is left out: the
+# rebuild only runs on pre-1.2 tables, and migration 8 fills it afterwards.
+SHOWS_DATA_COLUMNS = [
+    'identifier', 'date', 'venue', 'city', 'state', 'avg_rating',
+    'num_reviews', 'source_type', 'taper', 'last_updated'
+]
+
 # Indexes for common search patterns
 # These make queries fast by allowing SQLite to quickly find matching rows
 
@@ -87,6 +108,7 @@ CREATE INDEX IF NOT EXISTS idx_date ON shows(date);
 """
 
 # Index on venue - for browsing shows at specific venues
+# (superseded by idx_venue_id in 1.7; kept for migration 2)
 CREATE_VENUE_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_venue ON shows(venue);
 """
@@ -96,11 +118,21 @@ CREATE_RATING_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_rating ON shows(avg_rating);
 """
 
-# Index on year - for browsing by year
-# Uses substr(date, 1, 4) to extract year from 'YYYY-MM-DD' format
-# Example: '1977-05-08' -> '1977'
+# Index on year + date - for browsing by year and calendar highlighting
+# Covers "SELECT DISTINCT date ... WHERE year = ?" without touching the table
 CREATE_YEAR_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_year ON shows(substr(date, 1, 4));
+CREATE INDEX IF NOT EXISTS idx_year_date ON shows(year, date);
+"""
+
+# Index on year + rating - for "best shows of year" queries
+# Rows come out already in ORDER BY avg_rating DESC, num_reviews DESC order
+CREATE_YEAR_RATING_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_year_rating ON shows(year, avg_rating DESC, num_reviews DESC);
+"""
+
+# Index on month + day - for "on this day in history" queries
+CREATE_MONTH_DAY_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_month_day ON shows(month, day, date);
 """
 
 # Index on state - for browsing by location
@@ -113,16 +145,663 @@ CREATE_DATE_RATING_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_date_rating ON shows(date, avg_rating DESC);
 """
 
-# List of all SQL statements needed to create the database
-# Executed in order by the initialization function
+# Full-text search index over venue, city and state
+# LIKE '%term%' can never use idx_venue/idx_state, so text search goes
+# through this FTS5 index instead. External content table: the text lives
+# in shows, shows_fts only stores the inverted index (keyed by shows.rowid).
+# prefix='2 3' builds prefix indexes so "fill*" style queries stay fast.
+CREATE_SEARCH_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS shows_fts USING fts5(
+    venue,
+    city,
+    state,
+    content='shows',
+    content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+"""
+
+# Triggers keep shows_fts in sync with shows on every insert/update/delete
+# (populate and update scripts need no changes)
+CREATE_SEARCH_INSERT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS shows_fts_insert AFTER INSERT ON shows BEGIN
+    INSERT INTO shows_fts(rowid, venue, city, state)
+    VALUES (new.rowid, new.venue, new.city, new.state);
+END;
+"""
+
+CREATE_SEARCH_DELETE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS shows_fts_delete AFTER DELETE ON shows BEGIN
+    INSERT INTO shows_fts(shows_fts, rowid, venue, city, state)
+    VALUES ('delete', old.rowid, old.venue, old.city, old.state);
+END;
+"""
+
+CREATE_SEARCH_UPDATE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS shows_fts_update AFTER UPDATE OF venue, city, state ON shows BEGIN
+    INSERT INTO shows_fts(shows_fts, rowid, venue, city, state)
+    VALUES ('delete', old.rowid, old.venue, old.city, old.state);
+    INSERT INTO shows_fts(rowid, venue, city, state)
+    VALUES (new.rowid, new.venue, new.city, new.state);
+END;
+"""
+
+# Rebuild the search index from the shows table
+# Needed once for databases populated before shows_fts existed, and after
+# VACUUM (which may renumber rowids of tables without INTEGER PRIMARY KEY).
+# Takes well under a second for ~15,000 shows.
+REBUILD_SEARCH_INDEX = """
+INSERT INTO shows_fts(shows_fts) VALUES ('rebuild');
+"""
+
+# Materialized statistics tables
+# The browse screens and settings need per-year, per-month, per-venue and
+# per-state show counts. Computing those with GROUP BY / COUNT(DISTINCT)
+# scans the whole shows table, so the counts are kept in small summary
+# tables instead, updated by triggers as shows are inserted, changed or
+# deleted. Rows are removed when their count drops to zero.
+CREATE_STATS_YEAR_TABLE = """
+CREATE TABLE IF NOT EXISTS stats_year (
+    year INTEGER PRIMARY KEY,
+    show_count INTEGER NOT NULL
+);
+"""
+
+CREATE_STATS_MONTH_TABLE = """
+CREATE TABLE IF NOT EXISTS stats_month (
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    show_count INTEGER NOT NULL,
+    PRIMARY KEY (year, month)
+) WITHOUT ROWID;
+"""
+
+CREATE_STATS_VENUE_TABLE = """
+CREATE TABLE IF NOT EXISTS stats_venue (
+    venue TEXT PRIMARY KEY,
+    show_count INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+CREATE_STATS_STATE_TABLE = """
+CREATE TABLE IF NOT EXISTS stats_state (
+    state TEXT PRIMARY KEY,
+    show_count INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Index for "most played venues" (ORDER BY show_count DESC LIMIT n)
+CREATE_STATS_VENUE_COUNT_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_stats_venue_count ON stats_venue(show_count DESC);
+"""
+
+# Trigger bodies: add one show to / remove one show from every summary table
+# {row} is 'new' or 'old'
+_STATS_ADD_SHOW = """
+    INSERT OR IGNORE INTO stats_year (year, show_count)
+    SELECT {row}.year, 0 WHERE {row}.year IS NOT NULL;
+    UPDATE stats_year SET show_count = show_count + 1 WHERE year = {row}.year;
+    INSERT OR IGNORE INTO stats_month (year, month, show_count)
+    SELECT {row}.year, {row}.month, 0
+    WHERE {row}.year IS NOT NULL AND {row}.month IS NOT NULL;
+    UPDATE stats_month SET show_count = show_count + 1
+    WHERE year = {row}.year AND month = {row}.month;
+    INSERT OR IGNORE INTO stats_venue (venue, show_count)
+    SELECT {row}.venue, 0 WHERE {row}.venue IS NOT NULL;
+    UPDATE stats_venue SET show_count = show_count + 1 WHERE venue = {row}.venue;
+    INSERT OR IGNORE INTO stats_state (state, show_count)
+    SELECT {row}.state, 0 WHERE {row}.state IS NOT NULL;
+    UPDATE stats_state SET show_count = show_count + 1 WHERE state = {row}.state;
+"""
+
+_STATS_REMOVE_SHOW = """
+    UPDATE stats_year SET show_count = show_count - 1 WHERE year = {row}.year;
+    DELETE FROM stats_year WHERE year = {row}.year AND show_count <= 0;
+    UPDATE stats_month SET show_count = show_count - 1
+    WHERE year = {row}.year AND month = {row}.month;
+    DELETE FROM stats_month
+    WHERE year = {row}.year AND month = {row}.month AND show_count <= 0;
+    UPDATE stats_venue SET show_count = show_count - 1 WHERE venue = {row}.venue;
+    DELETE FROM stats_venue WHERE venue = {row}.venue AND show_count <= 0;
+    UPDATE stats_state SET show_count = show_count - 1 WHERE state = {row}.state;
+    DELETE FROM stats_state WHERE state = {row}.state AND show_count <= 0;
+"""
+
+CREATE_STATS_INSERT_TRIGGER = f"""
+CREATE TRIGGER IF NOT EXISTS stats_insert AFTER INSERT ON shows BEGIN
+{_STATS_ADD_SHOW.format(row='new')}
+END;
+"""
+
+CREATE_STATS_DELETE_TRIGGER = f"""
+CREATE TRIGGER IF NOT EXISTS stats_delete AFTER DELETE ON shows BEGIN
+{_STATS_REMOVE_SHOW.format(row='old')}
+END;
+"""
+
+CREATE_STATS_UPDATE_TRIGGER = f"""
+CREATE TRIGGER IF NOT EXISTS stats_update AFTER UPDATE OF date, venue, state ON shows BEGIN
+{_STATS_REMOVE_SHOW.format(row='old')}
+{_STATS_ADD_SHOW.format(row='new')}
+END;
+"""
+
+# Recompute every summary table from scratch
+# Run by init_database so databases populated before the stats tables
+# existed (or edited with triggers disabled) start out correct.
+REBUILD_STATS_SQL = [
+    "DELETE FROM stats_year;",
+    """
+    INSERT INTO stats_year (year, show_count)
+    SELECT year, COUNT(*) FROM shows WHERE year IS NOT NULL GROUP BY year;
+    """,
+    "DELETE FROM stats_month;",
+    """
+    INSERT INTO stats_month (year, month, show_count)
+    SELECT year, month, COUNT(*) FROM shows
+    WHERE year IS NOT NULL AND month IS NOT NULL
+    GROUP BY year, month;
+    """,
+    "DELETE FROM stats_venue;",
+    """
+    INSERT INTO stats_venue (venue, show_count)
+    SELECT venue, COUNT(*) FROM shows WHERE venue IS NOT NULL GROUP BY venue;
+    """,
+    "DELETE FROM stats_state;",
+    """
+    INSERT INTO stats_state (state, show_count)
+    SELECT state, COUNT(*) FROM shows WHERE state IS NOT NULL GROUP BY state;
+    """,
+]
+
+# Audio files for each show
+# Filled lazily the first time a show's files are fetched from Archive.org
+# (or in bulk by populate_database.py --tracks), so setlists and playlists
+# can be built without a network round-trip. One row per audio file; a
+# show can have several formats of the same track.
+CREATE_TRACKS_TABLE = """
+CREATE TABLE IF NOT EXISTS tracks (
+    identifier TEXT NOT NULL,        -- shows.identifier
+    filename TEXT NOT NULL,          -- Archive.org file name
+    title TEXT,                      -- Title from Archive.org metadata (NULL if none)
+    set_name TEXT,                   -- 'Set I', 'Set II', 'Encore', ...
+    track_number INTEGER,
+    duration REAL,                   -- Seconds
+    format TEXT,                     -- 'VBR MP3', 'Flac', 'Ogg Vorbis', ...
+    size INTEGER,                    -- Bytes
+    md5 TEXT,                        -- Checksum from Archive.org
+    PRIMARY KEY (identifier, filename)
+) WITHOUT ROWID;
+"""
+
+# Drop a show's tracks along with the show
+CREATE_TRACKS_DELETE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS tracks_delete AFTER DELETE ON shows BEGIN
+    DELETE FROM tracks WHERE identifier = old.identifier;
+END;
+"""
+
+# Best recording per concert date
+# Picking a date's recording used to mean scoring every recording of that
+# date with RecordingScorer on each tap. The winner is stored here instead,
+# with its component scores and the weights it was scored with, by the
+# batch job in src/selection/best_recording.py. Date selection is then a
+# single primary-key lookup.
+CREATE_BEST_RECORDING_TABLE = """
+CREATE TABLE IF NOT EXISTS best_recording (
+    date TEXT PRIMARY KEY,           -- Concert date (YYYY-MM-DD)
+    identifier TEXT NOT NULL,        -- Top-scored shows.identifier
+    total_score REAL NOT NULL,       -- Weighted RecordingScorer total (0-100)
+    source_score REAL,
+    format_score REAL,
+    rating_score REAL,
+    lineage_score REAL,
+    taper_score REAL,
+    recording_count INTEGER NOT NULL, -- Recordings of this date that were scored
+    weights TEXT NOT NULL,           -- JSON of the scoring weights used
+    scored_at TEXT NOT NULL          -- When the date was last scored
+) WITHOUT ROWID;
+"""
+
+# Dates whose best recording must be recomputed
+# Triggers add a date whenever one of its recordings is inserted, deleted,
+# re-rated or gains stored tracks; the batch job empties the queue.
+CREATE_BEST_RECORDING_PENDING_TABLE = """
+CREATE TABLE IF NOT EXISTS best_recording_pending (
+    date TEXT PRIMARY KEY
+) WITHOUT ROWID;
+"""
+
+CREATE_BEST_RECORDING_INSERT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS best_recording_insert AFTER INSERT ON shows BEGIN
+    INSERT OR IGNORE INTO best_recording_pending (date) VALUES (new.date);
+END;
+"""
+
+CREATE_BEST_RECORDING_DELETE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS best_recording_delete AFTER DELETE ON shows BEGIN
+    INSERT OR IGNORE INTO best_recording_pending (date) VALUES (old.date);
+END;
+"""
+
+CREATE_BEST_RECORDING_UPDATE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS best_recording_update
+AFTER UPDATE OF date, avg_rating, num_reviews, source_type, taper ON shows BEGIN
+    INSERT OR IGNORE INTO best_recording_pending (date) VALUES (old.date);
+    INSERT OR IGNORE INTO best_recording_pending (date) VALUES (new.date);
+END;
+"""
+
+# Stored tracks tell the scorer the recording's audio format
+CREATE_BEST_RECORDING_TRACKS_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS best_recording_tracks AFTER INSERT ON tracks BEGIN
+    INSERT OR IGNORE INTO best_recording_pending (date)
+    SELECT date FROM shows WHERE identifier = new.identifier;
+END;
+"""
+
+# Queue every date for scoring (existing databases gaining the table)
+QUEUE_ALL_BEST_RECORDINGS = """
+INSERT OR IGNORE INTO best_recording_pending (date) SELECT DISTINCT date FROM shows;
+"""
+
+# Typo-tolerant place search
+# shows_fts matches whole words and prefixes, so "winterlnd" or "Barton hal"
+# find nothing. Every distinct venue and city/state ("coverage") is stored
+# once in search_places together with a normalized search key, and
+# search_trigrams is an inverted index from each 3-character slice of that
+# key to the places containing it. A misspelled query still shares most
+# of its trigrams with the intended place, so places are ranked by how
+# many of the query's trigrams they contain (see fuzzy_search_places()).
+# Triggers on shows keep both tables in sync; a place is removed when its
+# last show is.
+CREATE_SEARCH_PLACES_TABLE = """
+CREATE TABLE IF NOT EXISTS search_places (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,              -- 'venue' or 'city'
+    name TEXT NOT NULL,              -- Venue or city as stored in shows
+    state TEXT NOT NULL DEFAULT '',  -- State of a city ('' for venues)
+    search_key TEXT NOT NULL,        -- Normalized, space-padded text the trigrams come from
+    trigram_count INTEGER NOT NULL DEFAULT 0,
+    show_count INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (kind, name, state)
+);
+"""
+
+CREATE_SEARCH_TRIGRAMS_TABLE = """
+CREATE TABLE IF NOT EXISTS search_trigrams (
+    trigram TEXT NOT NULL,
+    place_id INTEGER NOT NULL,       -- search_places.id
+    PRIMARY KEY (trigram, place_id)
+) WITHOUT ROWID;
+"""
+
+# Character positions 1..255 for slicing search keys into trigrams inside
+# triggers (trigger bodies can't use a recursive CTE)
+CREATE_TRIGRAM_POSITIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS search_trigram_positions (
+    pos INTEGER PRIMARY KEY
+);
+"""
+
+FILL_TRIGRAM_POSITIONS = """
+INSERT OR IGNORE INTO search_trigram_positions (pos)
+WITH RECURSIVE positions(pos) AS (
+    SELECT 1 UNION ALL SELECT pos + 1 FROM positions WHERE pos < 255
+)
+SELECT pos FROM positions;
+"""
+
+# Search key for a place: lower case, without , . and ', padded with two
+# spaces in front and one behind so the first and last letters get their
+# own trigrams. queries._place_search_key() must produce the same text.
+_PLACE_KEY = "'  ' || lower(replace(replace(replace({text}, ',', ''), '.', ''), '''', '')) || ' '"
+_VENUE_KEY = _PLACE_KEY.format(text='{row}.venue')
+_CITY_KEY = _PLACE_KEY.format(text="{row}.city || coalesce(' ' || {row}.state, '')")
+
+# Slice a new place's key into trigrams / remove an old place's trigrams
+_PLACE_TRIGRAMS = """
+    SELECT DISTINCT substr({row}.search_key, pos, 3) FROM search_trigram_positions
+    WHERE pos <= length({row}.search_key) - 2
+"""
+
+CREATE_SEARCH_PLACES_INSERT_TRIGGER = f"""
+CREATE TRIGGER IF NOT EXISTS search_places_insert AFTER INSERT ON search_places BEGIN
+    INSERT OR IGNORE INTO search_trigrams (trigram, place_id)
+    SELECT substr(new.search_key, pos, 3), new.id FROM search_trigram_positions
+    WHERE pos <= length(new.search_key) - 2;
+    UPDATE search_places
+    SET trigram_count = (SELECT COUNT(*) FROM ({_PLACE_TRIGRAMS.format(row='new')}))
+    WHERE id = new.id;
+END;
+"""
+
+CREATE_SEARCH_PLACES_DELETE_TRIGGER = f"""
+CREATE TRIGGER IF NOT EXISTS search_places_delete AFTER DELETE ON search_places BEGIN
+    DELETE FROM search_trigrams
+    WHERE place_id = old.id AND trigram IN ({_PLACE_TRIGRAMS.format(row='old')});
+END;
+"""
+
+# Trigger bodies: count one show in / out of its venue and city places
+# {row} is 'new' or 'old'
+_PLACES_ADD_SHOW = f"""
+    INSERT OR IGNORE INTO search_places (kind, name, state, search_key)
+    SELECT 'venue', {{row}}.venue, '', {_VENUE_KEY} WHERE {{row}}.venue IS NOT NULL;
+    UPDATE search_places SET show_count = show_count + 1
+    WHERE kind = 'venue' AND name = {{row}}.venue AND state = '';
+    INSERT OR IGNORE INTO search_places (kind, name, state, search_key)
+    SELECT 'city', {{row}}.city, coalesce({{row}}.state, ''), {_CITY_KEY}
+    WHERE {{row}}.city IS NOT NULL;
+    UPDATE search_places SET show_count = show_count + 1
+    WHERE kind = 'city' AND name = {{row}}.city AND state = coalesce({{row}}.state, '');
+"""
+
+_PLACES_REMOVE_SHOW = """
+    UPDATE search_places SET show_count = show_count - 1
+    WHERE kind = 'venue' AND name = {row}.venue AND state = '';
+    UPDATE search_places SET show_count = show_count - 1
+    WHERE kind = 'city' AND name = {row}.city AND state = coalesce({row}.state, '');
+    DELETE FROM search_places
+    WHERE show_count <= 0
+      AND ((kind = 'venue' AND name = {row}.venue AND state = '')
+        OR (kind = 'city' AND name = {row}.city AND state = coalesce({row}.state, '')));
+"""
+
+CREATE_PLACES_INSERT_TRIGGER = f"""
+CREATE TRIGGER IF NOT EXISTS search_places_show_insert AFTER INSERT ON shows BEGIN
+{_PLACES_ADD_SHOW.format(row='new')}
+END;
+"""
+
+CREATE_PLACES_DELETE_TRIGGER = f"""
+CREATE TRIGGER IF NOT EXISTS search_places_show_delete AFTER DELETE ON shows BEGIN
+{_PLACES_REMOVE_SHOW.format(row='old')}
+END;
+"""
+
+CREATE_PLACES_UPDATE_TRIGGER = f"""
+CREATE TRIGGER IF NOT EXISTS search_places_show_update
+AFTER UPDATE OF venue, city, state ON shows BEGIN
+{_PLACES_REMOVE_SHOW.format(row='old')}
+{_PLACES_ADD_SHOW.format(row='new')}
+END;
+"""
+
+# Shows of a fuzzy-matched city
+CREATE_CITY_STATE_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_city_state ON shows(city, state);
+"""
+
+# Recompute the place index from scratch (deleting places drops their
+# trigrams; inserting them creates new ones through the triggers above)
+REBUILD_SEARCH_PLACES_SQL = [
+    "DELETE FROM search_places;",
+    f"""
+    INSERT INTO search_places (kind, name, state, search_key, show_count)
+    SELECT 'venue', venue, '', {_VENUE_KEY.format(row='shows')}, COUNT(*)
+    FROM shows WHERE venue IS NOT NULL GROUP BY venue;
+    """,
+    f"""
+    INSERT INTO search_places (kind, name, state, search_key, show_count)
+    SELECT 'city', city, coalesce(state, ''), {_CITY_KEY.format(row='shows')}, COUNT(*)
+    FROM shows WHERE city IS NOT NULL GROUP BY city, coalesce(state, '');
+    """,
+]
+
+# Normalized venues
+# shows.venue repeats the same venue string on thousands of rows, and the
+# same venue is spelled several ways ("Winterland Ballroom", "Winterland
+# Arena"; "Capitol Theater", "Capitol Theatre"), which split its counts.
+# Each venue is stored once in venues, with its canonical name and
+# location, and shows point at it through venue_id. Venue counts and
+# lookups then join on integers.
+#
+# A venue is identified by venue_key: the normalized name (lower case, no
+# punctuation, a leading "The" dropped, common spelling variants unified)
+# plus city and state. The key is computed in SQL, so every writer (the
+# ingest scripts, tests, ad-hoc sqlite3 sessions) canonicalizes the same
+# way. venue_aliases maps the keys of merged spellings to the venue they
+# were merged into (see src/database/venues.py).
+CREATE_VENUES_TABLE = """
+CREATE TABLE IF NOT EXISTS venues (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,              -- Canonical name (copied to shows.venue)
+    city TEXT,
+    state TEXT,
+    name_key TEXT NOT NULL,          -- Normalized name
+    venue_key TEXT NOT NULL UNIQUE,  -- name_key|city|state
+    show_count INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+CREATE_VENUE_ALIASES_TABLE = """
+CREATE TABLE IF NOT EXISTS venue_aliases (
+    alias_key TEXT PRIMARY KEY,      -- venue_key of another spelling
+    venue_id INTEGER NOT NULL REFERENCES venues(id)
+) WITHOUT ROWID;
+"""
+
+CREATE_VENUES_NAME_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_venues_name_key ON venues(name_key);
+"""
+
+CREATE_VENUES_COUNT_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_venues_show_count ON venues(show_count DESC);
+"""
+
+# Shows of one venue in date order (replaces idx_venue on the text column)
+CREATE_VENUE_ID_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_venue_id ON shows(venue_id, date);
+"""
+
+DROP_VENUE_TEXT_INDEX = """
+DROP INDEX IF EXISTS idx_venue;
+"""
+
+# Spelling variants unified in venue names (whole words)
+VENUE_WORD_VARIANTS = [
+    ('theater', 'theatre'),
+    ('amphitheater', 'amphitheatre'),
+    ('centre', 'center'),
+    ('ctr', 'center'),
+    ('aud', 'auditorium'),
+    ('univ', 'university'),
+    ('colosseum', 'coliseum'),
+]
+
+
+def _venue_name_key_sql(text):
+    """SQL expression normalizing the venue name expression text"""
+    expr = f"' ' || lower({text}) || ' '"
+    for char in (',', '.', "''", '"'):
+        expr = f"replace({expr}, '{char}', '')"
+    for char, replacement in (('&', ' and '), ('-', ' '), ('/', ' ')):
+        expr = f"replace({expr}, '{char}', '{replacement}')"
+    for _ in range(2):
+        expr = f"replace({expr}, '  ', ' ')"
+    for word, canonical in VENUE_WORD_VARIANTS:
+        expr = f"replace({expr}, ' {word} ', ' {canonical} ')"
+    return f"trim(CASE WHEN {expr} LIKE ' the %' THEN substr({expr}, 5) ELSE {expr} END)"
+
+
+def _venue_key_sql(name, city, state):
+    """SQL expression for the venue_key of name/city/state expressions"""
+    return (f"{_venue_name_key_sql(name)} || '|' || lower(trim(coalesce({city}, ''))) "
+            f"|| '|' || upper(trim(coalesce({state}, '')))")
+
+
+VENUE_NAME_KEY_SQL = _venue_name_key_sql('{name}')
+VENUE_KEY_SQL = _venue_key_sql('{name}', '{city}', '{state}')
+
+_ROW_NAME_KEY = _venue_name_key_sql('{row}.venue')
+_ROW_VENUE_KEY = _venue_key_sql('{row}.venue', '{row}.city', '{row}.state')
+
+# Subquery giving the name_key and venue_key of a row (each computed once)
+_ROW_KEYS = f"""(
+        SELECT name_key, name_key || '|' || lower(trim(coalesce({{row}}.city, '')))
+               || '|' || upper(trim(coalesce({{row}}.state, ''))) AS venue_key
+        FROM (SELECT {_ROW_NAME_KEY} AS name_key)
+    ) AS keys"""
+
+# Trigger body: point a show at its venue (created if new)
+_VENUE_RESOLVE = f"""
+    INSERT OR IGNORE INTO venues (name, city, state, name_key, venue_key)
+    SELECT {{row}}.venue, {{row}}.city, {{row}}.state, keys.name_key, keys.venue_key
+    FROM {_ROW_KEYS}
+    WHERE {{row}}.venue IS NOT NULL
+      AND NOT EXISTS (SELECT 1 FROM venue_aliases WHERE alias_key = keys.venue_key);
+    UPDATE shows SET venue_id = (
+        SELECT coalesce(
+            (SELECT venue_id FROM venue_aliases WHERE alias_key = keys.venue_key),
+            (SELECT id FROM venues WHERE venue_key = keys.venue_key)
+        ) FROM {_ROW_KEYS}
+    ) WHERE rowid = {{row}}.rowid;
+"""
+
+# Shows inserted without a venue_id (ingest scripts set it themselves)
+CREATE_VENUES_RESOLVE_INSERT_TRIGGER = f"""
+CREATE TRIGGER IF NOT EXISTS venues_resolve_insert AFTER INSERT ON shows
+WHEN new.venue_id IS NULL AND new.venue IS NOT NULL BEGIN
+{_VENUE_RESOLVE.format(row='new')}
+END;
+"""
+
+# Re-link a show whose venue text changed (unless the same UPDATE set
+# venue_id itself, as merge_venue() does)
+CREATE_VENUES_RESOLVE_UPDATE_TRIGGER = f"""
+CREATE TRIGGER IF NOT EXISTS venues_resolve_update AFTER UPDATE OF venue, city, state ON shows
+WHEN new.venue_id IS old.venue_id BEGIN
+{_VENUE_RESOLVE.format(row='new')}
+END;
+"""
+
+# venues.show_count follows venue_id (never deleted, so ids stay stable)
+CREATE_VENUES_COUNT_INSERT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS venues_count_insert AFTER INSERT ON shows
+WHEN new.venue_id IS NOT NULL BEGIN
+    UPDATE venues SET show_count = show_count + 1 WHERE id = new.venue_id;
+END;
+"""
+
+CREATE_VENUES_COUNT_UPDATE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS venues_count_update AFTER UPDATE OF venue_id ON shows BEGIN
+    UPDATE venues SET show_count = show_count - 1 WHERE id = old.venue_id;
+    UPDATE venues SET show_count = show_count + 1 WHERE id = new.venue_id;
+END;
+"""
+
+CREATE_VENUES_COUNT_DELETE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS venues_count_delete AFTER DELETE ON shows BEGIN
+    UPDATE venues SET show_count = show_count - 1 WHERE id = old.venue_id;
+END;
+"""
+
+# Fill venues from existing rows (most common spelling of each key becomes
+# the canonical name), link every show and rewrite shows.venue to the
+# canonical name
+BACKFILL_VENUES_SQL = [
+    f"""
+    INSERT OR IGNORE INTO venues (name, city, state, name_key, venue_key)
+    SELECT venue, city, state, {_ROW_NAME_KEY.format(row='shows')},
+           {_ROW_VENUE_KEY.format(row='shows')}
+    FROM shows WHERE venue IS NOT NULL
+    GROUP BY venue, city, state
+    ORDER BY COUNT(*) DESC;
+    """,
+    f"""
+    UPDATE shows SET venue_id = (
+        SELECT id FROM venues WHERE venue_key = {_ROW_VENUE_KEY.format(row='shows')}
+    ) WHERE venue IS NOT NULL AND venue_id IS NULL;
+    """,
+    """
+    UPDATE shows SET venue = (SELECT name FROM venues WHERE id = shows.venue_id)
+    WHERE venue != (SELECT name FROM venues WHERE id = shows.venue_id);
+    """,
+]
+
+# Validation state per show
+# validate_database() used to load and check every row on each run. The
+# outcome for each show is stored here together with the last_updated
+# value it was checked at, so an incremental run only re-checks shows
+# whose last_updated moved (or that were never checked, or were checked
+# by older rules). See src/database/validation.py.
+CREATE_VALIDATION_STATE_TABLE = """
+CREATE TABLE IF NOT EXISTS validation_state (
+    identifier TEXT PRIMARY KEY,
+    last_updated TEXT,               -- shows.last_updated when checked
+    rules INTEGER NOT NULL,          -- validation.RULES_VERSION used
+    errors INTEGER NOT NULL,
+    warnings INTEGER NOT NULL,
+    issues TEXT NOT NULL             -- JSON list of issue messages
+) WITHOUT ROWID;
+"""
+
+# Forget a deleted show's validation outcome
+CREATE_VALIDATION_STATE_DELETE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS validation_state_delete AFTER DELETE ON shows BEGIN
+    DELETE FROM validation_state WHERE identifier = old.identifier;
+END;
+"""
+
+# List of all SQL statements needed to create the database from scratch
+# init_database applies these through the ordered steps in migrations.py;
+# the flat list is for building fresh databases directly (tests, benchmarks)
 SCHEMA_SQL = [
     CREATE_SHOWS_TABLE,
     CREATE_DATE_INDEX,
-    CREATE_VENUE_INDEX,
     CREATE_RATING_INDEX,
     CREATE_YEAR_INDEX,
+    CREATE_YEAR_RATING_INDEX,
+    CREATE_MONTH_DAY_INDEX,
     CREATE_STATE_INDEX,
-    CREATE_DATE_RATING_INDEX
+    CREATE_DATE_RATING_INDEX,
+    CREATE_SEARCH_TABLE,
+    CREATE_SEARCH_INSERT_TRIGGER,
+    CREATE_SEARCH_DELETE_TRIGGER,
+    CREATE_SEARCH_UPDATE_TRIGGER,
+    REBUILD_SEARCH_INDEX,
+    CREATE_STATS_YEAR_TABLE,
+    CREATE_STATS_MONTH_TABLE,
+    CREATE_STATS_VENUE_TABLE,
+    CREATE_STATS_STATE_TABLE,
+    CREATE_STATS_VENUE_COUNT_INDEX,
+    CREATE_STATS_INSERT_TRIGGER,
+    CREATE_STATS_DELETE_TRIGGER,
+    CREATE_STATS_UPDATE_TRIGGER,
+] + REBUILD_STATS_SQL + [
+    CREATE_TRACKS_TABLE,
+    CREATE_TRACKS_DELETE_TRIGGER,
+    CREATE_BEST_RECORDING_TABLE,
+    CREATE_BEST_RECORDING_PENDING_TABLE,
+    CREATE_BEST_RECORDING_INSERT_TRIGGER,
+    CREATE_BEST_RECORDING_DELETE_TRIGGER,
+    CREATE_BEST_RECORDING_UPDATE_TRIGGER,
+    CREATE_BEST_RECORDING_TRACKS_TRIGGER,
+    CREATE_CITY_STATE_INDEX,
+    CREATE_SEARCH_PLACES_TABLE,
+    CREATE_SEARCH_TRIGRAMS_TABLE,
+    CREATE_TRIGRAM_POSITIONS_TABLE,
+    FILL_TRIGRAM_POSITIONS,
+    CREATE_SEARCH_PLACES_INSERT_TRIGGER,
+    CREATE_SEARCH_PLACES_DELETE_TRIGGER,
+    CREATE_PLACES_INSERT_TRIGGER,
+    CREATE_PLACES_DELETE_TRIGGER,
+    CREATE_PLACES_UPDATE_TRIGGER,
+    CREATE_VENUES_TABLE,
+    CREATE_VENUE_ALIASES_TABLE,
+    CREATE_VENUES_NAME_INDEX,
+    CREATE_VENUES_COUNT_INDEX,
+    CREATE_VENUE_ID_INDEX,
+    DROP_VENUE_TEXT_INDEX,
+    CREATE_VENUES_RESOLVE_INSERT_TRIGGER,
+    CREATE_VENUES_RESOLVE_UPDATE_TRIGGER,
+    CREATE_VENUES_COUNT_INSERT_TRIGGER,
+    CREATE_VENUES_COUNT_UPDATE_TRIGGER,
+    CREATE_VENUES_COUNT_DELETE_TRIGGER,
+    CREATE_VALIDATION_STATE_TABLE,
+    CREATE_VALIDATION_STATE_DELETE_TRIGGER,
 ]
 
 
@@ -130,13 +809,82 @@ def get_schema_version():
     """
     Return the current schema version.
     
-    This version number should be incremented whenever the schema changes.
-    Used for database migrations in future phases.
+    Taken from the last step in migrations.py, so adding a migration is
+    the only place the version needs to change.
     
     Returns:
         str: Schema version in format 'X.Y'
     """
-    return "1.0"
+    from .migrations import MIGRATIONS
+    return MIGRATIONS[-1].schema_version
+
+
+def add_date_part_columns(conn):
+    """
+    Upgrade a shows table created before the year/month/day columns existed.
+    
+    SQLite can't ALTER TABLE ADD COLUMN a STORED generated column, so the
+    table is rebuilt in place: copy rows (keeping rowids, which shows_fts
+    references) into a table with the current definition, then swap it in.
+    Indexes and triggers on the old table are dropped with it; the caller
+    recreates them (see migrations.py).
+    
+    If the connection is already inside a transaction the rebuild joins it
+    and the caller commits; otherwise it runs in its own transaction.
+    
+    Args:
+        conn: sqlite3.Connection to the database
+        
+    Returns:
+        bool: True if the table was rebuilt, False if already up to date
+    """
+    columns = [row[1] for row in conn.execute("PRAGMA table_xinfo(shows)")]
+    if not columns or 'year' in columns:
+        return False
+    
+    column_list = ', '.join(SHOWS_DATA_COLUMNS)
+    create_sql = CREATE_SHOWS_TABLE.replace(
+        'CREATE TABLE IF NOT EXISTS shows (', 'CREATE TABLE shows_rebuild (', 1
+    )
+    
+    own_transaction = not conn.in_transaction
+    if own_transaction:
+        conn.execute("BEGIN")
+    try:
+        conn.execute(create_sql)
+        conn.execute(f"""
+            INSERT INTO shows_rebuild (rowid, {column_list})
+            SELECT rowid, {column_list} FROM shows
+        """)
+        conn.execute("DROP TABLE shows")
+        conn.execute("ALTER TABLE shows_rebuild RENAME TO shows")
+        if own_transaction:
+            conn.execute("COMMIT")
+    except Exception:
+        if own_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    
+    return True
+
+
+def add_venue_id_column(conn):
+    """
+    Add shows.venue_id to a table created before the venues table existed.
+    
+    A plain column, so ALTER TABLE is enough (no rebuild).
+    
+    Args:
+        conn: sqlite3.Connection to the database
+        
+    Returns:
+        bool: True if the column was added, False if already present
+    """
+    columns = [row[1] for row in conn.execute("PRAGMA table_xinfo(shows)")]
+    if 'venue_id' in columns:
+        return False
+    conn.execute("ALTER TABLE shows ADD COLUMN venue_id INTEGER REFERENCES venues(id)")
+    return True
 
 
 def get_schema_info():
@@ -150,17 +898,69 @@ def get_schema_info():
     """
     return {
         "version": get_schema_version(),
-        "tables": ["shows"],
+        "tables": [
+            "shows",
+            "shows_fts",
+            "stats_year",
+            "stats_month",
+            "stats_venue",
+            "stats_state",
+            "tracks",
+            "best_recording",
+            "best_recording_pending",
+            "search_places",
+            "search_trigrams",
+            "search_trigram_positions",
+            "venues",
+            "venue_aliases",
+            "validation_state"
+        ],
         "indexes": [
             "idx_date",
-            "idx_venue", 
             "idx_rating",
-            "idx_year",
+            "idx_year_date",
+            "idx_year_rating",
+            "idx_month_day",
             "idx_state",
-            "idx_date_rating"
+            "idx_date_rating",
+            "idx_stats_venue_count",
+            "idx_city_state",
+            "idx_venues_name_key",
+            "idx_venues_show_count",
+            "idx_venue_id"
+        ],
+        "triggers": [
+            "shows_fts_insert",
+            "shows_fts_delete",
+            "shows_fts_update",
+            "stats_insert",
+            "stats_delete",
+            "stats_update",
+            "tracks_delete",
+            "best_recording_insert",
+            "best_recording_delete",
+            "best_recording_update",
+            "best_recording_tracks",
+            "search_places_insert",
+            "search_places_delete",
+            "search_places_show_insert",
+            "search_places_show_delete",
+            "search_places_show_update",
+            "venues_resolve_insert",
+            "venues_resolve_update",
+            "venues_count_insert",
+            "venues_count_update",
+            "venues_count_delete",
+            "validation_state_delete"
         ],
-        "primary_keys": ["shows.identifier"],
-        "foreign_keys": [],  # None in Phase 3 (will add tracks table in Phase 4)
+        "primary_keys": ["shows.identifier", "tracks.(identifier, filename)",
+                         "best_recording.date", "best_recording_pending.date",
+                         "search_places.id", "search_trigrams.(trigram, place_id)",
+                         "venues.id", "venue_aliases.alias_key",
+                         "validation_state.identifier"],
+        "foreign_keys": ["shows.venue_id -> venues.id",
+                         "venue_aliases.venue_id -> venues.id"],
+        # tracks rows are removed by trigger, not FK
         "estimated_size": "5-10 MB for ~15,000 shows"
     }
 
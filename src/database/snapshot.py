@@ -0,0 +1,149 @@
+"""
+Read-Optimized Database Snapshots for DeadStream
+
+On the device shows.db is read almost exclusively, yet every connection
+opens it read-write with journaling, file locking and change detection.
+
+A snapshot is a separate, compacted copy of the database built for
+distribution and opened in a read-only mode:
+- Built from shows.db with the backup API, then VACUUMed at a chosen
+  page size, FTS-rebuilt and ANALYZEd so the planner has statistics
+- Opened through a file:...?immutable=1 URI: no locks, no journal, no
+  data_version checks
+- Memory-mapped I/O with a small page cache (see connection.py)
+
+A snapshot is never written to. To pick up new shows, build a new one
+(scripts/build_snapshot.py) and restart or call use_snapshot() again.
+
+Usage:
+    from src.database.snapshot import build_snapshot, use_snapshot
+
+    build_snapshot()           # data/shows.db -> data/shows.snapshot.db
+    use_snapshot()             # route the query layer to the snapshot
+"""
+
+import os
+import sqlite3
+import time
+from typing import Dict
+
+from .schema import DB_PATH, SNAPSHOT_PATH, REBUILD_SEARCH_INDEX
+from .connection import get_manager
+
+
+# Page size for snapshots. Matches the kernel page size on the Pi, so each
+# SQLite page maps onto exactly one memory-mapped OS page.
+SNAPSHOT_PAGE_SIZE = 4096
+
+# Valid SQLite page sizes
+VALID_PAGE_SIZES = (512, 1024, 2048, 4096, 8192, 16384, 32768, 65536)
+
+
+def build_snapshot(source: str = DB_PATH, dest: str = SNAPSHOT_PATH,
+                   page_size: int = SNAPSHOT_PAGE_SIZE) -> Dict:
+    """
+    Build a compacted, analyzed snapshot of a database.
+
+    The snapshot is written next to dest and moved into place only once
+    complete, so a running reader never sees a half-built file.
+
+    Args:
+        source: Database to copy (left untouched)
+        dest: Snapshot file to create or replace
+        page_size: SQLite page size for the snapshot
+
+    Returns:
+        dict with path, page_size, page_count, size_bytes, source_bytes
+        and seconds
+
+    Raises:
+        ValueError: If page_size is not a valid SQLite page size
+        FileNotFoundError: If source doesn't exist
+        sqlite3.DatabaseError: If the copy fails its integrity check
+    """
+    if page_size not in VALID_PAGE_SIZES:
+        raise ValueError(f"Invalid page size: {page_size} (expected one of {VALID_PAGE_SIZES})")
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"Database not found: {source}")
+
+    start = time.perf_counter()
+    temp_path = dest + '.tmp'
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    # Consistent copy even if the source is being written to
+    src_conn = sqlite3.connect(source)
+    conn = sqlite3.connect(temp_path, isolation_level=None)
+    try:
+        src_conn.backup(conn)
+    finally:
+        src_conn.close()
+
+    try:
+        # page_size only changes on VACUUM, and only outside WAL mode
+        conn.execute("PRAGMA journal_mode = DELETE")
+        conn.execute(f"PRAGMA page_size = {int(page_size)}")
+        conn.execute("VACUUM")
+
+        # VACUUM may renumber the rowids shows_fts points at
+        conn.execute(REBUILD_SEARCH_INDEX)
+        conn.execute("INSERT INTO shows_fts(shows_fts) VALUES ('optimize')")
+
+        conn.execute("ANALYZE")
+        # FTS rebuild and ANALYZE leave free pages behind
+        conn.execute("VACUUM")
+
+        result = conn.execute("PRAGMA integrity_check").fetchone()[0]
+        if result != 'ok':
+            raise sqlite3.DatabaseError(f"Snapshot integrity check failed: {result}")
+
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        actual_page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        conn.close()
+
+    # Readers holding the old snapshot must let go before it's replaced
+    get_manager(dest).close_all()
+    os.replace(temp_path, dest)
+
+    return {
+        'path': os.path.abspath(dest),
+        'page_size': actual_page_size,
+        'page_count': page_count,
+        'size_bytes': os.path.getsize(dest),
+        'source_bytes': os.path.getsize(source),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def use_snapshot(path: str = SNAPSHOT_PATH) -> bool:
+    """
+    Route the query layer (src.database.queries) to a snapshot file.
+
+    Args:
+        path: Snapshot file built by build_snapshot()
+
+    Returns:
+        bool: True if switched, False if the snapshot doesn't exist
+    """
+    if not os.path.exists(path):
+        return False
+
+    from . import queries
+
+    get_manager(path, read_only=True)
+    queries.DB_PATH = path
+    return True
+
+
+def use_database(path: str = DB_PATH):
+    """
+    Route the query layer back to the regular read-write database.
+
+    Args:
+        path: Database file (default data/shows.db)
+    """
+    from . import queries
+
+    get_manager(path, read_only=False)
+    queries.DB_PATH = path
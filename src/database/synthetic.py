@@ -0,0 +1,207 @@
+"""
+Synthetic Show Catalogue Generator for DeadStream
+
+Benchmarks need databases much larger than the real catalogue (about
+15,000 recordings) and must not depend on data/shows.db. This module
+generates deterministic synthetic catalogues with a realistic shape:
+- Show dates follow the band's touring history: yearly counts weighted
+  like the real years (busy 1969-1970, the 1975 hiatus), spring/summer/
+  fall tours, several recordings of each show
+- Venues follow a long-tailed distribution: a handful of famous venues
+  account for many shows, most venues appear once or twice
+- About a third of recordings have no reviews (NULL avg_rating); review
+  counts are long-tailed and ratings cluster around 4.2
+
+The same seed always produces the same catalogue.
+
+Usage:
+    from src.database.synthetic import build_catalogue
+
+    build_catalogue('/tmp/shows_100k.db', rows=100000)
+"""
+
+import os
+import random
+import sqlite3
+from typing import Iterator, Tuple
+
+from .migrations import migrate
+
+
+DEFAULT_SEED = 1965
+
+# Columns filled by generate_shows(), in tuple order
+SHOW_COLUMNS = ('identifier', 'date', 'venue', 'city', 'state',
+                'avg_rating', 'num_reviews', 'source_type', 'taper', 'last_updated')
+
+# Relative number of shows per year (approximately the real touring history)
+YEAR_WEIGHTS = {
+    1965: 30, 1966: 90, 1967: 110, 1968: 120, 1969: 150, 1970: 145,
+    1971: 85, 1972: 85, 1973: 75, 1974: 40, 1975: 4, 1976: 45,
+    1977: 60, 1978: 80, 1979: 75, 1980: 85, 1981: 85, 1982: 60,
+    1983: 65, 1984: 64, 1985: 71, 1986: 46, 1987: 86, 1988: 80,
+    1989: 74, 1990: 74, 1991: 76, 1992: 55, 1993: 81, 1994: 84, 1995: 47,
+}
+
+# Relative number of shows per month (spring, summer and fall tours)
+MONTH_WEIGHTS = [4, 6, 9, 10, 10, 9, 10, 6, 9, 11, 9, 7]
+
+# Famous venues first: they get the head of the long-tailed distribution
+FAMOUS_VENUES = [
+    ('Winterland Arena', 'San Francisco', 'CA'),
+    ('Fillmore West', 'San Francisco', 'CA'),
+    ('Madison Square Garden', 'New York', 'NY'),
+    ('Nassau Coliseum', 'Uniondale', 'NY'),
+    ('Oakland Coliseum Arena', 'Oakland', 'CA'),
+    ('Greek Theatre', 'Berkeley', 'CA'),
+    ('Shoreline Amphitheatre', 'Mountain View', 'CA'),
+    ('Capitol Theatre', 'Port Chester', 'NY'),
+    ('Fillmore East', 'New York', 'NY'),
+    ('Boston Garden', 'Boston', 'MA'),
+    ('Spectrum', 'Philadelphia', 'PA'),
+    ('Red Rocks Amphitheatre', 'Morrison', 'CO'),
+    ('Barton Hall, Cornell University', 'Ithaca', 'NY'),
+    ('Alpine Valley Music Theatre', 'East Troy', 'WI'),
+    ('Soldier Field', 'Chicago', 'IL'),
+    ('Kaiser Convention Center', 'Oakland', 'CA'),
+]
+
+VENUE_WORDS = ['Civic', 'Memorial', 'Municipal', 'Veterans', 'County', 'State',
+               'Pacific', 'Union', 'Lincoln', 'Palace', 'Royal', 'Riverside',
+               'Summit', 'Harbor', 'Valley', 'Lakeside', 'Grand', 'Orpheum',
+               'Paramount', 'Forum', 'Central', 'University', 'Capitol', 'Park']
+VENUE_KINDS = ['Auditorium', 'Arena', 'Coliseum', 'Theatre', 'Center',
+               'Stadium', 'Amphitheatre', 'Fieldhouse', 'Ballroom', 'Hall',
+               'Gymnasium', 'Pavilion']
+CITY_WORDS = ['Spring', 'Oak', 'Cedar', 'Maple', 'River', 'Lake', 'Hill',
+              'Green', 'Fair', 'Red', 'Stone', 'Pine', 'Clear', 'West', 'North']
+CITY_SUFFIXES = ['field', 'ville', 'ton', 'burg', ' City', ' Falls', 'wood',
+                 'port', ' Heights', 'dale']
+STATES = ['CA', 'CA', 'CA', 'NY', 'NY', 'NJ', 'PA', 'MA', 'IL', 'OH', 'MI',
+          'CO', 'OR', 'WA', 'TX', 'FL', 'GA', 'NC', 'VA', 'MD', 'CT', 'WI',
+          'MN', 'MO', 'AZ', 'UT', 'England', 'Germany', 'France']
+
+SOURCE_TYPES = [('aud', 50), ('sbd', 35), ('matrix', 15)]
+
+TAPERS = ['miller', 'hicks', 'vernon', 'bertha', 'seamons', 'bershaw',
+          'menke', 'cotsman', 'darby', 'koresh', 'gans', 'kaplan']
+
+# Venue popularity falls off as 1 / rank ** exponent
+VENUE_ZIPF_EXPONENT = 0.8
+
+# Mean recordings per show
+RECORDINGS_PER_SHOW = 7
+
+
+def _make_venues(rng: random.Random, count: int):
+    """Famous venues followed by generated ones, each with a fixed city/state"""
+    venues = list(FAMOUS_VENUES[:count])
+    names = {name for name, _, _ in venues}
+    while len(venues) < count:
+        name = f"{rng.choice(VENUE_WORDS)} {rng.choice(VENUE_KINDS)}"
+        if name in names:
+            name = f"{name} {len(venues)}"
+        names.add(name)
+        city = f"{rng.choice(CITY_WORDS)}{rng.choice(CITY_SUFFIXES)}"
+        venues.append((name, city, rng.choice(STATES)))
+    return venues
+
+
+def _rating(rng: random.Random) -> Tuple:
+    """(avg_rating, num_reviews) with ~35% unreviewed recordings"""
+    if rng.random() < 0.35:
+        return None, 0
+    num_reviews = max(1, int(rng.paretovariate(1.2)))
+    avg_rating = min(5.0, max(1.0, rng.gauss(4.2, 0.5)))
+    return round(avg_rating, 2), min(num_reviews, 500)
+
+
+def generate_shows(rows: int, seed: int = DEFAULT_SEED) -> Iterator[Tuple]:
+    """
+    Generate synthetic recordings
+
+    Args:
+        rows: Number of recordings (rows in shows)
+        seed: Random seed (same seed, same catalogue)
+
+    Yields:
+        Tuples in SHOW_COLUMNS order
+    """
+    rng = random.Random(seed)
+    years = list(YEAR_WEIGHTS)
+    year_weights = list(YEAR_WEIGHTS.values())
+    months = list(range(1, 13))
+    sources = [source for source, _ in SOURCE_TYPES]
+    source_weights = [weight for _, weight in SOURCE_TYPES]
+
+    venue_count = max(len(FAMOUS_VENUES), rows // 20)
+    venues = _make_venues(rng, venue_count)
+    # Zipf-like venue popularity: the top venue gets a few percent of shows
+    venue_weights = [1.0 / rank ** VENUE_ZIPF_EXPONENT
+                     for rank in range(1, venue_count + 1)]
+
+    serial = 0
+    while serial < rows:
+        year = rng.choices(years, year_weights)[0]
+        month = rng.choices(months, MONTH_WEIGHTS)[0]
+        date = f"{year}-{month:02d}-{rng.randint(1, 28):02d}"
+        venue, city, state = rng.choices(venues, venue_weights)[0]
+
+        recordings = 1 + int(rng.expovariate(1.0 / (RECORDINGS_PER_SHOW - 1)))
+        for _ in range(min(recordings, rows - serial)):
+            source_type = rng.choices(sources, source_weights)[0]
+            taper = rng.choice(TAPERS)
+            avg_rating, num_reviews = _rating(rng)
+            yield (
+                f"gd{date}.{source_type}.{taper}.{serial}",
+                date, venue, city, state,
+                avg_rating, num_reviews, source_type, taper,
+                '2025-12-20T15:30:00',
+            )
+            serial += 1
+
+
+def fill_catalogue(conn: sqlite3.Connection, rows: int, seed: int = DEFAULT_SEED):
+    """
+    Create the schema on conn and insert a synthetic catalogue
+
+    Args:
+        conn: Empty database connection (file or :memory:)
+        rows: Number of recordings
+        seed: Random seed
+    """
+    migrate(conn)
+    conn.executemany(f"""
+        INSERT INTO shows ({', '.join(SHOW_COLUMNS)})
+        VALUES ({', '.join('?' * len(SHOW_COLUMNS))})
+    """, generate_shows(rows, seed))
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.commit()
+
+
+def build_catalogue(path: str, rows: int, seed: int = DEFAULT_SEED) -> str:
+    """
+    Build a synthetic catalogue database file (replacing any existing file)
+
+    Args:
+        path: Database file to create
+        rows: Number of recordings
+        seed: Random seed
+
+    Returns:
+        path
+    """
+    for suffix in ('', '-wal', '-shm', '-journal'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    conn = sqlite3.connect(path)
+    try:
+        # Bulk load: durability doesn't matter for a throwaway file
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        fill_catalogue(conn, rows, seed)
+    finally:
+        conn.close()
+    return path
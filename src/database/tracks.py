@@ -0,0 +1,188 @@
+"""
+Local Track Storage for DeadStream
+
+Listing a show's audio files used to need a metadata request to
+archive.org every time a setlist was shown or playback started. The
+tracks table keeps that file list locally once it has been fetched.
+
+Rows are written by store_tracks() (lazily by get_audio_files() in
+src/api/metadata.py, or in bulk by populate_database.py --tracks) and
+read back by get_tracks() in the same shape as Archive.org file entries,
+so existing code that consumes extract_audio_files() output keeps working.
+
+Usage:
+    from src.database.tracks import get_tracks, store_tracks
+
+    files = get_tracks('gd77-05-08.sbd.hicks.4982.sbeok.shnf')
+    if not files:
+        store_tracks(identifier, rows)
+"""
+
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+from . import queries
+from .connection import get_manager
+
+
+# Archive.org formats treated as playable audio
+AUDIO_FORMATS = ('MP3', 'FLAC', 'OGG', 'VORBIS')
+
+# Derivative files skipped when storing (low-bitrate and duplicate VBR copies)
+SKIPPED_FILE_MARKERS = ('64kb', '_vbr')
+
+TRACK_COLUMNS = ('identifier', 'filename', 'title', 'set_name', 'track_number',
+                 'duration', 'format', 'size', 'md5')
+
+
+def _manager(db_path: Optional[str]):
+    """Manager for db_path, defaulting to the query layer's current database"""
+    return get_manager(db_path or queries.DB_PATH)
+
+
+def is_audio_file(file_info: Dict[str, Any]) -> bool:
+    """True if an Archive.org file entry is a playable, non-derivative audio file"""
+    file_format = (file_info.get('format') or '').upper()
+    filename = (file_info.get('name') or '').lower()
+    return (
+        bool(filename)
+        and any(fmt in file_format for fmt in AUDIO_FORMATS)
+        and not any(marker in filename for marker in SKIPPED_FILE_MARKERS)
+    )
+
+
+def parse_duration(value: Any) -> Optional[float]:
+    """
+    Parse an Archive.org 'length' value into seconds
+
+    Args:
+        value: Seconds ('685.12'), 'MM:SS' or 'HH:MM:SS'
+
+    Returns:
+        Duration in seconds, or None if missing or unparseable
+    """
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        pass
+    try:
+        seconds = 0.0
+        for part in str(value).split(':'):
+            seconds = seconds * 60 + float(part)
+        return seconds
+    except ValueError:
+        return None
+
+
+def _parse_int(value: Any) -> Optional[int]:
+    """int(value), or None for missing/non-numeric values ('3/12' -> 3)"""
+    if value is None:
+        return None
+    try:
+        return int(str(value).split('/')[0])
+    except ValueError:
+        return None
+
+
+def store_tracks(identifier: str, rows: List[Dict[str, Any]],
+                 db_path: str = None) -> int:
+    """
+    Replace the stored track list for a show
+
+    Args:
+        identifier: Show identifier
+        rows: Track dicts with any of TRACK_COLUMNS (filename required)
+        db_path: Database file (None = current query database)
+
+    Returns:
+        Number of tracks stored
+    """
+    values = [
+        (identifier, row['filename'], row.get('title') or None, row.get('set_name'),
+         _parse_int(row.get('track_number')), parse_duration(row.get('duration')),
+         row.get('format'), _parse_int(row.get('size')), row.get('md5'))
+        for row in rows
+    ]
+
+    with _manager(db_path).writer() as conn:
+        conn.execute("DELETE FROM tracks WHERE identifier = ?", (identifier,))
+        conn.executemany(f"""
+            INSERT OR REPLACE INTO tracks ({', '.join(TRACK_COLUMNS)})
+            VALUES ({', '.join('?' * len(TRACK_COLUMNS))})
+        """, values)
+
+    return len(values)
+
+
+def _row_to_file(row) -> Dict[str, Any]:
+    """Convert a tracks row into an Archive.org-style file entry"""
+    file_info = {
+        'name': row['filename'],
+        'format': row['format'],
+        'set_name': row['set_name'],
+    }
+    # Only include optional keys when known, matching Archive.org entries
+    # (callers use file_info.get('title', fallback))
+    if row['title']:
+        file_info['title'] = row['title']
+    if row['track_number'] is not None:
+        file_info['track'] = row['track_number']
+    if row['duration'] is not None:
+        file_info['length'] = row['duration']
+    if row['size'] is not None:
+        file_info['size'] = row['size']
+    if row['md5']:
+        file_info['md5'] = row['md5']
+    return file_info
+
+
+def get_tracks(identifier: str, format_preference: Optional[str] = 'MP3',
+               db_path: str = None) -> List[Dict[str, Any]]:
+    """
+    Get a show's stored audio files, in filename order
+
+    Args:
+        identifier: Show identifier
+        format_preference: Return only this format if the show has it
+                           (None = every stored format)
+        db_path: Database file (None = current query database)
+
+    Returns:
+        List of Archive.org-style file dicts (name, format, set_name and,
+        when known, title, track, length, size, md5); empty if the show's
+        tracks haven't been stored yet
+    """
+    conn = _manager(db_path).reader()
+    try:
+        rows = conn.execute("""
+            SELECT * FROM tracks
+            WHERE identifier = ?
+            ORDER BY filename
+        """, (identifier,)).fetchall()
+    except sqlite3.OperationalError:
+        # Database not migrated yet (no tracks table)
+        return []
+
+    files = [_row_to_file(row) for row in rows]
+
+    if format_preference and files:
+        preferred = [f for f in files
+                     if format_preference.upper() in (f['format'] or '').upper()]
+        if preferred:
+            return preferred
+
+    return files
+
+
+def has_tracks(identifier: str, db_path: str = None) -> bool:
+    """True if the show's track list is stored locally"""
+    conn = _manager(db_path).reader()
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM tracks WHERE identifier = ? LIMIT 1", (identifier,)
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return False
+    return row is not None
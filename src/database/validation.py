@@ -11,13 +11,26 @@ Validation checks include:
 - Duplicate detection
 - Data quality scoring
 - Database health reports
+
+Outcomes are stored per show (validation_state table), so after an
+incremental update only new and changed shows are checked again. Rows
+are streamed in batches and can be checked by a process pool.
+
+Usage:
+    from src.database.validation import validate_database
+
+    report = validate_database(incremental=True, jobs=4)
+    report.print_report()
 """
 
+import json
 import sqlite3
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
-from .schema import DB_PATH
+from .schema import DB_PATH, CREATE_VALIDATION_STATE_TABLE
 
 
 class ValidationReport:
@@ -99,6 +112,8 @@ class ValidationReport:
 # FIELD VALIDATION FUNCTIONS
 # ============================================================================
 
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
 def validate_date_format(date_str: str) -> Tuple[bool, Optional[str]]:
     """
     Validate that a date is in YYYY-MM-DD format
@@ -112,7 +127,7 @@ def validate_date_format(date_str: str) -> Tuple[bool, Optional[str]]:
     if not date_str:
         return False, "Date is empty"
     
-    if not re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
+    if not DATE_PATTERN.match(date_str):
         return False, f"Invalid date format: {date_str} (expected YYYY-MM-DD)"
     
     # Try to parse as actual date
@@ -215,8 +230,8 @@ def validate_show(show: Dict) -> List[str]:
         issues.append(f"DATE: {msg}")
     
     # Validate rating
-    avg_rating = show.get('avg_rating', 0.0)
-    num_reviews = show.get('num_reviews', 0)
+    avg_rating = show.get('avg_rating') or 0.0
+    num_reviews = show.get('num_reviews') or 0
     valid, msg = validate_rating(avg_rating, num_reviews)
     if not valid:
         issues.append(f"RATING: {msg}")
@@ -233,12 +248,161 @@ def validate_show(show: Dict) -> List[str]:
     return issues
 
 
-def validate_database(db_path: str = DB_PATH) -> ValidationReport:
+# ============================================================================
+# VALIDATION ENGINE - streamed, incremental, optionally parallel
+# ============================================================================
+
+# Bump when validate_show() changes, so stored outcomes are re-checked
+RULES_VERSION = 1
+
+# Rowids per range (the unit of work handed to a worker)
+BATCH_SIZE = 2000
+
+# Shows in one rowid range that need checking: never checked, checked by
+# older rules, or changed since (last_updated is the per-row watermark).
+# Rowid ranges read the table in storage order.
+_STALE_SHOWS_SQL = """
+    SELECT shows.* FROM shows
+    LEFT JOIN validation_state AS state ON state.identifier = shows.identifier
+    WHERE shows.rowid BETWEEN ? AND ?
+      AND (state.identifier IS NULL
+           OR state.rules != ?
+           OR state.last_updated IS NOT shows.last_updated)
+"""
+
+
+def validate_batch(columns: List[str], rows: List[tuple]) -> List[tuple]:
+    """
+    Validate a batch of shows
+
+    Args:
+        columns: shows column names, in row order
+        rows: Show rows as plain tuples
+
+    Returns:
+        List of validation_state rows:
+        (identifier, last_updated, rules, errors, warnings, issues JSON)
+    """
+    results = []
+    for row in rows:
+        show = dict(zip(columns, row))
+        issues = validate_show(show)
+        warnings = sum(1 for issue in issues if issue.startswith('WARNING:'))
+        results.append((show.get('identifier'), show.get('last_updated'), RULES_VERSION,
+                        len(issues) - warnings, warnings,
+                        json.dumps(issues) if issues else '[]'))
+    return results
+
+
+def validate_range(db_path: str, low: int, high: int) -> List[tuple]:
+    """
+    Read and validate the stale shows with rowid from low to high
+
+    Runs in a worker process when jobs > 1; the worker reads its rows
+    itself so only the results travel back to the parent.
+
+    Returns:
+        validation_state rows (see validate_batch())
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        return _validate_range(conn, low, high)
+    finally:
+        conn.close()
+
+
+def _validate_range(conn, low: int, high: int) -> List[tuple]:
+    """validate_range() on an open connection"""
+    cursor = conn.execute(_STALE_SHOWS_SQL, (low, high, RULES_VERSION))
+    columns = [column[0] for column in cursor.description]
+    return validate_batch(columns, cursor.fetchall())
+
+
+def _rowid_ranges(conn, batch_size: int) -> List[Tuple[int, int]]:
+    """Split the shows rowids into inclusive ranges of batch_size"""
+    low, high = conn.execute("SELECT MIN(rowid), MAX(rowid) FROM shows").fetchone()
+    if low is None:
+        return []
+    return [(start, min(start + batch_size - 1, high))
+            for start in range(low, high + 1, batch_size)]
+
+
+def _store_results(conn, results: List[tuple]):
+    """Write and commit one range of validation outcomes"""
+    conn.executemany("""
+        INSERT OR REPLACE INTO validation_state
+        (identifier, last_updated, rules, errors, warnings, issues)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, results)
+    conn.commit()
+
+
+def refresh_validation_state(db_path: str = DB_PATH, incremental: bool = True,
+                             jobs: int = 1, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Validate the shows whose stored outcome is missing or out of date
+
+    The table is split into rowid ranges of batch_size shows.
+    With jobs > 1 each range is read and checked by a process pool while
+    this process writes finished ranges back; at most 2 ranges per worker
+    are in flight. Each range is committed as it finishes, so an
+    interrupted run keeps the ranges already checked.
+
+    Args:
+        db_path: Path to database file
+        incremental: Only check new and changed shows (False = all)
+        jobs: Worker processes (1 = validate in this process)
+        batch_size: Rowids per range
+
+    Returns:
+        Number of shows checked
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(CREATE_VALIDATION_STATE_TABLE)
+        if not incremental:
+            conn.execute("DELETE FROM validation_state")
+        conn.commit()
+        ranges = _rowid_ranges(conn, batch_size)
+
+        checked = 0
+        if jobs <= 1:
+            for low, high in ranges:
+                results = _validate_range(conn, low, high)
+                _store_results(conn, results)
+                checked += len(results)
+            return checked
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            pending = deque()
+            for low, high in ranges:
+                pending.append(pool.submit(validate_range, db_path, low, high))
+                while len(pending) >= jobs * 2:
+                    results = pending.popleft().result()
+                    _store_results(conn, results)
+                    checked += len(results)
+            while pending:
+                results = pending.popleft().result()
+                _store_results(conn, results)
+                checked += len(results)
+        return checked
+    finally:
+        conn.close()
+
+
+def validate_database(db_path: str = DB_PATH, incremental: bool = False,
+                      jobs: int = 1) -> ValidationReport:
     """
     Validate entire database
     
+    Outcomes are kept per show in validation_state, so the report always
+    covers every show while an incremental run only re-checks new and
+    changed ones.
+    
     Args:
         db_path: Path to database file
+        incremental: Only re-check shows changed since their last check
+        jobs: Worker processes used for checking (1 = no pool)
         
     Returns:
         ValidationReport with results
@@ -246,51 +410,44 @@ def validate_database(db_path: str = DB_PATH) -> ValidationReport:
     report = ValidationReport()
     
     try:
+        checked = refresh_validation_state(db_path, incremental=incremental, jobs=jobs)
+        
         conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
+        report.add_stat("Validation mode", 'incremental' if incremental else 'full')
+        report.add_stat("Shows checked this run", checked)
         
-        # Get all shows
-        cursor.execute("SELECT * FROM shows")
-        shows = cursor.fetchall()
-        report.total_shows = len(shows)
-        
-        # Validate each show
-        for row in shows:
-            show = {key: row[key] for key in row.keys()}
-            issues = validate_show(show)
-            
-            identifier = show.get('identifier', 'UNKNOWN')
-            
-            for issue in issues:
+        # Every stored problem, in identifier order
+        cursor.execute("""
+            SELECT identifier, issues FROM validation_state
+            WHERE errors > 0 OR warnings > 0
+            ORDER BY identifier
+        """)
+        for identifier, issues in cursor:
+            for issue in json.loads(issues):
                 if issue.startswith('WARNING:'):
                     report.add_warning(identifier, issue.replace('WARNING: ', ''))
                 else:
                     report.add_error(identifier, issue)
         
-        # Calculate statistics
-        cursor.execute("SELECT COUNT(*) FROM shows WHERE venue IS NOT NULL")
-        with_venue = cursor.fetchone()[0]
+        # Calculate statistics (one pass over the table)
+        cursor.execute("""
+            SELECT COUNT(*), COUNT(venue), COUNT(city), COUNT(state),
+                   COUNT(CASE WHEN avg_rating > 0 THEN 1 END),
+                   AVG(CASE WHEN avg_rating > 0 THEN avg_rating END)
+            FROM shows
+        """)
+        (report.total_shows, with_venue, with_city, with_state,
+         with_rating, avg_rating) = cursor.fetchone()
+        
         report.add_stat("Shows with venue", with_venue)
         report.add_stat("Shows missing venue (%)", 
                        (report.total_shows - with_venue) / max(report.total_shows, 1) * 100)
-        
-        cursor.execute("SELECT COUNT(*) FROM shows WHERE city IS NOT NULL")
-        with_city = cursor.fetchone()[0]
         report.add_stat("Shows with city", with_city)
-        
-        cursor.execute("SELECT COUNT(*) FROM shows WHERE state IS NOT NULL")
-        with_state = cursor.fetchone()[0]
         report.add_stat("Shows with state", with_state)
-        
-        cursor.execute("SELECT COUNT(*) FROM shows WHERE avg_rating > 0")
-        with_rating = cursor.fetchone()[0]
         report.add_stat("Shows with ratings", with_rating)
         report.add_stat("Shows rated (%)", 
                        with_rating / max(report.total_shows, 1) * 100)
-        
-        cursor.execute("SELECT AVG(avg_rating) FROM shows WHERE avg_rating > 0")
-        avg_rating = cursor.fetchone()[0]
         if avg_rating:
             report.add_stat("Average rating (rated shows)", f"{avg_rating:.2f}")
         
@@ -306,10 +463,23 @@ def validate_database(db_path: str = DB_PATH) -> ValidationReport:
 # DUPLICATE DETECTION
 # ============================================================================
 
+def _identifier_is_unique(conn) -> bool:
+    """True if a PRIMARY KEY or UNIQUE index covers shows.identifier alone"""
+    for _, name, unique, _, _ in conn.execute("PRAGMA index_list(shows)"):
+        if unique:
+            columns = [row[2] for row in conn.execute(f"PRAGMA index_info('{name}')")]
+            if columns == ['identifier']:
+                return True
+    return False
+
+
 def find_duplicate_identifiers(db_path: str = DB_PATH) -> List[Tuple[str, int]]:
     """
     Find any duplicate identifiers (should never happen with PRIMARY KEY)
     
+    The table is only scanned when no unique index guarantees
+    identifiers are distinct (a damaged or hand-built database).
+    
     Args:
         db_path: Path to database file
         
@@ -319,6 +489,10 @@ def find_duplicate_identifiers(db_path: str = DB_PATH) -> List[Tuple[str, int]]:
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
+    if _identifier_is_unique(conn):
+        conn.close()
+        return []
+    
     cursor.execute("""
         SELECT identifier, COUNT(*) as count
         FROM shows
@@ -336,6 +510,9 @@ def find_duplicate_shows(db_path: str = DB_PATH) -> List[Tuple[str, str, int]]:
     """
     Find shows on the same date at the same venue (multiple recordings)
     
+    Groups on venue_id, so spelling variants of a venue count together
+    and the grouping reads only the (venue_id, date) index.
+    
     Args:
         db_path: Path to database file
         
@@ -346,12 +523,16 @@ def find_duplicate_shows(db_path: str = DB_PATH) -> List[Tuple[str, str, int]]:
     cursor = conn.cursor()
     
     cursor.execute("""
-        SELECT date, venue, COUNT(*) as count
-        FROM shows
-        WHERE venue IS NOT NULL
-        GROUP BY date, venue
-        HAVING count > 1
-        ORDER BY count DESC, date DESC
+        SELECT recordings.date, venues.name, recordings.count
+        FROM (
+            SELECT venue_id, date, COUNT(*) as count
+            FROM shows
+            WHERE venue_id IS NOT NULL
+            GROUP BY venue_id, date
+            HAVING count > 1
+        ) AS recordings
+        JOIN venues ON venues.id = recordings.venue_id
+        ORDER BY recordings.count DESC, recordings.date DESC
         LIMIT 50
     """)
     
@@ -365,19 +546,22 @@ def find_duplicate_shows(db_path: str = DB_PATH) -> List[Tuple[str, str, int]]:
 # DATA QUALITY REPORTS
 # ============================================================================
 
-def generate_quality_report(db_path: str = DB_PATH):
+def generate_quality_report(db_path: str = DB_PATH, incremental: bool = False,
+                            jobs: int = 1):
     """
     Generate a comprehensive data quality report
     
     Args:
         db_path: Path to database file
+        incremental: Only re-check shows changed since their last check
+        jobs: Worker processes used for checking
     """
     print("\n" + "="*60)
     print("DATA QUALITY REPORT")
     print("="*60)
     
     # Run validation
-    report = validate_database(db_path)
+    report = validate_database(db_path, incremental=incremental, jobs=jobs)
     
     # Check for duplicate identifiers
     dup_ids = find_duplicate_identifiers(db_path)
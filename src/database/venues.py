@@ -0,0 +1,192 @@
+"""
+Venue Normalization for DeadStream
+
+Every show used to carry its venue as free text, so the same hall was
+stored thousands of times and spelled several ways ("Capitol Theater",
+"The Capitol Theatre", "Winterland Ballroom"), which split venue counts
+and browsing. Venues now live once in the venues table and shows point
+at them through shows.venue_id (see schema.py).
+
+How a venue is recognized:
+- venue_key is the normalized name plus city and state, computed in SQL
+  (schema.VENUE_KEY_SQL): case, punctuation, a leading "The" and common
+  spelling variants (Theater/Theatre, Ctr/Center, ...) don't matter
+- The first spelling seen for a key becomes the canonical name, which
+  is also written to shows.venue for display and full-text search
+- Spellings that differ by more than that (an old name of the hall) are
+  folded in with rename_venue(); the old key is kept in venue_aliases so
+  later imports of that spelling land on the same venue
+
+Shows inserted with only venue/city/state are linked by trigger. The
+ingest scripts call resolve_venue() themselves so they can store the
+canonical name as well.
+
+Usage:
+    from src.database.venues import resolve_venue
+
+    venue_id, venue = resolve_venue(conn, 'Capitol Theater', 'Passaic', 'NJ')
+    conn.execute("INSERT INTO shows (identifier, date, venue, venue_id, ...) ...")
+"""
+
+from typing import Dict, Optional, Tuple
+
+from .schema import VENUE_KEY_SQL, VENUE_NAME_KEY_SQL
+
+
+# Venues that appear under names normalization can't match:
+# (spelling in the archive, canonical name)
+KNOWN_VENUE_ALIASES = [
+    ('Winterland', 'Winterland Arena'),
+    ('Winterland Ballroom', 'Winterland Arena'),
+    ('Nassau Veterans Memorial Coliseum', 'Nassau Coliseum'),
+    ('Fillmore East Auditorium', 'Fillmore East'),
+]
+
+_KEYS_SQL = f"""
+    WITH requested(name, city, state) AS (VALUES (?, ?, ?))
+    SELECT {VENUE_NAME_KEY_SQL.format(name='requested.name')},
+           {VENUE_KEY_SQL.format(name='requested.name', city='requested.city',
+                                 state='requested.state')}
+    FROM requested
+"""
+
+
+def venue_keys(conn, name: str, city: Optional[str] = None,
+               state: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Compute the keys a venue is matched on
+
+    Args:
+        conn: sqlite3.Connection
+        name: Venue name as spelled in the source
+        city: City name
+        state: State code
+
+    Returns:
+        (name_key, venue_key)
+    """
+    return tuple(conn.execute(_KEYS_SQL, (name, city, state)).fetchone())
+
+
+def resolve_venue(conn, name: Optional[str], city: Optional[str] = None,
+                  state: Optional[str] = None) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Find the venue for a name/city/state, creating it if it is new
+
+    Args:
+        conn: sqlite3.Connection (the caller commits)
+        name: Venue name as spelled in the source
+        city: City name
+        state: State code
+
+    Returns:
+        (venue_id, canonical name), or (None, name) if name is empty
+    """
+    if not name:
+        return None, name
+
+    name_key, venue_key = venue_keys(conn, name, city, state)
+    row = conn.execute("""
+        SELECT id, name FROM venues
+        WHERE id = coalesce(
+            (SELECT venue_id FROM venue_aliases WHERE alias_key = ?),
+            (SELECT id FROM venues WHERE venue_key = ?)
+        )
+    """, (venue_key, venue_key)).fetchone()
+    if row:
+        return row[0], row[1]
+
+    cursor = conn.execute("""
+        INSERT INTO venues (name, city, state, name_key, venue_key)
+        VALUES (?, ?, ?, ?, ?)
+    """, (name, city, state, name_key, venue_key))
+    return cursor.lastrowid, name
+
+
+def merge_venue(conn, from_id: int, into_id: int):
+    """
+    Move every show of one venue to another and remove the first
+
+    The removed venue's key becomes an alias, so future imports of that
+    spelling resolve to into_id.
+
+    Args:
+        conn: sqlite3.Connection (the caller commits)
+        from_id: Venue to merge away
+        into_id: Venue that keeps the shows
+    """
+    if from_id == into_id:
+        return
+
+    conn.execute("""
+        UPDATE shows
+        SET venue_id = ?, venue = (SELECT name FROM venues WHERE id = ?)
+        WHERE venue_id = ?
+    """, (into_id, into_id, from_id))
+    conn.execute("""
+        INSERT OR REPLACE INTO venue_aliases (alias_key, venue_id)
+        SELECT venue_key, ? FROM venues WHERE id = ?
+    """, (into_id, from_id))
+    conn.execute("UPDATE venue_aliases SET venue_id = ? WHERE venue_id = ?",
+                 (into_id, from_id))
+    conn.execute("DELETE FROM venues WHERE id = ?", (from_id,))
+
+
+def rename_venue(conn, venue_id: int, name: str) -> int:
+    """
+    Give a venue a new canonical name
+
+    If the venue's city already has a venue under that name, the two are
+    merged instead.
+
+    Args:
+        conn: sqlite3.Connection (the caller commits)
+        venue_id: Venue to rename
+        name: New canonical name
+
+    Returns:
+        id of the venue that now holds the shows
+    """
+    city, state, old_key = conn.execute(
+        "SELECT city, state, venue_key FROM venues WHERE id = ?", (venue_id,)
+    ).fetchone()
+    name_key, venue_key = venue_keys(conn, name, city, state)
+
+    existing = conn.execute(
+        "SELECT id FROM venues WHERE venue_key = ?", (venue_key,)
+    ).fetchone()
+    if existing and existing[0] != venue_id:
+        merge_venue(conn, venue_id, existing[0])
+        return existing[0]
+
+    conn.execute("""
+        UPDATE venues SET name = ?, name_key = ?, venue_key = ? WHERE id = ?
+    """, (name, name_key, venue_key, venue_id))
+    if old_key != venue_key:
+        conn.execute("""
+            INSERT OR REPLACE INTO venue_aliases (alias_key, venue_id) VALUES (?, ?)
+        """, (old_key, venue_id))
+    conn.execute("UPDATE shows SET venue = ? WHERE venue_id = ?", (name, venue_id))
+    return venue_id
+
+
+def apply_known_aliases(conn) -> Dict[str, int]:
+    """
+    Fold the spellings in KNOWN_VENUE_ALIASES into their canonical venues
+
+    Args:
+        conn: sqlite3.Connection (the caller commits)
+
+    Returns:
+        dict with renamed and merged venue counts
+    """
+    result = {'renamed': 0, 'merged': 0}
+    for alias, canonical in KNOWN_VENUE_ALIASES:
+        alias_key, _ = venue_keys(conn, alias)
+        venues = conn.execute(
+            "SELECT id FROM venues WHERE name_key = ?", (alias_key,)
+        ).fetchall()
+        for (venue_id,) in venues:
+            kept = rename_venue(conn, venue_id, canonical)
+            result['merged' if kept != venue_id else 'renamed'] += 1
+    return result
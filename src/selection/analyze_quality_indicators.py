@@ -14,15 +14,22 @@ Learning goals:
 import sys
 sys.path.insert(0, '/home/david/deadstream')
 
-from src.database.queries import get_show_by_date
+from src.database.queries import get_show_by_date, get_shows_by_dates
+from src.api.async_client import get_metadata_batch
 from src.api.metadata import get_metadata
-import time
 
 
-def analyze_show_date(date):
+def analyze_show_date(date, shows=None, metadata_by_id=None):
     """
     Analyze all recordings available for a specific date.
     
+    Args:
+        date: Show date (YYYY-MM-DD)
+        shows: Recordings for the date if already looked up
+               (None = query the database)
+        metadata_by_id: Prefetched metadata (or exception) by identifier,
+                        from get_metadata_batch() (None = fetch each)
+    
     Returns dict with analysis results.
     """
     print(f"\n{'='*70}")
@@ -30,7 +37,8 @@ def analyze_show_date(date):
     print(f"{'='*70}\n")
     
     # Get all recordings for this date
-    shows = get_show_by_date(date)
+    if shows is None:
+        shows = get_show_by_date(date)
     
     if not shows:
         print("[INFO] No recordings found for this date")
@@ -47,8 +55,13 @@ def analyze_show_date(date):
         
         # Get full metadata
         try:
-            metadata = get_metadata(show['identifier'])
-            time.sleep(0.5)  # Rate limiting
+            # Rate limiting is shared by every API client (rate_limiter.py)
+            if metadata_by_id is None:
+                metadata = get_metadata(show['identifier'])
+            else:
+                metadata = metadata_by_id[show['identifier']]
+                if isinstance(metadata, Exception):
+                    raise metadata
             
             # Extract quality indicators
             indicators = extract_quality_indicators(metadata)
@@ -158,8 +171,16 @@ def analyze_multiple_dates(dates):
     
     all_results = []
     
+    # One query for every date's recordings
+    shows_by_date = get_shows_by_dates(dates)
+    
+    # Fetch every recording's metadata concurrently, within the rate limit
+    metadata_by_id = get_metadata_batch(
+        show['identifier'] for shows in shows_by_date.values() for show in shows
+    )
+    
     for date in dates:
-        result = analyze_show_date(date)
+        result = analyze_show_date(date, shows_by_date.get(date, []), metadata_by_id)
         if result:
             all_results.append(result)
     
@@ -0,0 +1,215 @@
+"""
+Best Recording Index for DeadStream
+
+Most concert dates have several recordings. Picking one used to mean
+scoring every recording of the date with RecordingScorer on each
+request. This module scores them in batches instead and stores the
+winner for each date, with its component scores, in the best_recording
+table. Date and calendar selection then become a single primary-key
+lookup (get_best_recording() in src/database/queries.py).
+
+Only data already in the database is scored, so a refresh never touches
+the network:
+- Source, taper and community rating come from the shows table
+- Audio format comes from the tracks table for shows whose tracks are
+  stored; other recordings score as unknown format
+
+Refreshes are incremental:
+- Triggers queue a date in best_recording_pending whenever one of its
+  recordings is added, removed, re-rated or gets its tracks stored
+- Rows scored with weights other than the scorer's are queued again, so
+  a change to the PreferenceManager weights takes effect on the next
+  refresh
+
+Usage:
+    from src.selection.best_recording import refresh_best_recordings
+
+    stats = refresh_best_recordings()
+    print(f"{stats['scored']} dates scored in {stats['seconds']:.2f}s")
+"""
+
+import json
+import sqlite3
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.database import queries
+from src.database.connection import get_manager
+from src.database.schema import QUEUE_ALL_BEST_RECORDINGS
+from .scoring import RecordingScorer
+
+
+# Dates scored per write transaction (keeps the writer lock short)
+BATCH_SIZE = 500
+
+SCORE_COLUMNS = ('total_score', 'source_score', 'format_score', 'rating_score',
+                 'lineage_score', 'taper_score')
+
+
+def weights_key(weights: Dict[str, float]) -> str:
+    """Canonical JSON for a set of scoring weights (stored with each row)"""
+    return json.dumps(weights, sort_keys=True)
+
+
+def default_scorer() -> RecordingScorer:
+    """Scorer using the weights saved in the user's preferences"""
+    from .preferences import PreferenceManager
+    return RecordingScorer(preference_manager=PreferenceManager())
+
+
+def recording_inputs(show: Any, formats: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build the RecordingScorer metadata dict for a show row
+
+    Args:
+        show: Show record or dict with the shows table columns
+        formats: Comma-separated audio formats of the stored tracks
+
+    Returns:
+        dict with the keys score_recording() reads
+    """
+    return {
+        'identifier': show['identifier'],
+        'source': show.get('source_type') or '',
+        'format': formats or '',
+        'avg_rating': show.get('avg_rating'),
+        'num_reviews': show.get('num_reviews'),
+        'taper': show.get('taper') or '',
+    }
+
+
+def _score_dates(conn, dates: List[str], scorer: RecordingScorer,
+                 weights: str) -> int:
+    """
+    Rescore dates and store their winners (inside the writer transaction)
+
+    Returns:
+        Number of dates that still have recordings
+    """
+    requested = json.dumps(dates)
+    # Dequeue first: this takes the write lock, so a show inserted while
+    # we score waits for our commit and queues its date again
+    conn.execute("""
+        DELETE FROM best_recording_pending
+        WHERE date IN (SELECT value FROM json_each(?))
+    """, (requested,))
+
+    cursor = conn.execute("""
+        SELECT shows.identifier, shows.date, shows.source_type, shows.taper,
+               shows.avg_rating, shows.num_reviews,
+               (SELECT group_concat(DISTINCT format) FROM tracks
+                WHERE tracks.identifier = shows.identifier) AS formats
+        FROM json_each(?) AS requested
+        JOIN shows ON shows.date = requested.value
+        ORDER BY shows.date, shows.avg_rating DESC, shows.identifier
+    """, (requested,))
+
+    recordings: Dict[str, List[Dict]] = {}
+    for identifier, date, source_type, taper, avg_rating, num_reviews, formats in cursor:
+        show = {'identifier': identifier, 'source_type': source_type, 'taper': taper,
+                'avg_rating': avg_rating, 'num_reviews': num_reviews}
+        recordings.setdefault(date, []).append(recording_inputs(show, formats))
+
+    scored_at = datetime.now().isoformat(timespec='seconds')
+    rows = []
+    for date, candidates in recordings.items():
+        # compare_recordings() sorts stably, so ties keep the best rated
+        best = scorer.compare_recordings(candidates)[0]
+        rows.append((date, best['identifier'])
+                    + tuple(best[column] for column in SCORE_COLUMNS)
+                    + (len(candidates), weights, scored_at))
+
+    conn.executemany(f"""
+        INSERT OR REPLACE INTO best_recording
+        (date, identifier, {', '.join(SCORE_COLUMNS)}, recording_count, weights, scored_at)
+        VALUES ({', '.join('?' * (len(SCORE_COLUMNS) + 5))})
+    """, rows)
+
+    # Every recording of these dates is gone
+    conn.executemany("DELETE FROM best_recording WHERE date = ?",
+                     [(date,) for date in dates if date not in recordings])
+    return len(rows)
+
+
+def refresh_best_recordings(db_path: str = None, scorer: RecordingScorer = None,
+                            full: bool = False,
+                            batch_size: int = BATCH_SIZE) -> Dict[str, Any]:
+    """
+    Rescore the dates whose best recording may have changed
+
+    Args:
+        db_path: Database file (None = current query database)
+        scorer: Scorer to use (None = weights from PreferenceManager)
+        full: Rescore every date, not just queued and stale ones
+        batch_size: Dates scored per transaction
+
+    Returns:
+        dict with scored (dates stored), removed (dates without
+        recordings any more) and seconds
+    """
+    manager = get_manager(db_path or queries.DB_PATH)
+    scorer = scorer or default_scorer()
+    weights = weights_key(scorer.weights)
+    start = time.perf_counter()
+
+    with manager.writer() as conn:
+        if full:
+            conn.execute(QUEUE_ALL_BEST_RECORDINGS)
+        # Rows scored with other weights are stale
+        conn.execute("""
+            INSERT OR IGNORE INTO best_recording_pending (date)
+            SELECT date FROM best_recording WHERE weights != ?
+        """, (weights,))
+
+    scored = removed = 0
+    while True:
+        with manager.writer() as conn:
+            dates = [row[0] for row in conn.execute(
+                "SELECT date FROM best_recording_pending LIMIT ?", (batch_size,)
+            )]
+            if not dates:
+                break
+            count = _score_dates(conn, dates, scorer, weights)
+        scored += count
+        removed += len(dates) - count
+
+    return {
+        'scored': scored,
+        'removed': removed,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def get_stored_best(date: str, scorer: RecordingScorer = None,
+                    db_path: str = None) -> Optional[str]:
+    """
+    Get the stored best recording of a date, if it is current
+
+    Args:
+        date: Date in YYYY-MM-DD format
+        scorer: Only accept rows scored with this scorer's weights
+                (None = any weights)
+        db_path: Database file (None = current query database)
+
+    Returns:
+        Identifier, or None if the date is unscored, queued for
+        rescoring or was scored with other weights
+    """
+    conn = get_manager(db_path or queries.DB_PATH).reader()
+    try:
+        row = conn.execute("""
+            SELECT identifier, weights FROM best_recording
+            WHERE date = ?
+              AND NOT EXISTS (SELECT 1 FROM best_recording_pending WHERE date = ?)
+        """, (date, date)).fetchone()
+    except sqlite3.OperationalError as e:
+        if 'no such table' not in str(e):
+            raise
+        return None  # Database predates the best_recording table
+
+    if row is None:
+        return None
+    if scorer is not None and row[1] != weights_key(scorer.weights):
+        return None
+    return row[0]
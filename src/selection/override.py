@@ -32,6 +32,7 @@ sys.path.insert(0, PROJECT_ROOT)
 from src.database.queries import get_show_by_date
 from src.api.metadata import get_metadata, extract_audio_files
 from src.selection.scoring import RecordingScorer
+from src.selection.best_recording import get_stored_best, recording_inputs
 from typing import List, Dict, Optional
 
 
@@ -90,6 +91,13 @@ class RecordingSelector:
         Returns:
             Identifier of best recording, or None if no recordings found
         """
+        # Stored result from the best_recording batch job, if it was
+        # scored with this selector's weights and is up to date
+        stored = get_stored_best(date, self.scorer)
+        if stored:
+            print(f"[INFO] Automatic selection (stored): {stored}")
+            return stored
+        
         recordings = self.list_recordings_for_show(date)
         
         if not recordings:
@@ -103,7 +111,9 @@ class RecordingSelector:
         
         # Use scorer to select best
         print(f"[INFO] Analyzing {len(recordings)} recordings...")
-        best_identifier = self.scorer.select_best(recordings)
+        best_identifier = self.scorer.select_best(
+            [recording_inputs(recording) for recording in recordings]
+        )
         
         if best_identifier:
             print(f"[INFO] Automatic selection: {best_identifier}")
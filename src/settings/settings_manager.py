@@ -64,6 +64,9 @@ class SettingsManager:
             'time_format_24h': False,
             'date_format': 'US',  # US (MM/DD/YYYY) or International (DD/MM/YYYY)
         },
+        'database': {
+            'open_mode': 'readwrite',  # readwrite or snapshot (read-only shows.snapshot.db)
+        },
         'app': {
             'last_screen': 'browse',  # player, browse, settings
             'show_splash': True,
@@ -403,6 +406,11 @@ class SettingsManager:
         except (ValueError, TypeError):
             warnings.append(f"Invalid screen timeout value: {timeout}")
         
+        # Validate database settings
+        open_mode = self.get('database', 'open_mode', 'readwrite')
+        if open_mode not in ['readwrite', 'snapshot']:
+            warnings.append(f"Invalid database open_mode: {open_mode}")
+
         # Validate app settings
         last_screen = self.get('app', 'last_screen', 'browse')
         valid_screens = ['player', 'browse', 'settings']
@@ -54,7 +54,7 @@ class ConcertListItem(QWidget):
     """
     
     # Signal emitted when item is clicked
-    clicked = pyqtSignal(dict)
+    clicked = pyqtSignal(object)  # Show record or dict
     
     def __init__(self, show_data, show_divider=True, parent=None):
         """
@@ -4,6 +4,7 @@ Main window for DeadStream application.
 Integrates screen manager and navigation system.
 """
 import sys
+import threading
 from PyQt5.QtWidgets import QMainWindow, QApplication, QPushButton, QWidget, QVBoxLayout
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QPalette, QColor
@@ -23,6 +24,9 @@ from src.ui.screens.randomshow_screen import RandomShowScreen
 from src.ui.widgets.now_playing_bar import NowPlayingBar
 from src.ui.transitions import TransitionType
 from src.settings import get_settings
+from src.database import upgrade_database
+from src.database.snapshot import use_snapshot
+from src.selection.best_recording import refresh_best_recordings
 
 
 class MainWindow(QMainWindow):
@@ -384,24 +388,19 @@ class MainWindow(QMainWindow):
         """Handle date selection from find a show screen"""
         print(f"[INFO] Date selected from find a show screen: {date_str}")
 
-        # Query database for shows on this date
-        from src.database.queries import get_show_by_date
-        shows = get_show_by_date(date_str)
+        # Stored best recording for this date (single indexed lookup)
+        from src.database.queries import get_best_recording
+        show = get_best_recording(date_str)
 
-        if not shows:
+        if show is None:
             print(f"[WARNING] No shows found for date: {date_str}")
             # Could show a message to the user here
             return
 
-        if len(shows) == 1:
-            # Single show found - load it directly
-            print(f"[INFO] Found 1 show for {date_str}, loading it")
-            self.on_show_selected(shows[0])
-        else:
-            # Multiple shows found - for now, load the first one
-            # TODO: In the future, could show a selection dialog
-            print(f"[INFO] Found {len(shows)} shows for {date_str}, loading first one")
-            self.on_show_selected(shows[0])
+        # TODO: In the future, could show a selection dialog when a date
+        # has several recordings
+        print(f"[INFO] Loading best recording for {date_str}: {show['identifier']}")
+        self.on_show_selected(show)
 
     def on_screen_changed(self, screen_name):
         """
@@ -691,6 +690,21 @@ class MainWindow(QMainWindow):
         print("[INFO] NowPlayingBar hidden")
 
 
+def start_best_recording_refresh():
+    """
+    Rescore queued dates in the background (new recordings, or scoring
+    weights changed in preferences since the last run)
+    """
+    def run():
+        try:
+            result = refresh_best_recordings()
+            print(f"[INFO] Best recordings rescored for {result['scored']} date(s)")
+        except Exception as e:
+            print(f"[WARN] Best recording refresh failed: {e}")
+
+    threading.Thread(target=run, name='best-recording-refresh', daemon=True).start()
+
+
 def main():
     """Main entry point for the application"""
     try:
@@ -698,6 +712,19 @@ def main():
         
         print("[INFO] Starting DeadStream application")
         
+        # Bring an existing database up to the current schema
+        upgrade_database()
+        
+        # Optionally serve browse queries from the read-only snapshot
+        if get_settings().get('database', 'open_mode', 'readwrite') == 'snapshot':
+            if use_snapshot():
+                print("[INFO] Using read-only database snapshot")
+            else:
+                print("[WARN] Snapshot mode set but no snapshot found, using shows.db")
+                start_best_recording_refresh()
+        else:
+            start_best_recording_refresh()
+        
         window = MainWindow()
         window.show()
         
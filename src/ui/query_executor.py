@@ -0,0 +1,240 @@
+"""
+Background query executor for DeadStream UI
+
+Runs src/database/queries.py functions on a small worker pool so slow
+reads (SD card, cold page cache) never freeze the touchscreen. Results
+come back on the Qt main thread through signals and optional callbacks.
+
+Requests are grouped into channels. Submitting to a channel supersedes
+whatever was submitted there before: the older request is cancelled, its
+SQLite statement interrupted if it is still running, and any result it
+still produces is dropped. A tap on "Top Rated" followed quickly by a
+year therefore only ever shows the year.
+
+Usage:
+    executor = QueryExecutor(self)
+    executor.submit(get_top_rated_shows, 50,
+                    channel='content',
+                    on_result=self.show_list.load_shows,
+                    on_error=self.on_query_error)
+"""
+
+import threading
+from itertools import count
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+from src.database import queries
+from src.database.connection import get_manager
+
+
+class _TaskSignals(QObject):
+    """Signals a worker uses to report back (QRunnable can't emit)"""
+    finished = pyqtSignal(int, object)  # request_id, result
+    failed = pyqtSignal(int, object)    # request_id, exception
+    done = pyqtSignal(int)              # request_id, always last
+
+
+class _QueryTask(QRunnable):
+    """One query call running on a pool thread"""
+
+    def __init__(self, executor, request_id, func, args, kwargs):
+        super().__init__()
+        self.executor = executor
+        self.request_id = request_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _TaskSignals()
+
+    def run(self):
+        """Run the query unless it was cancelled while queued"""
+        try:
+            # This thread's read connection, so cancel() can interrupt it
+            conn = get_manager(queries.DB_PATH).reader()
+            if not self.executor._start(self.request_id, conn):
+                return
+
+            try:
+                result = self.func(*self.args, **self.kwargs)
+            except Exception as e:
+                self.executor._stop(self.request_id)
+                self.signals.failed.emit(self.request_id, e)
+                return
+
+            self.executor._stop(self.request_id)
+            self.signals.finished.emit(self.request_id, result)
+        finally:
+            self.signals.done.emit(self.request_id)
+
+
+class QueryExecutor(QObject):
+    """
+    Runs blocking query functions off the main thread
+
+    Signals:
+        result_ready(int, object): request_id, return value
+        query_failed(int, object): request_id, exception
+        query_cancelled(int): request_id (cancelled or superseded)
+    """
+
+    result_ready = pyqtSignal(int, object)
+    query_failed = pyqtSignal(int, object)
+    query_cancelled = pyqtSignal(int)
+
+    # Two workers: one long query can't block a quick one, and SQLite
+    # readers on the Pi's SD card gain nothing from more
+    MAX_WORKERS = 2
+
+    _ids = count(1)
+
+    def __init__(self, parent=None, max_workers=MAX_WORKERS):
+        """
+        Initialize executor
+
+        Args:
+            parent: Owning QObject (results are delivered on its thread)
+            max_workers: Worker threads in the pool
+        """
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_workers)
+
+        self._lock = threading.Lock()
+        self._pending = {}    # request_id -> (channel, on_result, on_error)
+        self._latest = {}     # channel -> newest request_id
+        self._running = {}    # request_id -> connection executing it
+        self._tasks = {}      # request_id -> _QueryTask (kept alive until done)
+
+    def submit(self, func, *args, channel=None, on_result=None, on_error=None,
+               **kwargs):
+        """
+        Run func(*args, **kwargs) on the worker pool
+
+        Args:
+            func: Blocking function (usually from src.database.queries)
+            channel: Supersede and cancel earlier requests on this channel
+            on_result: Called on the main thread with the return value
+            on_error: Called on the main thread with the exception
+
+        Returns:
+            int: Request ID (matches the IDs in the executor's signals)
+        """
+        request_id = next(self._ids)
+
+        if channel is not None:
+            previous = self._latest.get(channel)
+            if previous is not None:
+                self.cancel(previous)
+            self._latest[channel] = request_id
+
+        with self._lock:
+            self._pending[request_id] = (channel, on_result, on_error)
+
+        task = _QueryTask(self, request_id, func, args, kwargs)
+        task.setAutoDelete(False)
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        task.signals.done.connect(self._release)
+        self._tasks[request_id] = task
+        self.pool.start(task)
+        return request_id
+
+    def cancel(self, request_id):
+        """
+        Cancel a request: drop it if queued, interrupt it if running
+
+        Args:
+            request_id: ID returned by submit()
+
+        Returns:
+            bool: True if the request was still pending
+        """
+        with self._lock:
+            if self._pending.pop(request_id, None) is None:
+                return False
+            conn = self._running.get(request_id)
+            if conn is not None:
+                # Makes the running statement fail with "interrupted"
+                conn.interrupt()
+
+        task = self._tasks.get(request_id)
+        if task is not None and self.pool.tryTake(task):
+            del self._tasks[request_id]
+
+        self.query_cancelled.emit(request_id)
+        return True
+
+    def cancel_channel(self, channel):
+        """Cancel the outstanding request on a channel, if any"""
+        request_id = self._latest.pop(channel, None)
+        if request_id is not None:
+            self.cancel(request_id)
+
+    def is_pending(self, request_id):
+        """True if the request hasn't finished or been cancelled"""
+        with self._lock:
+            return request_id in self._pending
+
+    def shutdown(self, wait_ms=1000):
+        """Cancel everything and wait briefly for running queries to stop"""
+        with self._lock:
+            request_ids = list(self._pending)
+        for request_id in request_ids:
+            self.cancel(request_id)
+        self.pool.waitForDone(wait_ms)
+
+    # Worker-side bookkeeping (called from pool threads)
+
+    def _start(self, request_id, conn):
+        """Mark a request as running; False if it was cancelled while queued"""
+        with self._lock:
+            if request_id not in self._pending:
+                return False
+            self._running[request_id] = conn
+            return True
+
+    def _stop(self, request_id):
+        """Forget a request's connection once its query has returned"""
+        with self._lock:
+            self._running.pop(request_id, None)
+
+    # Main-thread delivery
+
+    def _take(self, request_id):
+        """Remove a finished request, returning its entry if still wanted"""
+        with self._lock:
+            entry = self._pending.pop(request_id, None)
+        if entry is not None and entry[0] is not None \
+                and self._latest.get(entry[0]) == request_id:
+            del self._latest[entry[0]]
+        return entry
+
+    @pyqtSlot(int)
+    def _release(self, request_id):
+        """Drop the task object once its worker has finished with it"""
+        self._tasks.pop(request_id, None)
+
+    @pyqtSlot(int, object)
+    def _on_finished(self, request_id, result):
+        entry = self._take(request_id)
+        if entry is None:
+            return  # Cancelled or superseded: stale result
+
+        _, on_result, _ = entry
+        self.result_ready.emit(request_id, result)
+        if on_result is not None:
+            on_result(result)
+
+    @pyqtSlot(int, object)
+    def _on_failed(self, request_id, error):
+        entry = self._take(request_id)
+        if entry is None:
+            return  # Includes the "interrupted" error from cancel()
+
+        _, _, on_error = entry
+        self.query_failed.emit(request_id, error)
+        if on_error is not None:
+            on_error(error)
+        else:
+            print(f"[ERROR] Background query {request_id} failed: {error}")
@@ -21,6 +21,7 @@ Previous features retained:
 
 import sys
 import os
+import traceback
 
 # Add project root to path for imports
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -38,8 +39,10 @@ from PyQt5.QtGui import QFont
 # Import database queries
 from src.database.queries import (
     get_top_rated_shows, get_most_played_venues,
-    search_by_venue, get_show_by_date, search_by_year,
-    get_show_count, get_random_show
+    get_best_recording, get_show_count, get_random_show,
+    iter_shows_by_venue, iter_shows_by_year,
+    get_show_count_by_venue, get_show_count_for_year, search_shows,
+    fuzzy_search_shows
 )
 
 # Import Phase 10A components
@@ -58,6 +61,48 @@ from src.ui.widgets.loading_spinner import LoadingIndicator
 from src.ui.widgets.random_show_widget import RandomShowWidget
 from src.ui.widgets.show_card import ShowCard
 
+# Background database queries
+from src.ui.query_executor import QueryExecutor
+
+
+# Executor channel for queries that fill the right panel; each new browse
+# action supersedes the previous one
+CONTENT_CHANNEL = 'content'
+
+
+def fetch_first_page(pages, count):
+    """
+    Fetch the first page of a paginated query plus its total (worker thread)
+
+    Args:
+        pages: Page iterator (e.g., iter_shows_by_year(1977))
+        count: Called with no arguments for the total number of shows
+
+    Returns:
+        Tuple of (first page, remaining page iterator, total); the first
+        page is empty if nothing matched
+    """
+    pages = iter(pages)
+    first_page = next(pages, [])
+    return first_page, pages, count() if first_page else 0
+
+
+def search_with_typos(query=None, year=None, state=None, min_rating=None):
+    """
+    Word-prefix search, falling back to typo-tolerant matching (worker thread)
+
+    search_shows() ranks exact words best ('fillmore', 'san fran'); only
+    when it finds nothing is the query treated as misspelled and matched
+    against venue and city names by trigram similarity.
+
+    Returns:
+        List of Show records
+    """
+    results = search_shows(query=query, year=year, state=state, min_rating=min_rating)
+    if results or not query:
+        return results
+    return fuzzy_search_shows(query=query, year=year, state=state, min_rating=min_rating)
+
 
 class BrowseScreen(QWidget):
     """
@@ -89,7 +134,7 @@ class BrowseScreen(QWidget):
     """
 
     # Navigation signals
-    show_selected = pyqtSignal(dict)  # Emits show dictionary
+    show_selected = pyqtSignal(object)  # Emits show (Show record or dict)
     player_requested = pyqtSignal()   # Navigate to player
     settings_requested = pyqtSignal() # Navigate to settings
 
@@ -99,6 +144,7 @@ class BrowseScreen(QWidget):
         self.current_shows = []
         self.current_filter = None
         self.current_mode = 'default'
+        self.query_executor = QueryExecutor(self)
         self.setup_ui()
 
         # Create error handling UI components
@@ -403,14 +449,21 @@ class BrowseScreen(QWidget):
         """Load and display top rated shows (Task 7.1)"""
         print("[INFO] Loading top rated shows...")
         
+        # Switch to list view
+        self.content_stack.setCurrentIndex(1)
+        self.show_list.set_loading_state()
+        
+        # Get top rated shows off the UI thread
+        self.query_executor.submit(
+            get_top_rated_shows, limit=50, min_reviews=5,
+            channel=CONTENT_CHANNEL,
+            on_result=self._on_top_rated_loaded,
+            on_error=self._on_top_rated_failed
+        )
+
+    def _on_top_rated_loaded(self, shows):
+        """Display top rated shows once the query returns"""
         try:
-            # Switch to list view
-            self.content_stack.setCurrentIndex(1)
-            self.show_list.set_loading_state()
-            
-            # Get top rated shows
-            shows = get_top_rated_shows(limit=50, min_reviews=5)
-            
             if not shows:
                 self.update_header(
                     "No Shows Found",
@@ -432,16 +485,20 @@ class BrowseScreen(QWidget):
             print(f"[OK] Loaded {len(shows)} top rated shows")
             
         except Exception as e:
-            print(f"[ERROR] Failed to load top rated shows: {e}")
-            import traceback
-            traceback.print_exc()
-            self.update_header("Error", "Failed to load top rated shows")
-            self.show_list.set_empty_state("Error loading shows")
-            self.toast_manager.show_error("Database error: Unable to load top rated shows")
+            self._on_top_rated_failed(e)
+
+    def _on_top_rated_failed(self, error):
+        """Show top rated load error"""
+        print(f"[ERROR] Failed to load top rated shows: {error}")
+        traceback.print_exception(type(error), error, error.__traceback__)
+        self.update_header("Error", "Failed to load top rated shows")
+        self.show_list.set_empty_state("Error loading shows")
+        self.toast_manager.show_error("Database error: Unable to load top rated shows")
 
     def show_date_browser(self):
         """Show date browser (Task 7.2) - Phase 10A uses compact selector"""
         print("[INFO] Showing date selector...")
+        self.query_executor.cancel_channel(CONTENT_CHANNEL)
 
         # Hide header and divider - date selector has its own title
         self.header_title.hide()
@@ -456,6 +513,7 @@ class BrowseScreen(QWidget):
     def show_venue_browser(self):
         """Show venue browser (Task 7.3) - placeholder"""
         print("[INFO] Showing venue browser...")
+        self.query_executor.cancel_channel(CONTENT_CHANNEL)
         
         # Update header
         self.update_header(
@@ -471,6 +529,7 @@ class BrowseScreen(QWidget):
     def show_year_browser(self):
         """Show year browser (Task 7.4)"""
         print("[INFO] Showing year browser...")
+        self.query_executor.cancel_channel(CONTENT_CHANNEL)
         
         # Update header
         self.update_header(
@@ -486,6 +545,7 @@ class BrowseScreen(QWidget):
     def show_search(self):
         """Show search interface (Task 7.5)"""
         print("[INFO] Showing search interface...")
+        self.query_executor.cancel_channel(CONTENT_CHANNEL)
         
         # Update header
         self.update_header(
@@ -501,6 +561,7 @@ class BrowseScreen(QWidget):
     def show_random_show(self):
         """Show random show (Task 7.6) - Phase 10A uses ShowCard"""
         print("[INFO] Loading random show...")
+        self.query_executor.cancel_channel(CONTENT_CHANNEL)
         
         try:
             # Get random show
@@ -580,23 +641,31 @@ class BrowseScreen(QWidget):
     def on_date_browser_selected(self, date_str):
         """Handle date selection from DateBrowser (calendar view)"""
         print(f"[INFO] Date selected from calendar: {date_str}")
-        
+        self.load_show_for_date(date_str)
+
+    def load_show_for_date(self, date_str):
+        """Look up the show for a date in the background, then show it in ShowCard"""
+        self.query_executor.submit(
+            get_best_recording, date_str,
+            channel=CONTENT_CHANNEL,
+            on_result=lambda show: self._on_date_loaded(date_str, show),
+            on_error=lambda error: self._on_date_failed(date_str, error)
+        )
+
+    def _on_date_loaded(self, date_str, show):
+        """Display the best recording for a date once the query returns"""
         try:
-            # Get shows for this date
-            shows = get_show_by_date(date_str)
-            
-            if not shows:
+            if show is None:
                 # No shows found
                 self.hide_header()
                 self.content_stack.setCurrentIndex(0)
                 self._show_card_error(f"No show found for {date_str}")
+                print(f"[WARN] No shows found for {date_str}")
                 return
             
-            # Take first show (or best scored if multiple)
-            show = shows[0]
-            if len(shows) > 1:
-                show = max(shows, key=lambda s: s.get('recording_score', 0))
-                print(f"[INFO] Multiple recordings, selected best: score={show.get('recording_score', 0)}")
+            if show.get('recording_count', 1) > 1:
+                print(f"[INFO] {show['recording_count']} recordings, selected best: "
+                      f"score={show['recording_score']}")
             
             # Hide header when showing ShowCard
             self.hide_header()
@@ -605,7 +674,7 @@ class BrowseScreen(QWidget):
             self.content_stack.setCurrentIndex(0)
             self.current_mode = 'date_selected'
 
-            # Load show in ShowCard
+            # Load show in ShowCard with fade animation
             self._show_card_fade_in(show)
             self._show_card_set_mode('date_selected')
             self._show_card_enable_play(True)
@@ -613,26 +682,37 @@ class BrowseScreen(QWidget):
             print(f"[OK] Date selection loaded: {show['date']} - {show['venue']}")
             
         except Exception as e:
-            print(f"[ERROR] Failed to load date selection: {e}")
-            import traceback
-            traceback.print_exc()
-            self.hide_header()
-            self.content_stack.setCurrentIndex(0)
-            self._show_card_error(f"Error loading show for {date_str}")
-            self.toast_manager.show_error(f"Database error: Unable to load show for {date_str}")
+            self._on_date_failed(date_str, e)
+
+    def _on_date_failed(self, date_str, error):
+        """Show date lookup error in ShowCard"""
+        print(f"[ERROR] Failed to load date selection: {error}")
+        traceback.print_exception(type(error), error, error.__traceback__)
+        self.hide_header()
+        self.content_stack.setCurrentIndex(0)
+        self._show_card_error(f"Error loading show for {date_str}")
+        self.toast_manager.show_error(f"Database error: Unable to load show for {date_str}")
 
     def load_shows_by_venue(self, venue_name):
         """Load and display shows from a specific venue (Task 7.3)"""
-        
+        # Switch to list view
+        self.content_stack.setCurrentIndex(1)
+        self.show_list.set_loading_state()
+        
+        # First page and total count off the UI thread; later pages load on scroll
+        self.query_executor.submit(
+            fetch_first_page,
+            iter_shows_by_venue(venue_name),
+            lambda: get_show_count_by_venue(None, venue_name),
+            channel=CONTENT_CHANNEL,
+            on_result=lambda result: self._on_venue_loaded(venue_name, *result),
+            on_error=lambda error: self._on_venue_failed(venue_name, error)
+        )
+
+    def _on_venue_loaded(self, venue_name, first_page, pages, total):
+        """Display the first page of a venue's shows"""
         try:
-            # Switch to list view
-            self.content_stack.setCurrentIndex(1)
-            self.show_list.set_loading_state()
-            
-            # Search for shows at this venue
-            shows = search_by_venue(venue_name)
-            
-            if not shows:
+            if not self.show_list.load_pages(pages, first_page):
                 # No shows found
                 self.update_header(
                     "No Shows Found",
@@ -643,36 +723,46 @@ class BrowseScreen(QWidget):
             
             # Update header
             self.update_header(
-                f"{len(shows)} Shows at {venue_name}",
+                f"{total} Shows at {venue_name}",
                 "Sorted by date (oldest to newest)"
             )
             
-            # Load shows into list
-            self.show_list.load_shows(shows)
-            self.current_shows = shows
+            # Shared list - grows as more pages are scrolled in
+            self.current_shows = self.show_list.shows
             
-            print(f"[OK] Loaded {len(shows)} shows from {venue_name}")
+            print(f"[OK] Loaded first page of {total} shows from {venue_name}")
             
         except Exception as e:
-            print(f"[ERROR] Failed to load venue shows: {e}")
-            import traceback
-            traceback.print_exc()
-            self.update_header("Error", f"Failed to load shows for {venue_name}")
-            self.show_list.set_empty_state("Error loading shows")
-            self.toast_manager.show_error(f"Database error: Unable to load shows for {venue_name}")
+            self._on_venue_failed(venue_name, e)
+
+    def _on_venue_failed(self, venue_name, error):
+        """Show venue load error"""
+        print(f"[ERROR] Failed to load venue shows: {error}")
+        traceback.print_exception(type(error), error, error.__traceback__)
+        self.update_header("Error", f"Failed to load shows for {venue_name}")
+        self.show_list.set_empty_state("Error loading shows")
+        self.toast_manager.show_error(f"Database error: Unable to load shows for {venue_name}")
     
     def load_shows_by_year(self, year):
         """Load and display shows from a specific year (Task 7.4)"""
-        
+        # Switch to list view
+        self.content_stack.setCurrentIndex(1)
+        self.show_list.set_loading_state()
+        
+        # First page and total count off the UI thread; later pages load on scroll
+        self.query_executor.submit(
+            fetch_first_page,
+            iter_shows_by_year(year),
+            lambda: get_show_count_for_year(year),
+            channel=CONTENT_CHANNEL,
+            on_result=lambda result: self._on_year_loaded(year, *result),
+            on_error=lambda error: self._on_year_failed(year, error)
+        )
+
+    def _on_year_loaded(self, year, first_page, pages, total):
+        """Display the first page of a year's shows"""
         try:
-            # Switch to list view
-            self.content_stack.setCurrentIndex(1)
-            self.show_list.set_loading_state()
-            
-            # Get shows for this year
-            shows = search_by_year(year)
-            
-            if not shows:
+            if not self.show_list.load_pages(pages, first_page):
                 # No shows found
                 self.update_header(
                     "No Shows Found",
@@ -682,69 +772,67 @@ class BrowseScreen(QWidget):
                 return
             
             # Update header - include legendary year indicator
-            from src.ui.widgets.year_browser import YearBrowser
             is_legendary = year in YearBrowser.LEGENDARY_YEARS
             
             if is_legendary:
-                title = f"[LEGENDARY] {year} ({len(shows)} shows)"
+                title = f"[LEGENDARY] {year} ({total} shows)"
             else:
-                title = f"{year} ({len(shows)} shows)"
+                title = f"{year} ({total} shows)"
             
             self.update_header(
                 title,
                 "All shows from this year, sorted by date"
             )
             
-            # Load shows into list
-            self.show_list.load_shows(shows)
-            self.current_shows = shows
+            # Shared list - grows as more pages are scrolled in
+            self.current_shows = self.show_list.shows
             
-            print(f"[OK] Loaded {len(shows)} shows from {year}")
+            print(f"[OK] Loaded first page of {total} shows from {year}")
             
         except Exception as e:
-            print(f"[ERROR] Failed to load year shows: {e}")
-            import traceback
-            traceback.print_exc()
-            self.update_header("Error", f"Failed to load shows for {year}")
-            self.show_list.set_empty_state("Error loading shows")
-            self.toast_manager.show_error(f"Database error: Unable to load shows for {year}")
+            self._on_year_failed(year, e)
+
+    def _on_year_failed(self, year, error):
+        """Show year load error"""
+        print(f"[ERROR] Failed to load year shows: {error}")
+        traceback.print_exception(type(error), error, error.__traceback__)
+        self.update_header("Error", f"Failed to load shows for {year}")
+        self.show_list.set_empty_state("Error loading shows")
+        self.toast_manager.show_error(f"Database error: Unable to load shows for {year}")
 
     def perform_search(self, search_params):
         """Perform database search based on parameters from SearchWidget"""
-        try:
-            # Switch to list view
-            self.content_stack.setCurrentIndex(1)
-            self.show_list.set_loading_state()
-            
-            # Extract search parameters
-            query = search_params.get('query', '')
-            year = search_params.get('year', None)
-            state = search_params.get('state', None)
-            min_rating = search_params.get('min_rating', None)
-            
-            print(f"[INFO] Performing search: query={query}, year={year}, state={state}, rating={min_rating}")
-            
-            # Import search function
-            from src.database.queries import search_shows
-            
-            # Perform search
-            results = search_shows(
-                query=query,
-                year=year,
-                state=state,
-                min_rating=min_rating
-            )
-            
-            # Load results
-            self.load_search_results(results)
-        
-        except Exception as e:
-            print(f"[ERROR] Search failed: {e}")
-            import traceback
-            traceback.print_exc()
-            self.update_header("Search Error", "Failed to perform search")
-            self.show_list.set_empty_state("Search failed")
-            self.toast_manager.show_error(f"Search error: {str(e)}")
+        # Switch to list view
+        self.content_stack.setCurrentIndex(1)
+        self.show_list.set_loading_state()
+        
+        # Extract search parameters
+        query = search_params.get('query', '')
+        year = search_params.get('year', None)
+        state = search_params.get('state', None)
+        min_rating = search_params.get('min_rating', None)
+        
+        print(f"[INFO] Performing search: query={query}, year={year}, state={state}, rating={min_rating}")
+        
+        # Perform search off the UI thread
+        self.query_executor.submit(
+            search_with_typos,
+            query=query,
+            year=year,
+            state=state,
+            min_rating=min_rating,
+            channel=CONTENT_CHANNEL,
+            on_result=self.load_search_results,
+            on_error=self._on_search_failed
+        )
+
+    def _on_search_failed(self, error):
+        """Show search error"""
+        print(f"[ERROR] Search failed: {error}")
+        traceback.print_exception(type(error), error, error.__traceback__)
+        self.update_header("Search Error", "Failed to perform search")
+        self.show_list.set_empty_state("Search failed")
+        self.toast_manager.show_error(f"Search error: {str(error)}")
 
     def load_search_results(self, results):
         """Load and display search results (Task 7.5)"""
@@ -761,7 +849,7 @@ class BrowseScreen(QWidget):
             
             self.update_header(
                 f"Search Results ({len(results)} shows)",
-                "Sorted by rating (best first)"
+                "Best matches first"
             )
             
             # Load shows into list
@@ -794,47 +882,7 @@ class BrowseScreen(QWidget):
         Loads selected show in ShowCard instead of list view
         """
         print(f"[INFO] Date selected from selector: {date_str}")
-        
-        try:
-            # Get shows for this date
-            shows = get_show_by_date(date_str)
-            
-            if not shows:
-                # No shows found - show error in ShowCard
-                self.hide_header()
-                self.content_stack.setCurrentIndex(0)
-                self._show_card_error(f"No show found for {date_str}")
-                print(f"[WARN] No shows found for {date_str}")
-                return
-            
-            # Take first show (or best scored if multiple)
-            show = shows[0]
-            if len(shows) > 1:
-                show = max(shows, key=lambda s: s.get('recording_score', 0))
-                print(f"[INFO] Multiple recordings, selected best: score={show.get('recording_score', 0)}")
-            
-            # Hide header when showing ShowCard
-            self.hide_header()
-
-            # Switch to ShowCard view
-            self.content_stack.setCurrentIndex(0)
-            self.current_mode = 'date_selected'
-
-            # Load show in ShowCard with fade animation
-            self._show_card_fade_in(show)
-            self._show_card_set_mode('date_selected')
-            self._show_card_enable_play(True)
-
-            print(f"[OK] Date selection loaded in ShowCard: {show['date']} - {show['venue']}")
-            
-        except Exception as e:
-            print(f"[ERROR] Failed to load date selection: {e}")
-            import traceback
-            traceback.print_exc()
-            self.hide_header()
-            self.content_stack.setCurrentIndex(0)
-            self._show_card_error(f"Error loading show for {date_str}")
-            self.toast_manager.show_error(f"Database error: Unable to load show for {date_str}")
+        self.load_show_for_date(date_str)
 
     def on_year_browser_selected(self, year):
         """Handle year selection from YearBrowser"""
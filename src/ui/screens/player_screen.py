@@ -857,36 +857,45 @@ class PlayerScreen(QWidget):
         Load a complete show and optionally start playing
 
         Args:
-            show (dict): Show dictionary with keys: identifier, date, venue, etc.
+            show (dict or Show): Show with keys: identifier, date, venue, etc.
             auto_play (bool): If True, start playing immediately. If False, load in paused state.
         """
         try:
+            # Work on a private dict: database Show records are immutable and
+            # API details are filled in below
+            show = dict(show)
+
             print(f"[INFO] Loading show: {show.get('date')} - {show.get('venue')}")
 
             # Import metadata utilities
-            from src.api.metadata import get_metadata, extract_audio_files
+            from src.api.metadata import get_metadata, cache_audio_files
+            from src.database.tracks import get_tracks
 
-            # Get show metadata from Internet Archive
             identifier = show.get('identifier')
             if not identifier:
                 print("[ERROR] Show missing identifier")
                 return
 
-            metadata = get_metadata(identifier)
-            if not metadata:
-                print(f"[ERROR] Failed to fetch metadata for {identifier}")
-                return
+            # Local tracks table first; Archive.org only on the first play
+            metadata = None
+            audio_files = get_tracks(identifier)
+            if not audio_files:
+                metadata = get_metadata(identifier)
+                if not metadata:
+                    print(f"[ERROR] Failed to fetch metadata for {identifier}")
+                    return
+                audio_files = cache_audio_files(identifier, metadata)
 
-            # Extract audio files
-            audio_files = extract_audio_files(metadata)
             if not audio_files:
                 print(f"[ERROR] No audio files found for {identifier}")
                 return
 
-            print(f"[INFO] Found {len(audio_files)} tracks")
+            print(f"[INFO] Found {len(audio_files)} tracks"
+                  f"{'' if metadata else ' (local)'}")
 
             # Extract additional metadata from API that may not be in database
-            api_metadata = metadata.get('metadata', {})
+            # (only available when the file list had to be fetched)
+            api_metadata = metadata.get('metadata', {}) if metadata else {}
 
             # Update show dict with source and taper from API (if not already present)
             if not show.get('source_type'):
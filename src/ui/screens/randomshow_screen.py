@@ -55,7 +55,7 @@ class RandomShowScreen(QWidget):
     """
 
     # Navigation signals
-    show_selected = pyqtSignal(dict)
+    show_selected = pyqtSignal(object)  # Show record or dict
     home_requested = pyqtSignal()
     settings_requested = pyqtSignal()
 
@@ -24,7 +24,8 @@ from src.database.queries import (
     get_venue_count,
     get_date_range,
     get_years_with_shows,
-    get_show_count_by_year
+    get_show_count_by_year,
+    get_cache_stats
 )
 from src.ui.styles.theme import Theme
 
@@ -159,7 +160,8 @@ class DatabaseSettingsWidget(QWidget):
             ("unique_venues", "Unique Venues", "0"),
             ("years_covered", "Years Covered", "0"),
             ("date_range", "Date Range", "Loading..."),
-            ("last_update", "Last Update", "Never")
+            ("last_update", "Last Update", "Never"),
+            ("query_cache", "Query Cache", "No queries yet")
         ]
         
         for key, label_text, initial_value in stats:
@@ -356,6 +358,14 @@ class DatabaseSettingsWidget(QWidget):
             # Last update (placeholder - will be implemented with settings persistence)
             self.stat_labels["last_update"].setText("Not tracked yet")
             
+            # Query cache effectiveness
+            cache = get_cache_stats()
+            if cache['hits'] + cache['misses'] > 0:
+                self.stat_labels["query_cache"].setText(
+                    f"{cache['hit_rate']:.0%} hits "
+                    f"({cache['hits']:,} / {cache['hits'] + cache['misses']:,})"
+                )
+            
         except Exception as e:
             print(f"[ERROR] Failed to load database statistics: {e}")
             # Show error in first stat
@@ -19,7 +19,9 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 
-from src.database.queries import get_show_count_by_year, get_shows_by_month
+from src.database.queries import (
+    get_show_count_by_year, get_show_count_by_month, get_shows_by_month
+)
 from src.ui.styles.theme import Theme
 
 
@@ -248,13 +250,9 @@ class DateSelectorWidget(QWidget):
                 "September", "October", "November", "December"
             ]
 
-            months_with_shows = []
-            for month in range(1, 13):
-                shows = get_shows_by_month(year, month)
-                if shows:
-                    months_with_shows.append((month, len(shows)))
-                    # Cache the show data
-                    self.month_data[(year, month)] = shows
+            # One lookup in the month summary table; the shows themselves
+            # are only fetched when a month is selected
+            months_with_shows = get_show_count_by_month(year)
 
             # Populate month list
             for month, count in months_with_shows:
@@ -277,8 +275,11 @@ class DateSelectorWidget(QWidget):
         self.selected_day = None
 
         try:
-            # Get shows for this month from cache
-            shows = self.month_data.get((year, month), [])
+            # Get shows for this month (cached after the first selection)
+            shows = self.month_data.get((year, month))
+            if shows is None:
+                shows = get_shows_by_month(year, month)
+                self.month_data[(year, month)] = shows
 
             # Extract unique days with shows
             days_with_shows = set()
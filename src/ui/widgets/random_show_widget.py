@@ -30,7 +30,7 @@ from src.ui.styles.button_styles import (
 from src.ui.styles.text_styles import TITLE_SECTION_STYLE, TEXT_SUPPORTING_STYLE
 from src.ui.widgets.loading_spinner import LoadingIndicator
 from src.database.queries import get_random_show
-from src.api.metadata import get_metadata, extract_audio_files
+from src.api.metadata import get_audio_files
 
 
 class RandomShowWidget(QWidget):
@@ -43,7 +43,7 @@ class RandomShowWidget(QWidget):
     """
 
     # Signals
-    show_selected = pyqtSignal(dict)
+    show_selected = pyqtSignal(object)  # Show record or dict
     reload_requested = pyqtSignal()
 
     def __init__(self, parent=None):
@@ -161,10 +161,9 @@ class RandomShowWidget(QWidget):
 
             self.current_show = show
 
-            # Fetch metadata from Archive.org to get setlist
+            # Setlist from the local tracks table (Archive.org on first view)
             try:
-                metadata = get_metadata(show['identifier'])
-                audio_files = extract_audio_files(metadata)
+                audio_files = get_audio_files(show['identifier'])
 
                 # Parse tracks from audio files
                 self.tracks = self.parse_tracks(audio_files)
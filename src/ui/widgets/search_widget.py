@@ -18,13 +18,15 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(o
 sys.path.insert(0, PROJECT_ROOT)
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QLineEdit, QComboBox, QSlider, QFrame)
-from PyQt5.QtCore import Qt, pyqtSignal
+                             QPushButton, QLineEdit, QComboBox, QSlider, QFrame,
+                             QCompleter)
+from PyQt5.QtCore import Qt, pyqtSignal, QStringListModel
 from PyQt5.QtGui import QFont
 
 # Import Phase 10A components
 from src.ui.styles.theme import Theme
 from src.ui.components.pill_button import PillButton
+from src.database.queries import fuzzy_search_places
 
 
 class SearchWidget(QWidget):
@@ -33,6 +35,7 @@ class SearchWidget(QWidget):
     
     Features:
     - Text search (venue, city, or other text)
+    - Typo-tolerant venue/city suggestions while typing
     - Year filter (optional)
     - State filter (optional)
     - Minimum rating filter (optional)
@@ -45,6 +48,10 @@ class SearchWidget(QWidget):
     # Signals
     search_submitted = pyqtSignal(dict)  # search parameters dictionary
     
+    # Suggestions start at this many characters (fewer match too broadly)
+    SUGGESTION_MIN_CHARS = 3
+    SUGGESTION_LIMIT = 6
+    
     def __init__(self):
         """Initialize the search widget"""
         super().__init__()
@@ -113,6 +120,16 @@ class SearchWidget(QWidget):
         """)
         # Submit search on Enter key
         self.search_input.returnPressed.connect(self.submit_search)
+        
+        # Venue/city suggestions from the trigram index, so misspellings
+        # ("winterlnd") still offer the right place. Unfiltered: the
+        # suggestions rarely start with what was typed.
+        self.suggestion_model = QStringListModel(self)
+        self.completer = QCompleter(self.suggestion_model, self)
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.search_input.setCompleter(self.completer)
+        self.search_input.textEdited.connect(self.update_suggestions)
         layout.addWidget(self.search_input)
         
         # Divider
@@ -344,6 +361,26 @@ class SearchWidget(QWidget):
             rating = value / 10.0
             self.rating_value_label.setText(f"{rating:.1f}+")
     
+    def update_suggestions(self, text):
+        """Offer venues and cities similar to the typed text"""
+        text = text.strip()
+        if len(text) < self.SUGGESTION_MIN_CHARS:
+            self.suggestion_model.setStringList([])
+            return
+        
+        try:
+            places = fuzzy_search_places(text, limit=self.SUGGESTION_LIMIT)
+        except Exception as e:
+            print(f"[WARN] Search suggestions failed: {e}")
+            places = []
+        
+        suggestions = [
+            f"{place['name']}, {place['state']}"
+            if place['kind'] == 'city' and place['state'] else place['name']
+            for place in places
+        ]
+        self.suggestion_model.setStringList(suggestions)
+    
     def clear_filters(self):
         """Reset all filters to default values"""
         self.search_input.clear()
@@ -389,7 +389,8 @@ class ShowCard(QWidget):
 
     def _load_setlist(self, identifier):
         """
-        Fetch and display setlist from Archive.org metadata.
+        Display setlist from the local tracks table (fetched from
+        Archive.org metadata the first time).
 
         Args:
             identifier: Show identifier for Archive.org lookup
@@ -400,14 +401,11 @@ class ShowCard(QWidget):
 
         try:
             # Import here to avoid circular imports
-            from src.api.metadata import get_metadata, extract_audio_files
+            from src.api.metadata import get_audio_files
             from src.audio.playlist import PlaylistBuilder
 
-            # Fetch metadata from Archive.org
-            metadata = get_metadata(identifier)
-
-            # Extract audio files
-            audio_files = extract_audio_files(metadata, format_preference='MP3')
+            # Stored tracks, or Archive.org metadata on first view
+            audio_files = get_audio_files(identifier, format_preference='MP3')
 
             if not audio_files:
                 self.setlist_label.setText("Setlist not available")
@@ -424,7 +422,7 @@ class ShowCard(QWidget):
                 filename = file_info.get('name', '')
 
                 # Detect which set this track belongs to
-                set_name = PlaylistBuilder.detect_set(filename)
+                set_name = file_info.get('set_name') or PlaylistBuilder.detect_set(filename)
 
                 # Add set header if we're starting a new set
                 if set_name != current_set:
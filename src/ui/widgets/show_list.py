@@ -13,6 +13,12 @@ Features:
 - Rating and review count
 - Source type badge
 - Touch-friendly tap targets (60px minimum)
+- Lazy paging: load_pages() renders the first page immediately and
+  fetches the rest as the user scrolls
+- Metadata prefetch: shows on screen (and the next screenful) are
+  fetched in the background (src/api/prefetch.py), so opening one is
+  usually a cache hit; pending fetches are dropped when the list is
+  cleared or hidden
 
 Can be used for all browse modes:
 - All Shows
@@ -32,10 +38,11 @@ if PROJECT_ROOT not in sys.path:
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QFrame, QLabel
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QFont
 
 # Import Phase 10A components
+from src.api.prefetch import get_prefetcher
 from src.ui.styles.theme import Theme
 from src.ui.components.concert_list_item import ConcertListItem
 from src.ui.widgets.loading_spinner import LoadingIndicator
@@ -57,15 +64,38 @@ class ShowListWidget(QWidget):
     - show_selected: Emitted when user selects a show to play
     """
 
-    show_selected = pyqtSignal(dict)  # Emits show dictionary
+    show_selected = pyqtSignal(object)  # Emits show (Show record or dict)
 
-    def __init__(self, parent=None):
-        """Initialize show list widget"""
+    # Fetch the next page when scrolled within this many pixels of the end
+    LOAD_MORE_THRESHOLD = 400
+
+    # Prefetch this many viewport heights below (and half that above) the view
+    PREFETCH_SCREENS_AHEAD = 1.0
+
+    # Wait for scrolling to settle before updating the prefetch queue (ms)
+    PREFETCH_DELAY_MS = 150
+
+    def __init__(self, parent=None, prefetcher=None):
+        """
+        Initialize show list widget
+
+        Args:
+            parent: Parent widget
+            prefetcher: MetadataPrefetcher (default: shared prefetcher)
+        """
         super().__init__(parent)
         self.shows = []
         self.show_items = []  # Track ConcertListItem widgets
+        self._pages = None         # Page iterator from load_pages()
+        self._pending_page = None  # Next page, fetched one ahead
+        self.prefetcher = prefetcher or get_prefetcher()
         self.setup_ui()
 
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(self.PREFETCH_DELAY_MS)
+        self._prefetch_timer.timeout.connect(self._prefetch_visible)
+
     def setup_ui(self):
         """Create list layout"""
         # Main layout
@@ -75,6 +105,7 @@ class ShowListWidget(QWidget):
 
         # Create scroll area
         scroll_area = QScrollArea()
+        self.scroll_area = scroll_area
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -98,6 +129,7 @@ class ShowListWidget(QWidget):
         self.list_layout.setAlignment(Qt.AlignTop)
 
         scroll_area.setWidget(self.list_container)
+        scroll_area.verticalScrollBar().valueChanged.connect(self._on_scroll)
         main_layout.addWidget(scroll_area)
 
         self.setLayout(main_layout)
@@ -112,8 +144,126 @@ class ShowListWidget(QWidget):
         # Clear existing items
         self.clear_shows()
 
-        # Store shows
-        self.shows = shows
+        self._append_shows(shows, is_last_page=True)
+
+        print(f"[INFO] Loaded {len(shows)} shows into list")
+
+    def load_pages(self, pages, first_page=None):
+        """
+        Load shows page by page from a paginated query
+
+        The first page is displayed immediately; later pages are fetched
+        from the iterator only when the user scrolls near the end.
+
+        Args:
+            pages: Iterator of show lists (e.g., iter_shows_by_year(1977))
+            first_page: First page if already fetched (e.g., by a
+                        background query); pages then yields the rest
+
+        Returns:
+            bool: True if at least one show was loaded
+        """
+        self.clear_shows()
+
+        self._pages = iter(pages)
+        if first_page is None:
+            first_page = next(self._pages, None)
+        self._pending_page = first_page or None
+        if self._pending_page is None:
+            self._pages = None
+            return False
+
+        self._load_next_page()
+        # Short first pages may not fill the viewport (no scrolling possible)
+        QTimer.singleShot(0, self._fill_viewport)
+        return True
+
+    def has_more_pages(self):
+        """Check if more pages are waiting to be loaded"""
+        return self._pending_page is not None
+
+    def _load_next_page(self):
+        """Append the buffered page and fetch the one after it"""
+        page = self._pending_page
+        if page is None:
+            return
+
+        # Fetch one page ahead so we know whether this page is the last
+        self._pending_page = next(self._pages, None)
+        if self._pending_page is None:
+            self._pages = None
+
+        self._append_shows(page, is_last_page=self._pending_page is None)
+        print(f"[INFO] Loaded page of {len(page)} shows ({len(self.shows)} total)")
+
+    def _on_scroll(self, value):
+        """Load the next page when the user nears the end of the list"""
+        scrollbar = self.scroll_area.verticalScrollBar()
+        if self.has_more_pages() and value >= scrollbar.maximum() - self.LOAD_MORE_THRESHOLD:
+            self._load_next_page()
+        self._prefetch_timer.start()
+
+    def visible_shows(self):
+        """
+        Shows on screen and near it, in prefetch order
+
+        Returns:
+            list of show dicts: visible items top to bottom, then the next
+            PREFETCH_SCREENS_AHEAD screens below, then a little above
+        """
+        height = self.scroll_area.viewport().height()
+        top = self.scroll_area.verticalScrollBar().value()
+        bottom = top + height
+        ahead = int(height * self.PREFETCH_SCREENS_AHEAD)
+
+        visible, below, above = [], [], []
+        for item in self.show_items:
+            item_top = item.y()
+            item_bottom = item_top + item.height()
+            if item_top > bottom + ahead:
+                break  # Items are laid out top to bottom
+            if item_bottom < top - ahead // 2:
+                continue
+            if item_bottom < top:
+                above.append(item.original_show_data)
+            elif item_top > bottom:
+                below.append(item.original_show_data)
+            else:
+                visible.append(item.original_show_data)
+        return visible + below + list(reversed(above))
+
+    def _prefetch_visible(self):
+        """Queue metadata fetches for the shows around the viewport"""
+        if not self.isVisible():
+            return
+        self.prefetcher.prefetch(show.get('identifier') for show in self.visible_shows())
+
+    def hideEvent(self, event):
+        """Navigating away: drop prefetches nobody will look at"""
+        self._prefetch_timer.stop()
+        self.prefetcher.cancel()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        """Back on screen: prefetch around the current position again"""
+        super().showEvent(event)
+        self._prefetch_timer.start()
+
+    def _fill_viewport(self):
+        """Keep loading pages until the list is scrollable or exhausted"""
+        if self.has_more_pages() and self.scroll_area.verticalScrollBar().maximum() == 0:
+            self._load_next_page()
+            QTimer.singleShot(0, self._fill_viewport)
+
+    def _append_shows(self, shows, is_last_page):
+        """
+        Add ConcertListItem widgets for shows to the end of the list
+
+        Args:
+            shows: List of show dictionaries
+            is_last_page: True if no more shows will follow (no final divider)
+        """
+        self.shows.extend(shows)
 
         # Create ConcertListItem for each show
         for i, show in enumerate(shows):
@@ -127,7 +277,8 @@ class ShowListWidget(QWidget):
             }
 
             # Create ConcertListItem (Phase 10A component)
-            show_divider = (i < len(shows) - 1)  # Show divider except for last item
+            # Show divider except for the very last item in the list
+            show_divider = not (is_last_page and i == len(shows) - 1)
             item = ConcertListItem(item_data, show_divider=show_divider)
             
             # Store original show data for signal emission
@@ -140,7 +291,8 @@ class ShowListWidget(QWidget):
             self.list_layout.addWidget(item)
             self.show_items.append(item)
 
-        print(f"[INFO] Loaded {len(shows)} shows into list")
+        # Prefetch once the new items have been laid out
+        self._prefetch_timer.start()
 
     def _format_location(self, show):
         """Format location string from show data"""
@@ -166,6 +318,10 @@ class ShowListWidget(QWidget):
 
         self.shows = []
         self.show_items = []
+        self._pages = None
+        self._pending_page = None
+        self._prefetch_timer.stop()
+        self.prefetcher.cancel()
 
     def on_item_clicked(self, show_data):
         """Handle item click - emit show_selected signal"""
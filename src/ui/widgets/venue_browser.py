@@ -38,7 +38,7 @@ from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 
 from src.ui.styles.theme import Theme
-from src.database.queries import get_show_count_by_venue
+from src.database.queries import get_show_counts_for_venues
 
 
 class VenueBrowser(QWidget):
@@ -206,10 +206,10 @@ class VenueBrowser(QWidget):
             return
 
         try:
-            # Get show counts for each venue
-            for venue in self.LEGENDARY_VENUES:
-                count = get_show_count_by_venue(self.db_path, venue)
-                self.venue_data[venue] = count
+            # Get show counts for every venue in one pass over the venue stats
+            self.venue_data.update(
+                get_show_counts_for_venues(self.db_path, tuple(self.LEGENDARY_VENUES))
+            )
 
             # Populate list with counts
             self._populate_venue_list_with_counts()
@@ -0,0 +1,61 @@
+"""
+Shared pytest fixtures for the DeadStream database tests.
+
+Builds a small throwaway shows.db so query tests never touch data/shows.db.
+"""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.database import queries
+from src.database.connection import close_all_connections
+from src.database.schema import SCHEMA_SQL
+
+
+SAMPLE_SHOWS = [
+    # identifier, date, venue, city, state, avg_rating, num_reviews
+    ('gd1977-05-08.sbd.hicks.4982', '1977-05-08', 'Barton Hall, Cornell University',
+     'Ithaca', 'NY', 4.8, 120),
+    ('gd1977-05-08.aud.vernon.1234', '1977-05-08', 'Barton Hall, Cornell University',
+     'Ithaca', 'NY', 4.1, 15),
+    ('gd1977-05-09.sbd.miller.5555', '1977-05-09', 'War Memorial',
+     'Buffalo', 'NY', 4.6, 40),
+    ('gd1972-05-08.sbd.bertha.0001', '1972-05-08', 'Bickershaw Festival',
+     'Wigan', 'England', 4.3, 22),
+    ('gd1978-12-31.sbd.winterland.777', '1978-12-31', 'Winterland Arena',
+     'San Francisco', 'CA', 4.7, 60),
+    ('gd1969-02-27.sbd.fillmore.9999', '1969-02-27', 'Fillmore West',
+     'San Francisco', 'CA', 4.5, 35),
+    ('gd1990-03-29.aud.nassau.4321', '1990-03-29', 'Nassau Coliseum',
+     'Uniondale', 'NY', 4.4, 8),
+    ('gd1995-07-09.aud.soldier.1111', '1995-07-09', 'Soldier Field',
+     'Chicago', 'IL', 3.2, 3),
+]
+
+
+@pytest.fixture
+def sample_db(tmp_path, monkeypatch):
+    """Create a populated temp database and point the query layer at it"""
+    db_path = str(tmp_path / 'shows.db')
+
+    conn = sqlite3.connect(db_path)
+    for sql in SCHEMA_SQL:
+        conn.execute(sql)
+    conn.executemany("""
+        INSERT INTO shows
+        (identifier, date, venue, city, state, avg_rating, num_reviews, last_updated)
+        VALUES (?, ?, ?, ?, ?, ?, ?, '2025-12-20T15:30:00')
+    """, SAMPLE_SHOWS)
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(queries, 'DB_PATH', db_path)
+    yield db_path
+    close_all_connections()
@@ -0,0 +1,100 @@
+"""
+Tests for the asyncio Archive client (src/api/async_client.py).
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('requests')
+
+from src.api import rate_limiter, transport
+from src.api.async_client import AsyncArchiveClient, get_metadata_batch
+from src.database.metadata_cache import MetadataCache
+
+
+LATENCY = 0.2
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, url):
+        self.url = url
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        identifier = self.url.rsplit('/', 1)[-1]
+        if identifier == 'missing':
+            raise ValueError('not found')
+        return {'metadata': {'identifier': identifier}, 'files': [{'name': 'd1t01.mp3'}]}
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    """Archive.org stand-in with fixed latency; yields the URLs requested"""
+    requested = []
+    lock = threading.Lock()
+
+    def get(url, params=None, timeout=None):
+        with lock:
+            requested.append(url)
+        time.sleep(LATENCY)
+        return FakeResponse(url)
+
+    monkeypatch.setattr(transport, 'get', get)
+    rate_limiter.reset_limiters()
+    yield requested
+    rate_limiter.reset_limiters()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = MetadataCache(str(tmp_path / 'cache.db'), ttl_seconds=3600,
+                          max_bytes=1024 * 1024)
+    yield cache
+    cache.close()
+
+
+def test_batch_overlaps_requests(archive, cache):
+    """Wall-clock time is a few round trips, not one per show"""
+    identifiers = [f"gd77-05-0{i}" for i in range(6)]
+    start = time.monotonic()
+    results = get_metadata_batch(identifiers + identifiers[:2], max_concurrency=3,
+                                 cache=cache)
+    elapsed = time.monotonic() - start
+
+    assert sorted(results) == sorted(identifiers)
+    assert results['gd77-05-03']['metadata']['identifier'] == 'gd77-05-03'
+    assert len(archive) == 6  # Duplicates fetched once
+    assert elapsed < 6 * LATENCY * 0.75
+
+
+def test_errors_and_cache_hits(archive, cache):
+    """A failed show doesn't sink the batch; cached shows skip the network"""
+    cache.put('cached', {'metadata': {'identifier': 'cached'}, 'files': []})
+
+    results = get_metadata_batch(['cached', 'missing', 'gd72-05-04'], cache=cache)
+    assert isinstance(results['missing'], Exception)
+    assert results['cached']['metadata']['identifier'] == 'cached'
+    assert [url.rsplit('/', 1)[-1] for url in archive].count('cached') == 0
+
+
+def test_async_surface(archive, cache):
+    """search, get_metadata and get_files as coroutines"""
+    import asyncio
+
+    async def run():
+        async with AsyncArchiveClient(cache=cache) as client:
+            files = await client.get_files('gd90-03-29')
+            metadata = await client.get_metadata('gd90-03-29')  # Now cached
+            return files, metadata
+
+    files, metadata = asyncio.run(run())
+    assert files == [{'name': 'd1t01.mp3'}]
+    assert metadata['metadata']['identifier'] == 'gd90-03-29'
+    assert len(archive) == 1
@@ -0,0 +1,94 @@
+"""
+Tests for single-flight metadata lookups (src/api/metadata.py).
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('requests')
+
+from src.api import metadata
+from src.api.metadata import SingleFlight
+
+
+class SlowClient:
+    """ArchiveClient stand-in that counts downloads"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+    def get_metadata(self, identifier):
+        self.calls.append(identifier)
+        time.sleep(0.1)
+        if self.fail:
+            raise ConnectionError('archive.org unreachable')
+        return {'metadata': {'identifier': identifier}, 'files': []}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = SlowClient()
+    monkeypatch.setattr(metadata, '_client', client)
+    monkeypatch.setattr(metadata, '_flight', SingleFlight(memo_seconds=0.3))
+    return client
+
+
+def call_concurrently(func, *args, threads=5):
+    """Run func(*args) on several threads at once; returns results/errors"""
+    results = []
+    barrier = threading.Barrier(threads)
+
+    def run():
+        barrier.wait()
+        try:
+            results.append(func(*args))
+        except Exception as e:
+            results.append(e)
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results
+
+
+def test_concurrent_callers_share_one_fetch(client):
+    """Five callers, one download, the same result for all"""
+    results = call_concurrently(metadata.get_metadata, 'gd77-05-08')
+
+    assert client.calls == ['gd77-05-08']
+    assert all(result is results[0] for result in results)
+    stats = metadata.get_request_stats()
+    assert stats['fetches'] == 1
+    assert stats['avoided'] == 4
+
+
+def test_memo_then_expiry(client):
+    """Back-to-back lookups reuse the result until memo_seconds pass"""
+    metadata.get_metadata('gd77-05-08')
+    metadata.get_metadata('gd77-05-08')
+    metadata.get_metadata('gd78-12-31')
+    assert client.calls == ['gd77-05-08', 'gd78-12-31']
+    assert metadata.get_request_stats()['memo_hits'] == 1
+
+    time.sleep(0.35)
+    metadata.get_metadata('gd77-05-08')
+    assert client.calls.count('gd77-05-08') == 2
+
+
+def test_errors_shared_not_memoized(client):
+    """Everyone waiting sees the failure; the next call retries"""
+    client.fail = True
+    results = call_concurrently(metadata.get_metadata, 'gd90-03-29')
+
+    assert client.calls == ['gd90-03-29']
+    assert all(isinstance(result, Exception) for result in results)
+    assert all('archive.org unreachable' in str(result) for result in results)
+
+    client.fail = False
+    assert metadata.get_metadata('gd90-03-29')['files'] == []
+    assert len(client.calls) == 2
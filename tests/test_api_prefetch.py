@@ -0,0 +1,109 @@
+"""
+Tests for the background metadata prefetcher (src/api/prefetch.py).
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('requests')
+
+from src.api.prefetch import MetadataPrefetcher
+from src.api.rate_limiter import EndpointLimiter
+
+
+def wait_until(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class Archive:
+    """Records prefetched identifiers; 'stored' shows need no fetch"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.fetched = []
+        self.lock = threading.Lock()
+
+    def fetch(self, identifier):
+        time.sleep(self.latency)
+        if identifier == 'broken':
+            raise ValueError('bad metadata')
+        with self.lock:
+            self.fetched.append(identifier)
+
+    @staticmethod
+    def needs_fetch(identifier):
+        return not identifier.startswith('stored')
+
+
+@pytest.fixture
+def archive():
+    return Archive()
+
+
+def make_prefetcher(archive, limiter=None, reserve=0):
+    limiter = limiter or EndpointLimiter('test', requests_per_second=None)
+    return MetadataPrefetcher(fetch=archive.fetch, needs_fetch=archive.needs_fetch,
+                              limiter=limiter, reserve=reserve)
+
+
+def test_fetches_in_order_and_skips_stored(archive):
+    """Visible shows first; shows with stored tracks cost nothing"""
+    prefetcher = make_prefetcher(archive)
+    try:
+        prefetcher.prefetch(['a', 'stored-1', 'broken', 'b', 'a'])
+        assert wait_until(lambda: prefetcher.stats()['pending'] == 0
+                          and len(archive.fetched) == 2)
+        assert archive.fetched == ['a', 'b']
+
+        stats = prefetcher.stats()
+        assert (stats['fetched'], stats['skipped'], stats['failed']) == (2, 1, 1)
+
+        # Already prefetched: not queued again
+        prefetcher.prefetch(['a', 'b'])
+        assert prefetcher.pending() == []
+    finally:
+        prefetcher.shutdown()
+
+
+def test_new_range_replaces_queue_and_cancel_drops_it():
+    """Scrolling on or navigating away drops shows nobody will look at"""
+    archive = Archive(latency=0.05)
+    prefetcher = make_prefetcher(archive)
+    try:
+        prefetcher.prefetch([f"old-{i}" for i in range(20)])
+        time.sleep(0.02)
+        prefetcher.prefetch(['new-1', 'new-2'])
+        assert wait_until(lambda: 'new-2' in archive.fetched)
+        assert len(archive.fetched) <= 4  # At most the one in flight + new
+
+        prefetcher.prefetch([f"later-{i}" for i in range(20)])
+        prefetcher.cancel()
+        time.sleep(0.2)
+        assert sum(i.startswith('later') for i in archive.fetched) <= 1
+        assert prefetcher.stats()['cancelled'] >= 19
+    finally:
+        prefetcher.shutdown()
+
+
+def test_leaves_burst_for_the_ui(archive):
+    """Prefetching waits while the shared limiter is short on tokens"""
+    limiter = EndpointLimiter('test', requests_per_second=10, burst=4)
+    for _ in range(4):
+        limiter.bucket.reserve()  # The UI just used the whole burst
+
+    prefetcher = make_prefetcher(archive, limiter=limiter, reserve=2)
+    try:
+        start = time.monotonic()
+        prefetcher.prefetch(['a'])
+        time.sleep(0.15)
+        assert archive.fetched == []  # Needs 3 tokens: ~0.3s at 10/s
+
+        assert wait_until(lambda: archive.fetched == ['a'])
+        assert time.monotonic() - start >= 0.25
+    finally:
+        prefetcher.shutdown()
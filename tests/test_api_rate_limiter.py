@@ -0,0 +1,85 @@
+"""
+Tests for the process-wide Archive.org rate limits (src/api/rate_limiter.py).
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('requests')
+
+from src.api import rate_limiter
+from src.api.rate_limiter import EndpointLimiter, RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiters():
+    rate_limiter.reset_limiters()
+    yield
+    rate_limiter.reset_limiters()
+
+
+def test_burst_then_steady_rate():
+    """The first `burst` requests go straight out, the rest at the rate"""
+    bucket = RateLimiter(requests_per_second=20, burst=5)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.wait_if_needed()
+    assert time.monotonic() - start < 0.05
+
+    for _ in range(4):
+        bucket.wait_if_needed()
+    assert time.monotonic() - start == pytest.approx(0.2, abs=0.05)
+
+
+def test_limit_shared_across_threads_and_clients():
+    """Every caller of an endpoint class draws from the same limiter"""
+    assert rate_limiter.get_limiter('metadata_api') is rate_limiter.get_limiter('metadata_api')
+
+    limiter = EndpointLimiter('test', requests_per_second=50, burst=1, max_concurrent=2)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def fetch():
+        with limiter.limit():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=fetch) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
+    assert time.monotonic() - start >= 9 / 50  # One token up front, then 50/s
+    assert limiter.stats()['requests'] == 10
+
+
+def test_pause_holds_every_caller():
+    """After a 429 nobody gets a token until the pause is over"""
+    bucket = RateLimiter(requests_per_second=100, burst=10)
+    bucket.pause(0.2)
+    assert bucket.reserve() >= 0.19
+
+
+def test_endpoint_classes():
+    """URLs map to the config sections that limit them"""
+    assert rate_limiter.endpoint_for_url(
+        'https://archive.org/advancedsearch.php?q=year:1977') == 'search_api'
+    assert rate_limiter.endpoint_for_url(
+        'https://archive.org/metadata/gd77-05-08') == 'metadata_api'
+    assert rate_limiter.endpoint_for_url(
+        'https://archive.org/download/gd77-05-08/d1t01.mp3') == 'streaming'
+    assert rate_limiter.endpoint_for_url('https://archive.org') == 'default'
+
+    limiter = rate_limiter.get_limiter('streaming')
+    assert limiter.bucket.reserve() == 0.0  # requests_per_second: null
+    assert limiter.max_concurrent == 1
@@ -0,0 +1,77 @@
+"""
+Tests for the shared keep-alive HTTP transport (src/api/transport.py).
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('requests')
+
+from src.api import transport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep connections open between requests
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Local HTTP/1.1 server; yields its base URL"""
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        transport.close_sessions()
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_requests_reuse_one_connection(server):
+    """Sequential requests to a host share one pooled connection"""
+    for i in range(5):
+        assert transport.get(f"{server}/metadata/show{i}").json() == {'ok': True}
+    assert transport.head(server).status_code == 200
+
+    stats = transport.get_transport_stats()[server]
+    assert stats['requests'] == 6
+    assert stats['connections_opened'] == 1
+    assert stats['reused'] == 5
+    assert stats['errors'] == 0
+
+
+def test_one_session_per_host(server):
+    """Every caller gets the same session, with the configured User-Agent"""
+    session = transport.get_session(f"{server}/advancedsearch.php")
+    assert transport.get_session(f"{server}/metadata/x") is session
+    assert 'DeadStream' in session.headers['User-Agent']
+
+
+def test_errors_counted(server):
+    """Failed requests show up in the metrics and still raise"""
+    import requests
+
+    transport.close_sessions()
+    bad = 'http://127.0.0.1:9'  # Discard port: connection refused
+    with pytest.raises(requests.exceptions.ConnectionError):
+        transport.get(bad, timeout=1)
+    assert transport.get_transport_stats()[bad]['errors'] == 1
@@ -0,0 +1,96 @@
+"""
+Tests for the stored best recording per date (src/selection/best_recording.py).
+"""
+
+import sqlite3
+
+from src.database import queries
+from src.database.tracks import store_tracks
+from src.selection.best_recording import get_stored_best, refresh_best_recordings
+from src.selection.scoring import RecordingScorer
+
+
+SBD = 'gd1977-05-08.sbd.hicks.4982'
+AUD = 'gd1977-05-08.aud.vernon.1234'
+
+FORMAT_FIRST = {'source_type': 0.1, 'format_quality': 0.7, 'community_rating': 0.1,
+                'lineage': 0.05, 'taper': 0.05}
+
+
+def pending_dates(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return {row[0] for row in conn.execute("SELECT date FROM best_recording_pending")}
+    finally:
+        conn.close()
+
+
+def test_refresh_scores_every_queued_date(sample_db):
+    """Every date gets a stored winner with its component scores"""
+    # A fresh database queues dates as shows are inserted
+    assert len(pending_dates(sample_db)) == 7
+
+    result = refresh_best_recordings(scorer=RecordingScorer())
+    assert result['scored'] == 7
+    assert result['removed'] == 0
+    assert pending_dates(sample_db) == set()
+
+    show = queries.get_best_recording('1977-05-08')
+    assert show['identifier'] == SBD
+    assert show['recording_count'] == 2
+    assert show['recording_score'] > 0
+    assert show['rating_score'] > 0
+
+    # Nothing queued: a second refresh does no work
+    assert refresh_best_recordings(scorer=RecordingScorer())['scored'] == 0
+
+
+def test_unscored_date_falls_back_to_best_rated(sample_db):
+    """Dates not scored yet still return a recording"""
+    show = queries.get_best_recording('1977-05-08')
+    assert show['identifier'] == SBD
+    assert 'recording_score' not in show
+    assert queries.get_best_recording('1900-01-01') is None
+
+
+def test_stored_tracks_requeue_their_date(sample_db):
+    """A recording's stored format can change the winner of its date only"""
+    scorer = RecordingScorer(weights=FORMAT_FIRST)
+    refresh_best_recordings(scorer=scorer)
+    assert queries.get_best_recording('1977-05-08')['identifier'] == SBD
+
+    store_tracks(AUD, [{'filename': 'gd77-05-08d1t01.flac', 'format': 'Flac'}])
+    assert pending_dates(sample_db) == {'1977-05-08'}
+
+    assert refresh_best_recordings(scorer=scorer)['scored'] == 1
+    show = queries.get_best_recording('1977-05-08')
+    assert show['identifier'] == AUD
+    assert show['format_score'] == 100
+
+
+def test_changed_weights_rescore(sample_db):
+    """Rows scored with other weights are stale until the next refresh"""
+    refresh_best_recordings(scorer=RecordingScorer())
+    assert get_stored_best('1977-05-08', RecordingScorer()) == SBD
+
+    scorer = RecordingScorer(weights=FORMAT_FIRST)
+    assert get_stored_best('1977-05-08', scorer) is None
+    assert get_stored_best('1977-05-08') == SBD
+
+    assert refresh_best_recordings(scorer=scorer)['scored'] == 7
+    assert get_stored_best('1977-05-08', scorer) == SBD
+
+
+def test_deleted_date_removed(sample_db):
+    """A date whose last recording is deleted loses its row"""
+    refresh_best_recordings(scorer=RecordingScorer())
+
+    conn = sqlite3.connect(sample_db)
+    conn.execute("DELETE FROM shows WHERE date = '1995-07-09'")
+    conn.commit()
+    conn.close()
+
+    assert get_stored_best('1995-07-09') is None  # Queued, so not trusted
+    result = refresh_best_recordings(scorer=RecordingScorer())
+    assert result == {'scored': 0, 'removed': 1, 'seconds': result['seconds']}
+    assert queries.get_best_recording('1995-07-09') is None
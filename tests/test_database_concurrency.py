@@ -0,0 +1,75 @@
+"""
+Stress test: UI-style readers while a populate run writes (WAL mode).
+"""
+
+import threading
+
+from src.database import queries
+from src.database.connection import (checkpoint, close_all_connections,
+                                     open_update_connection)
+from src.database.migrations import migrate
+from src.database.synthetic import SHOW_COLUMNS, generate_shows
+from src.selection.best_recording import refresh_best_recordings
+from src.selection.scoring import RecordingScorer
+
+
+ROWS = 4000
+BATCH = 200   # Shows per commit (populate_database.py commits per year)
+READERS = 4
+
+
+def test_readers_never_blocked_during_populate(tmp_path, monkeypatch):
+    """Readers see each committed generation and never hit a locked database"""
+    db_path = str(tmp_path / 'shows.db')
+    conn = open_update_connection(db_path)
+    migrate(conn)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    monkeypatch.setattr(queries, 'DB_PATH', db_path)
+
+    done = threading.Event()
+    errors = []
+    counts = [[] for _ in range(READERS)]
+
+    def reader(seen):
+        try:
+            while not done.is_set():
+                seen.append(queries.get_show_count())
+                queries.search_by_year(1977)
+                queries.get_most_played_venues(5)
+                queries.get_best_recording('1977-05-08')
+                for _ in queries.iter_top_rated_shows(page_size=50):
+                    break
+        except Exception as e:  # Reported below, on the test thread
+            errors.append(e)
+
+    threads = [threading.Thread(target=reader, args=(seen,)) for seen in counts]
+    for thread in threads:
+        thread.start()
+
+    try:
+        rows = list(generate_shows(ROWS))
+        for start in range(0, ROWS, BATCH):
+            conn.executemany(f"""
+                INSERT INTO shows ({', '.join(SHOW_COLUMNS)})
+                VALUES ({', '.join('?' * len(SHOW_COLUMNS))})
+            """, rows[start:start + BATCH])
+            conn.commit()
+        conn.close()
+        # Writes through the pooled writer while readers are still running
+        refresh_best_recordings(db_path, scorer=RecordingScorer())
+    finally:
+        done.set()
+        for thread in threads:
+            thread.join()
+
+    try:
+        assert errors == []
+        for seen in counts:
+            assert seen and seen == sorted(seen)  # Never an older generation
+        assert any(0 < count < ROWS for seen in counts for count in seen)
+
+        # The new generation is visible without reopening anything
+        assert queries.get_show_count() == ROWS
+        assert checkpoint(db_path)['busy'] == 0
+    finally:
+        close_all_connections()
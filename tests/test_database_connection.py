@@ -0,0 +1,122 @@
+"""
+Tests for the pooled connection manager (src/database/connection.py)
+"""
+
+import threading
+
+from src.database import queries
+from src.database.connection import get_manager
+
+
+def test_reader_is_reused_within_thread(sample_db):
+    """Repeated queries on one thread share a single connection"""
+    manager = get_manager(sample_db)
+    first = manager.reader()
+
+    queries.get_show_count()
+    queries.get_top_rated_shows(5, 1)
+
+    assert manager.reader() is first
+
+
+def test_close_returns_connection_to_pool(sample_db):
+    """Legacy conn.close() calls must not break the shared connection"""
+    conn = get_manager(sample_db).reader()
+    conn.close()
+
+    assert queries.get_show_count() == 8
+
+
+def test_each_thread_gets_its_own_reader(sample_db):
+    """Readers are thread-local"""
+    manager = get_manager(sample_db)
+    seen = []
+
+    def worker():
+        seen.append(manager.reader())
+        seen.append(queries.get_show_count())
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen[0] is not manager.reader()
+    assert seen[1] == 8
+
+
+def test_reader_closed_when_thread_ends(sample_db):
+    """Short-lived worker threads don't leave connections open"""
+    import gc
+
+    manager = get_manager(sample_db)
+    manager.reader()
+    before = manager.open_connection_count()
+    readers = []
+
+    def worker():
+        readers.append(manager.reader())
+        queries.get_show_count()
+
+    for _ in range(5):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+    gc.collect()
+
+    assert manager.open_connection_count() == before
+    assert queries.get_show_count() == 8
+
+
+def test_writer_commits_and_readers_see_it(sample_db):
+    """Writes through the serialized writer are visible to readers"""
+    manager = get_manager(sample_db)
+
+    with manager.writer() as conn:
+        conn.execute("UPDATE shows SET taper = 'Miller' WHERE date = '1977-05-09'")
+
+    show = queries.get_show_by_date('1977-05-09')[0]
+    assert show['taper'] == 'Miller'
+
+
+def test_writer_rolls_back_on_error(sample_db):
+    """A failing write block leaves the database untouched"""
+    manager = get_manager(sample_db)
+
+    try:
+        with manager.writer() as conn:
+            conn.execute("DELETE FROM shows")
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+
+    assert queries.get_show_count() == 8
+
+
+def test_snapshot_mode(sample_db, tmp_path):
+    """Queries run against a compacted read-only snapshot"""
+    import os
+    import sqlite3
+
+    import pytest
+
+    from src.database.snapshot import build_snapshot, use_snapshot
+
+    snapshot = str(tmp_path / 'shows.snapshot.db')
+    info = build_snapshot(sample_db, snapshot, page_size=8192)
+    assert info['page_size'] == 8192
+
+    assert use_snapshot(snapshot)
+    manager = get_manager(snapshot)
+    assert manager.read_only
+    assert queries.get_show_count() == 8
+    assert len(queries.search_by_venue('barton')) == 2
+    assert manager.reader().execute("PRAGMA mmap_size").fetchone()[0] > 0
+
+    with pytest.raises(sqlite3.OperationalError):
+        with manager.writer():
+            pass
+    with pytest.raises(sqlite3.OperationalError):
+        manager.reader().execute("DELETE FROM shows")
+
+    assert not use_snapshot(str(tmp_path / 'missing.db'))
+    assert not os.path.exists(snapshot + '.tmp')
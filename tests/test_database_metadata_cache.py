@@ -0,0 +1,97 @@
+"""
+Tests for the persistent metadata cache (src/database/metadata_cache.py).
+"""
+
+import sqlite3
+
+from src.database.metadata_cache import MetadataCache
+
+
+def _metadata(identifier, tracks=50):
+    """Metadata document shaped like an Archive.org response"""
+    return {
+        'metadata': {'identifier': identifier, 'date': '1977-05-08'},
+        'files': [{'name': f'{identifier}d1t{i:02d}.mp3', 'format': 'VBR MP3'}
+                  for i in range(tracks)],
+    }
+
+
+def test_round_trip_and_hit_rate(tmp_path):
+    """Documents survive compression and are counted as hits"""
+    cache = MetadataCache(str(tmp_path / 'cache.db'))
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return _metadata('gd77')
+
+    assert cache.get_or_fetch('gd77', fetch) == _metadata('gd77')
+    assert cache.get_or_fetch('gd77', fetch) == _metadata('gd77')
+    assert len(fetches) == 1
+
+    stats = cache.stats()
+    assert stats['entries'] == 1
+    assert stats['hits'] == 1 and stats['misses'] == 1
+    assert stats['hit_rate'] == 0.5
+    assert stats['stored_bytes'] < stats['raw_bytes']
+    cache.close()
+
+
+def test_persists_across_instances(tmp_path):
+    """A new process reads what the previous one stored"""
+    path = str(tmp_path / 'cache.db')
+    cache = MetadataCache(path)
+    cache.put('gd77', _metadata('gd77'))
+    cache.close()
+
+    assert MetadataCache(path).get('gd77') == _metadata('gd77')
+
+
+def test_expired_entries_are_misses(tmp_path):
+    """Entries older than the TTL are dropped on lookup"""
+    path = str(tmp_path / 'cache.db')
+    cache = MetadataCache(path, ttl_seconds=60)
+    cache.put('gd77', _metadata('gd77'))
+
+    conn = sqlite3.connect(path)
+    conn.execute("UPDATE metadata_cache SET fetched_at = fetched_at - 120")
+    conn.commit()
+    conn.close()
+
+    assert cache.get('gd77') is None
+    assert cache.stats()['expired'] == 1
+    assert cache.stats()['entries'] == 0
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path):
+    """The oldest untouched entries go first"""
+    path = str(tmp_path / 'cache.db')
+    cache = MetadataCache(path)
+    for identifier in ('a', 'b', 'c'):
+        cache.put(identifier, _metadata(identifier))
+
+    conn = sqlite3.connect(path)
+    for accessed_at, identifier in ((1, 'a'), (2, 'b'), (3, 'c')):
+        conn.execute("UPDATE metadata_cache SET accessed_at = ? WHERE identifier = ?",
+                     (accessed_at, identifier))
+    conn.commit()
+    entry_size = conn.execute("SELECT MAX(stored_size) FROM metadata_cache").fetchone()[0]
+    conn.close()
+
+    cache.get('a')   # 'a' becomes most recently used
+    cache.max_bytes = entry_size * 3
+    cache.put('d', _metadata('d'))
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('d') is not None
+    assert cache.stats()['evictions'] == 1
+
+
+def test_zero_ttl_disables_cache(tmp_path):
+    """cache_ttl_seconds: 0 turns caching off"""
+    cache = MetadataCache(str(tmp_path / 'cache.db'), ttl_seconds=0)
+    cache.put('gd77', _metadata('gd77'))
+
+    assert cache.get('gd77') is None
+    assert not (tmp_path / 'cache.db').exists()
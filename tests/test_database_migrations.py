@@ -0,0 +1,113 @@
+"""
+Tests for the schema migration runner (src/database/migrations.py).
+"""
+
+import sqlite3
+
+import pytest
+
+from src.database import migrations
+from src.database.schema import SCHEMA_SQL, get_schema_version
+
+
+def _schema_objects(conn):
+    """Names and types of every table, index and trigger"""
+    return sorted(conn.execute("""
+        SELECT type, name FROM sqlite_master
+        WHERE name NOT LIKE 'sqlite_%'
+    """).fetchall())
+
+
+def _create_legacy_database(db_path):
+    """A 1.0-era database: plain shows table, no migrations recorded"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE shows (
+            identifier TEXT PRIMARY KEY, date TEXT NOT NULL, venue TEXT,
+            city TEXT, state TEXT, avg_rating REAL, num_reviews INTEGER,
+            source_type TEXT, taper TEXT, last_updated TEXT
+        )
+    """)
+    conn.execute("CREATE INDEX idx_date ON shows(date)")
+    conn.execute("""
+        INSERT INTO shows (identifier, date, venue, city, state)
+        VALUES ('gd1977-05-08.sbd', '1977-05-08', 'Barton Hall', 'Ithaca', 'NY')
+    """)
+    conn.commit()
+    return conn
+
+
+def test_fresh_database_matches_schema(tmp_path):
+    """Migrating an empty file gives the same objects as SCHEMA_SQL"""
+    migrated = sqlite3.connect(str(tmp_path / 'migrated.db'))
+    applied = migrations.migrate(migrated)
+
+    direct = sqlite3.connect(str(tmp_path / 'direct.db'))
+    for sql in SCHEMA_SQL:
+        direct.execute(sql)
+
+    assert [version for version, _, _ in applied] == \
+        list(range(1, migrations.LATEST_VERSION + 1))
+    assert migrations.get_user_version(migrated) == migrations.LATEST_VERSION
+    assert _schema_objects(migrated) == _schema_objects(direct)
+    assert get_schema_version() == migrations.MIGRATIONS[-1].schema_version
+
+
+def test_migrate_is_incremental(tmp_path):
+    """Only pending steps run; a second run does nothing"""
+    conn = sqlite3.connect(str(tmp_path / 'shows.db'))
+
+    assert len(migrations.migrate(conn, target=2)) == 2
+    assert migrations.get_user_version(conn) == 2
+    assert [m.version for m in migrations.pending_migrations(conn)] == \
+        list(range(3, migrations.LATEST_VERSION + 1))
+
+    migrations.migrate(conn)
+    assert migrations.migrate(conn) == []
+
+
+def test_legacy_database_upgraded_in_place(tmp_path):
+    """Existing rows survive and gain search, date parts and stats"""
+    conn = _create_legacy_database(str(tmp_path / 'legacy.db'))
+    migrations.migrate(conn)
+
+    assert conn.execute("SELECT year, month, day FROM shows").fetchone() == (1977, 5, 8)
+    assert conn.execute(
+        "SELECT rowid FROM shows_fts WHERE shows_fts MATCH 'barton'").fetchone() == (1,)
+    assert conn.execute("SELECT * FROM stats_year").fetchall() == [(1977, 1)]
+
+    # Triggers dropped with the rebuilt table are back
+    conn.execute("""
+        INSERT INTO shows (identifier, date, venue)
+        VALUES ('gd1978-01-01.sbd', '1978-01-01', 'Winterland')
+    """)
+    assert conn.execute("SELECT COUNT(*) FROM stats_year").fetchone() == (2,)
+
+
+def test_failed_step_rolls_back(tmp_path, monkeypatch):
+    """A failing step leaves the database at the previous version"""
+    conn = sqlite3.connect(str(tmp_path / 'shows.db'))
+
+    def broken(conn):
+        conn.execute("CREATE TABLE half_done (x)")
+        raise sqlite3.OperationalError("disk I/O error")
+
+    steps = list(migrations.MIGRATIONS)
+    steps[1] = steps[1]._replace(apply=broken)
+    monkeypatch.setattr(migrations, 'MIGRATIONS', steps)
+
+    with pytest.raises(migrations.MigrationError):
+        migrations.migrate(conn)
+
+    assert migrations.get_user_version(conn) == 1
+    assert conn.execute(
+        "SELECT name FROM sqlite_master WHERE name = 'half_done'").fetchone() is None
+
+
+def test_newer_database_is_refused(tmp_path):
+    """A database migrated by a newer build isn't touched"""
+    conn = sqlite3.connect(str(tmp_path / 'shows.db'))
+    conn.execute(f"PRAGMA user_version = {migrations.LATEST_VERSION + 1}")
+
+    with pytest.raises(migrations.MigrationError):
+        migrations.migrate(conn)
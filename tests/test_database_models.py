@@ -0,0 +1,58 @@
+"""
+Tests for the Show record type (src/database/models.py).
+"""
+
+import pickle
+
+import pytest
+
+from src.database import queries
+from src.database.models import Show, make_show
+
+
+def test_show_reads_like_a_dict():
+    """Existing dict-style callers keep working"""
+    show = make_show({'identifier': 'gd77', 'date': '1977-05-08', 'taper': None})
+
+    assert show['date'] == '1977-05-08'
+    assert show.get('taper', 'x') is None
+    assert show.get('missing', 'x') == 'x'
+    assert show.date == '1977-05-08'
+    assert 'identifier' in show and 'missing' not in show
+    assert list(show) == ['identifier', 'date', 'taper']
+    assert dict(show) == {'identifier': 'gd77', 'date': '1977-05-08', 'taper': None}
+    assert show == {'identifier': 'gd77', 'date': '1977-05-08', 'taper': None}
+    assert len(show) == 3
+
+    with pytest.raises(KeyError):
+        show['missing']
+
+
+def test_show_is_immutable():
+    """Edits go through replace() or a dict copy"""
+    show = make_show({'identifier': 'gd77', 'taper': None})
+
+    with pytest.raises(TypeError):
+        show['taper'] = 'Hicks'
+
+    edited = show.replace(taper='Hicks')
+    assert edited['taper'] == 'Hicks'
+    assert show['taper'] is None
+
+
+def test_show_types_are_shared():
+    """Rows with the same columns share one class (no per-row key storage)"""
+    first = make_show({'identifier': 'a', 'date': '1977-05-08'})
+    second = make_show({'identifier': 'b', 'date': '1977-05-09'})
+
+    assert type(first) is type(second)
+    assert pickle.loads(pickle.dumps(first)) == first
+
+
+def test_queries_return_show_records(sample_db):
+    """The query layer hands out Show records"""
+    show = queries.get_show_by_identifier('gd1977-05-08.sbd.hicks.4982')
+    assert isinstance(show, Show)
+    assert show['venue'] == 'Barton Hall, Cornell University'
+    assert all(isinstance(s, Show) for s in queries.search_by_year(1977))
+    assert isinstance(queries.get_random_show(), Show)
@@ -0,0 +1,485 @@
+"""
+Tests for the query layer (src/database/queries.py)
+"""
+
+from src.database import queries
+
+
+# ============================================================================
+# FULL-TEXT SEARCH
+# ============================================================================
+
+def test_build_match_query_quotes_words():
+    """User input is split into quoted prefix terms"""
+    assert queries.build_match_query('barton hall', ['venue']) == \
+        '{venue} : ("barton"* "hall"*)'
+    assert queries.build_match_query('CA', ['state'], prefix=False) == \
+        '{state} : ("CA")'
+    assert queries.build_match_query('  "*  ') is None
+
+
+def test_search_by_venue_prefix_match(sample_db):
+    """Partial words match venue names"""
+    shows = queries.search_by_venue('fill west')
+    assert [s['venue'] for s in shows] == ['Fillmore West']
+
+    shows = queries.search_by_venue('barton')
+    assert len(shows) == 2
+
+
+def test_search_by_city_and_state(sample_db):
+    """City and state lookups go through the FTS index"""
+    assert len(queries.search_by_city('san fran')) == 2
+    assert len(queries.search_by_state('NY')) == 4
+    assert queries.search_by_state('N') == []
+
+
+def test_search_shows_ranks_venue_matches(sample_db):
+    """Text queries are ranked and combine with regular filters"""
+    results = queries.search_shows(query='winterland')
+    assert results[0]['venue'] == 'Winterland Arena'
+
+    results = queries.search_shows(query='san', year=1969)
+    assert [s['date'] for s in results] == ['1969-02-27']
+
+
+def test_search_index_follows_updates(sample_db):
+    """Triggers keep shows_fts in sync with shows"""
+    from src.database.connection import get_manager
+
+    with get_manager(sample_db).writer() as conn:
+        conn.execute("""
+            UPDATE shows SET venue = 'Cow Palace'
+            WHERE identifier = 'gd1995-07-09.aud.soldier.1111'
+        """)
+
+    assert queries.search_by_venue('soldier') == []
+    assert len(queries.search_by_venue('cow pal')) == 1
+
+
+def test_show_count_by_venue(sample_db):
+    """VenueBrowser counts match venue words by prefix"""
+    assert queries.get_show_count_by_venue(sample_db, 'Barton Hall') == 2
+    assert queries.get_show_count_by_venue(sample_db, 'Fox Theatre') == 0
+    assert queries.get_show_counts_for_venues(
+        sample_db, ('Barton', 'Winterland', 'Fox')
+    ) == {'Barton': 2, 'Winterland': 1, 'Fox': 0}
+
+
+# ============================================================================
+# DATE-PART QUERIES
+# ============================================================================
+
+def _query_plan(db_path, sql, params=()):
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement"""
+    import sqlite3
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    conn.close()
+    return ' | '.join(row[3] for row in rows)
+
+
+def test_date_part_columns_are_generated(sample_db):
+    """year/month/day are derived from date"""
+    show = queries.get_show_by_identifier('gd1977-05-08.sbd.hicks.4982')
+    assert (show['year'], show['month'], show['day']) == (1977, 5, 8)
+
+
+def test_year_queries(sample_db):
+    """Year-based queries use the integer year column"""
+    assert queries.get_show_dates_for_year(1977) == ['1977-05-08', '1977-05-09']
+    assert [s['date'] for s in queries.search_by_year(1977)] == \
+        ['1977-05-08', '1977-05-08', '1977-05-09']
+    assert queries.get_top_rated_by_year(1977, 1)[0]['avg_rating'] == 4.8
+    assert queries.get_years_with_shows() == [1969, 1972, 1977, 1978, 1990, 1995]
+    assert ('1977', 3) in queries.get_show_count_by_year()
+
+
+def test_month_and_on_this_day(sample_db):
+    """Month and month/day lookups"""
+    assert len(queries.get_shows_by_month(1977, 5)) == 3
+    assert queries.search_by_month(1978, 12)[0]['venue'] == 'Winterland Arena'
+    assert [s['year'] for s in queries.get_on_this_day(5, 8)] == [1972, 1977, 1977]
+
+
+def test_date_queries_use_indexes(sample_db):
+    """No date-family query falls back to a table scan"""
+    plan = _query_plan(sample_db,
+                       "SELECT * FROM shows WHERE month = ? AND day = ? ORDER BY date",
+                       (5, 8))
+    assert 'idx_month_day' in plan
+
+    plan = _query_plan(sample_db,
+                       "SELECT * FROM shows WHERE year = ? "
+                       "ORDER BY avg_rating DESC, num_reviews DESC LIMIT 10",
+                       (1977,))
+    assert 'idx_year_rating' in plan
+    assert 'TEMP B-TREE' not in plan
+
+
+def test_legacy_table_is_upgraded_in_place(tmp_path):
+    """Databases created before schema 1.2 gain the date-part columns"""
+    import sqlite3
+    from src.database.schema import add_date_part_columns
+
+    db_path = str(tmp_path / 'legacy.db')
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE shows (
+            identifier TEXT PRIMARY KEY, date TEXT NOT NULL, venue TEXT,
+            city TEXT, state TEXT, avg_rating REAL, num_reviews INTEGER,
+            source_type TEXT, taper TEXT, last_updated TEXT
+        )
+    """)
+    conn.execute("""
+        INSERT INTO shows (identifier, date, venue)
+        VALUES ('gd1977-05-08.sbd', '1977-05-08', 'Barton Hall')
+    """)
+    conn.commit()
+
+    assert add_date_part_columns(conn) is True
+    assert add_date_part_columns(conn) is False
+
+    row = conn.execute("SELECT rowid, venue, year, month, day FROM shows").fetchone()
+    assert row == (1, 'Barton Hall', 1977, 5, 8)
+    conn.close()
+
+
+# ============================================================================
+# RANDOM SHOW SAMPLER
+# ============================================================================
+
+def test_random_show_avoids_recent_repeats(sample_db):
+    """Consecutive draws cycle through the catalogue before repeating"""
+    drawn = [queries.get_random_show()['identifier'] for _ in range(8)]
+    assert len(set(drawn)) == 8
+
+
+def test_random_show_weighted_modes(sample_db):
+    """Weighted modes favour rated / soundboard recordings"""
+    from src.database.sampler import ShowSampler
+
+    sampler = ShowSampler(sample_db, history_size=0)
+    picks = [sampler.draw('soundboard')['identifier'] for _ in range(400)]
+    sbd_share = sum('sbd' in p for p in picks) / len(picks)
+    # 5 of 8 shows are soundboards; with 4x weight expect ~87%
+    assert sbd_share > 0.75
+
+    picks = [sampler.draw('top_rated')['avg_rating'] for _ in range(400)]
+    assert picks.count(3.2) < picks.count(4.8)
+
+
+def test_random_show_sees_new_rows(sample_db):
+    """The rowid array is rebuilt after another connection writes"""
+    from src.database.connection import get_manager
+    from src.database.sampler import ShowSampler
+
+    sampler = ShowSampler(sample_db, history_size=0)
+    sampler.draw()
+
+    with get_manager(sample_db).writer() as conn:
+        conn.execute("DELETE FROM shows WHERE identifier != 'gd1969-02-27.sbd.fillmore.9999'")
+
+    assert sampler.draw()['venue'] == 'Fillmore West'
+
+
+def test_random_show_rejects_unknown_mode(sample_db):
+    """Unknown modes raise ValueError"""
+    import pytest
+
+    with pytest.raises(ValueError):
+        queries.get_random_show('loudest')
+
+
+# ============================================================================
+# PAGINATED QUERIES
+# ============================================================================
+
+def test_pages_cover_every_row_once(sample_db):
+    """Keyset pages concatenate to the full ordered result"""
+    pages = list(queries.iter_show_pages(page_size=3))
+    assert [len(page) for page in pages] == [3, 3, 2]
+
+    flat = [show['identifier'] for page in pages for show in page]
+    assert len(set(flat)) == 8
+    dates = [show['date'] for page in pages for show in page]
+    assert dates == sorted(dates)
+
+
+def test_pages_break_ties_on_identifier(sample_db):
+    """Rows sharing a sort key are split across pages without loss"""
+    pages = list(queries.iter_shows_by_year(1977, page_size=1))
+    assert [page[0]['identifier'] for page in pages] == [
+        'gd1977-05-08.aud.vernon.1234',
+        'gd1977-05-08.sbd.hicks.4982',
+        'gd1977-05-09.sbd.miller.5555',
+    ]
+
+
+def test_pages_are_lazy(sample_db):
+    """Nothing is queried until a page is requested"""
+    pages = queries.iter_top_rated_shows(min_reviews=10, page_size=2)
+    first = next(pages)
+    assert [s['avg_rating'] for s in first] == [4.8, 4.7]
+    rest = [s['avg_rating'] for page in pages for s in page]
+    assert rest == [4.6, 4.5, 4.3, 4.1]
+
+
+def test_venue_pages(sample_db):
+    """Venue pages use the FTS index"""
+    pages = list(queries.iter_shows_by_venue('barton', page_size=10))
+    assert len(pages) == 1 and len(pages[0]) == 2
+    assert list(queries.iter_shows_by_venue('***')) == []
+
+
+# ============================================================================
+# QUERY RESULT CACHE
+# ============================================================================
+
+def test_repeated_queries_hit_cache(sample_db):
+    """Second identical call is served from the cache"""
+    before = queries.get_cache_stats()
+    queries.get_top_rated_shows(3, 1)
+    queries.get_top_rated_shows(3, 1)
+    after = queries.get_cache_stats()
+
+    assert after['misses'] - before['misses'] == 1
+    assert after['hits'] - before['hits'] == 1
+
+
+def test_cached_results_are_private_copies(sample_db):
+    """Mutating a returned list must not corrupt the cache"""
+    import pytest
+
+    shows = queries.get_top_rated_shows(3, 1)
+    with pytest.raises(TypeError):
+        shows[0]['venue'] = 'Changed'
+    shows.clear()
+
+    assert queries.get_top_rated_shows(3, 1)[0]['venue'] == 'Barton Hall, Cornell University'
+
+
+def test_cache_invalidated_by_external_write(sample_db):
+    """A commit from another connection (e.g. update script) invalidates"""
+    import sqlite3
+
+    assert queries.get_show_count() == 8
+
+    conn = sqlite3.connect(sample_db)
+    conn.execute("DELETE FROM shows WHERE year = 1995")
+    conn.commit()
+    conn.close()
+
+    assert queries.get_show_count() == 7
+
+
+def test_cache_survives_new_reader_threads(sample_db):
+    """Short-lived worker threads (new connections) don't invalidate"""
+    import threading
+
+    queries.get_show_count()
+    before = queries.get_cache_stats()
+
+    for _ in range(3):
+        thread = threading.Thread(target=queries.get_show_count)
+        thread.start()
+        thread.join()
+
+    after = queries.get_cache_stats()
+    assert after['invalidations'] == before['invalidations']
+    assert after['hits'] - before['hits'] == 3
+
+
+def test_cache_is_bounded():
+    """Least recently used entries are evicted"""
+    from src.database.cache import QueryCache
+
+    cache = QueryCache(max_entries=2)
+    cache._check_valid = lambda db_path: None
+
+    def square(x):
+        return x * x
+
+    for x in (1, 2, 3, 1):
+        cache.call('test.db', square, (x,), {})
+
+    stats = cache.stats()
+    assert stats['entries'] == 2
+    assert stats['evictions'] == 2
+    assert stats['hits'] == 0
+
+
+# ============================================================================
+# MATERIALIZED STATISTICS
+# ============================================================================
+
+def _grouped_counts(db_path):
+    """Counts computed the slow way, straight from the shows table"""
+    import sqlite3
+
+    conn = sqlite3.connect(db_path)
+    result = {
+        'year': conn.execute(
+            "SELECT year, COUNT(*) FROM shows GROUP BY year ORDER BY year").fetchall(),
+        'month': conn.execute(
+            "SELECT year, month, COUNT(*) FROM shows GROUP BY year, month "
+            "ORDER BY year, month").fetchall(),
+        'venue': conn.execute(
+            "SELECT venue, COUNT(*) FROM shows GROUP BY venue ORDER BY venue").fetchall(),
+        'state': conn.execute(
+            "SELECT state, COUNT(*) FROM shows WHERE state IS NOT NULL "
+            "GROUP BY state ORDER BY state").fetchall(),
+    }
+    conn.close()
+    return result
+
+
+def _stats_counts(db_path):
+    """Counts read from the stats_* summary tables"""
+    import sqlite3
+
+    conn = sqlite3.connect(db_path)
+    result = {
+        'year': conn.execute(
+            "SELECT year, show_count FROM stats_year ORDER BY year").fetchall(),
+        'month': conn.execute(
+            "SELECT year, month, show_count FROM stats_month "
+            "ORDER BY year, month").fetchall(),
+        'venue': conn.execute(
+            "SELECT venue, show_count FROM stats_venue ORDER BY venue").fetchall(),
+        'state': conn.execute(
+            "SELECT state, show_count FROM stats_state ORDER BY state").fetchall(),
+    }
+    conn.close()
+    return result
+
+
+def test_stats_queries(sample_db):
+    """Aggregate queries read the summary tables"""
+    assert queries.get_show_count() == 8
+    assert queries.get_show_count_for_year(1977) == 3
+    assert queries.get_show_count_for_year(1980) == 0
+    assert queries.get_show_count_by_month(1977) == [(5, 3)]
+    assert queries.get_venue_count() == 7
+    assert queries.get_most_played_venues(1) == [('Barton Hall, Cornell University', 2)]
+    assert queries.get_shows_by_state_stats()[0] == ('NY', 4)
+    assert _stats_counts(sample_db) == _grouped_counts(sample_db)
+
+
+def test_stats_follow_writes(sample_db):
+    """Triggers keep the summary tables in step with inserts, updates and deletes"""
+    from src.database.connection import get_manager
+
+    with get_manager(sample_db).writer() as conn:
+        conn.execute("""
+            INSERT INTO shows (identifier, date, venue, city, state)
+            VALUES ('gd1980-05-16.sbd.x', '1980-05-16', 'War Memorial', 'Buffalo', 'NY')
+        """)
+        conn.execute("""
+            UPDATE shows SET date = '1977-06-07', venue = 'Winterland Arena', state = 'CA'
+            WHERE identifier = 'gd1995-07-09.aud.soldier.1111'
+        """)
+        conn.execute("DELETE FROM shows WHERE identifier = 'gd1990-03-29.aud.nassau.4321'")
+
+    assert _stats_counts(sample_db) == _grouped_counts(sample_db)
+    assert queries.get_years_with_shows() == [1969, 1972, 1977, 1978, 1980]
+    assert queries.get_show_count_by_month(1977) == [(5, 3), (6, 1)]
+    assert ('IL', 1) not in queries.get_shows_by_state_stats()
+
+
+def test_stats_rebuilt_by_schema(sample_db):
+    """Rerunning the schema recomputes counts that drifted"""
+    import sqlite3
+    from src.database.schema import SCHEMA_SQL
+
+    conn = sqlite3.connect(sample_db)
+    conn.execute("UPDATE stats_year SET show_count = 99")
+    for statement in SCHEMA_SQL:
+        conn.execute(statement)
+    conn.commit()
+    conn.close()
+
+    assert _stats_counts(sample_db) == _grouped_counts(sample_db)
+
+
+# ============================================================================
+# BATCH LOOKUPS
+# ============================================================================
+
+def test_get_shows_by_dates_groups_by_date(sample_db):
+    """One call returns every requested date, best rated first"""
+    result = queries.get_shows_by_dates(['1977-05-08', '1969-02-27', '2001-01-01', '1977-05-08'])
+
+    assert list(result) == ['1977-05-08', '1969-02-27', '2001-01-01']
+    assert [s['identifier'] for s in result['1977-05-08']] == \
+        [s['identifier'] for s in queries.get_show_by_date('1977-05-08')]
+    assert len(result['1969-02-27']) == 1
+    assert result['2001-01-01'] == []
+    assert queries.get_shows_by_dates([]) == {}
+
+
+def test_get_shows_by_identifiers(sample_db):
+    """Missing identifiers map to None"""
+    result = queries.get_shows_by_identifiers(
+        ['gd1995-07-09.aud.soldier.1111', 'missing', 'gd1977-05-08.sbd.hicks.4982'])
+
+    assert list(result) == ['gd1995-07-09.aud.soldier.1111', 'missing',
+                            'gd1977-05-08.sbd.hicks.4982']
+    assert result['gd1995-07-09.aud.soldier.1111']['venue'] == 'Soldier Field'
+    assert result['missing'] is None
+    assert result['gd1977-05-08.sbd.hicks.4982'] == \
+        queries.get_show_by_identifier('gd1977-05-08.sbd.hicks.4982')
+
+
+# ============================================================================
+# FUZZY SEARCH
+# ============================================================================
+
+def test_fuzzy_search_places_tolerates_typos(sample_db):
+    """Misspelled and cut-short names still find the place"""
+    assert queries.fuzzy_search_places('winterlnd')[0]['name'] == 'Winterland Arena'
+    assert queries.fuzzy_search_places('Barton hal')[0]['name'] == \
+        'Barton Hall, Cornell University'
+
+    city = queries.fuzzy_search_places('san fransisco')[0]
+    assert (city['kind'], city['name'], city['state']) == ('city', 'San Francisco', 'CA')
+    assert city['show_count'] == 2
+    assert 0.5 <= city['similarity'] < 1
+
+    assert queries.fuzzy_search_places('xyzzy') == []
+    assert queries.fuzzy_search_places(' ,. ') == []
+
+
+def test_fuzzy_search_shows(sample_db):
+    """Shows at the best matching place come first, filters still apply"""
+    shows = queries.fuzzy_search_shows('barton hal')
+    assert [s['date'] for s in shows] == ['1977-05-08', '1977-05-08']
+
+    shows = queries.fuzzy_search_shows('san fransisco', year=1969)
+    assert [s['venue'] for s in shows] == ['Fillmore West']
+
+    assert len(queries.fuzzy_search_shows('san fransisco', limit=1)) == 1
+    assert queries.fuzzy_search_shows(year=1995)[0]['venue'] == 'Soldier Field'
+
+
+def test_fuzzy_index_follows_writes(sample_db):
+    """Places appear and disappear with their shows"""
+    from src.database.connection import get_manager
+
+    with get_manager(sample_db).writer() as conn:
+        conn.execute("""
+            INSERT INTO shows (identifier, date, venue, city, state)
+            VALUES ('gd1971-04-29.sbd.x', '1971-04-29', 'Fillmore East', 'New York', 'NY')
+        """)
+        conn.execute("DELETE FROM shows WHERE venue = 'Soldier Field'")
+
+    assert queries.fuzzy_search_places('filmore east')[0]['name'] == 'Fillmore East'
+    assert queries.fuzzy_search_places('soldier field') == []
+
+    conn = get_manager(sample_db).reader()
+    orphans = conn.execute("""
+        SELECT COUNT(*) FROM search_trigrams
+        WHERE place_id NOT IN (SELECT id FROM search_places)
+    """).fetchone()[0]
+    assert orphans == 0
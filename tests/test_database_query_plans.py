@@ -0,0 +1,67 @@
+"""
+Query plan regression tests: no query function may scan the shows table.
+
+Runs the benchmark workload (src/database/benchmark.py) once against a
+small synthetic catalogue. Plans are checked on every run; timings are
+left to scripts/benchmark_queries.py.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.database import benchmark
+from src.database.connection import close_all_connections
+from src.database.synthetic import build_catalogue, generate_shows
+
+
+@pytest.fixture(scope='module')
+def catalogue(tmp_path_factory):
+    """Synthetic 5,000-row catalogue shared by the tests in this module"""
+    path = str(tmp_path_factory.mktemp('catalogue') / 'shows.db')
+    build_catalogue(path, 5000)
+    yield path
+    close_all_connections()
+
+
+def test_every_query_function_is_benchmarked(catalogue):
+    """New query functions need a workload entry"""
+    conn = sqlite3.connect(catalogue)
+    workload = benchmark.build_workload(conn)
+    conn.close()
+
+    assert benchmark.missing_workload(workload) == []
+
+
+def test_no_full_table_scans(catalogue):
+    """Every query is answered from an index, the FTS table or the stats tables"""
+    results = benchmark.run_benchmark(catalogue, repeat=1)
+
+    scans = {name: result['full_scans'] for name, result in results.items()
+             if result['full_scans']}
+    assert scans == {}
+    assert all(result['statements'] for result in results.values())
+
+
+def test_full_scan_detection(catalogue):
+    """Unindexed filters and unbounded index walks are reported"""
+    conn = sqlite3.connect(catalogue)
+
+    assert benchmark.find_full_scans(conn, "SELECT * FROM shows WHERE taper = 'x'")
+    assert benchmark.find_full_scans(conn, "SELECT MIN(date), MAX(date) FROM shows")
+    assert not benchmark.find_full_scans(conn, "SELECT * FROM shows WHERE year = 1977")
+    assert not benchmark.find_full_scans(
+        conn, "SELECT * FROM shows ORDER BY avg_rating DESC LIMIT 10")
+    conn.close()
+
+
+def test_synthetic_catalogue_is_deterministic():
+    """Same seed, same rows; realistic spread of dates and ratings"""
+    first = list(generate_shows(2000, seed=7))
+    assert first == list(generate_shows(2000, seed=7))
+    assert len(first) == 2000
+
+    years = {row[1][:4] for row in first}
+    unrated = sum(1 for row in first if row[5] is None)
+    assert len(years) > 20
+    assert 0.2 < unrated / len(first) < 0.5
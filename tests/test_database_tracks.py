@@ -0,0 +1,73 @@
+"""
+Tests for local track storage (src/database/tracks.py).
+"""
+
+import sqlite3
+
+from src.database import tracks
+
+
+IDENTIFIER = 'gd1977-05-08.sbd.hicks.4982'
+
+ROWS = [
+    {'filename': 'gd77-05-08d1t01.mp3', 'title': 'New Minglewood Blues',
+     'set_name': 'Set I', 'track_number': '1', 'duration': '05:12',
+     'format': 'VBR MP3', 'size': '7480320'},
+    {'filename': 'gd77-05-08d1t01.flac', 'title': 'New Minglewood Blues',
+     'set_name': 'Set I', 'track_number': '1', 'duration': '312.4',
+     'format': 'Flac'},
+    {'filename': 'gd77-05-08d2t01.mp3', 'title': '', 'set_name': 'Set II',
+     'track_number': None, 'duration': None, 'format': 'VBR MP3'},
+]
+
+
+def test_store_and_read_tracks(sample_db):
+    """Tracks come back as Archive.org-style file entries"""
+    assert not tracks.has_tracks(IDENTIFIER)
+    assert tracks.get_tracks(IDENTIFIER) == []
+
+    assert tracks.store_tracks(IDENTIFIER, ROWS) == 3
+    assert tracks.has_tracks(IDENTIFIER)
+
+    files = tracks.get_tracks(IDENTIFIER)
+    assert [f['name'] for f in files] == ['gd77-05-08d1t01.mp3', 'gd77-05-08d2t01.mp3']
+    assert files[0]['title'] == 'New Minglewood Blues'
+    assert files[0]['track'] == 1
+    assert files[0]['length'] == 312.0
+    assert files[0]['size'] == 7480320
+    # Unknown values are left out, like in Archive.org metadata
+    assert 'title' not in files[1] and 'length' not in files[1]
+    assert files[1]['set_name'] == 'Set II'
+
+    assert len(tracks.get_tracks(IDENTIFIER, format_preference=None)) == 3
+    assert len(tracks.get_tracks(IDENTIFIER, format_preference='OGG')) == 3
+
+
+def test_store_replaces_previous_tracks(sample_db):
+    """Storing again replaces the old list instead of merging"""
+    tracks.store_tracks(IDENTIFIER, ROWS)
+    tracks.store_tracks(IDENTIFIER, ROWS[:1])
+
+    assert len(tracks.get_tracks(IDENTIFIER, format_preference=None)) == 1
+
+
+def test_tracks_removed_with_show(sample_db):
+    """Deleting a show deletes its tracks"""
+    tracks.store_tracks(IDENTIFIER, ROWS)
+
+    conn = sqlite3.connect(sample_db)
+    conn.execute("DELETE FROM shows WHERE identifier = ?", (IDENTIFIER,))
+    conn.commit()
+    conn.close()
+
+    assert not tracks.has_tracks(IDENTIFIER)
+
+
+def test_audio_file_filter():
+    """Derivative and non-audio files are skipped"""
+    assert tracks.is_audio_file({'name': 'gd77d1t01.flac', 'format': 'Flac'})
+    assert tracks.is_audio_file({'name': 'gd77d1t01.mp3', 'format': 'VBR MP3'})
+    assert not tracks.is_audio_file({'name': 'gd77d1t01_64kb.mp3', 'format': '64Kbps MP3'})
+    assert not tracks.is_audio_file({'name': 'gd77.txt', 'format': 'Text'})
+    assert tracks.parse_duration('1:02:03') == 3723.0
+    assert tracks.parse_duration('n/a') is None
@@ -0,0 +1,72 @@
+"""
+Tests for incremental database validation (src/database/validation.py).
+"""
+
+import sqlite3
+
+from src.database import validation
+
+
+def execute(db_path, sql, params=()):
+    conn = sqlite3.connect(db_path)
+    conn.execute(sql, params)
+    conn.commit()
+    conn.close()
+
+
+def test_full_validation_stores_every_show(sample_db):
+    """A full run checks every show and reports stored problems"""
+    execute(sample_db, "UPDATE shows SET date = '1999-01-01' "
+                       "WHERE identifier = 'gd1995-07-09.aud.soldier.1111'")
+
+    report = validation.validate_database(sample_db)
+    assert report.total_shows == 8
+    assert report.stats['Shows checked this run'] == 8
+    assert report.errors == [('gd1995-07-09.aud.soldier.1111',
+                              'DATE: Date out of range: 1999-01-01 (GD era: 1965-1995)')]
+    assert report.stats['Shows with venue'] == 8
+
+
+def test_incremental_rechecks_changed_rows_only(sample_db, monkeypatch):
+    """last_updated is the watermark; deleted shows drop out of the report"""
+    validation.validate_database(sample_db)
+
+    report = validation.validate_database(sample_db, incremental=True)
+    assert report.stats['Shows checked this run'] == 0
+
+    execute(sample_db, "UPDATE shows SET venue = NULL, last_updated = '2026-01-01T00:00:00' "
+                       "WHERE identifier = 'gd1972-05-08.sbd.bertha.0001'")
+    execute(sample_db, "DELETE FROM shows WHERE identifier = 'gd1990-03-29.aud.nassau.4321'")
+
+    report = validation.validate_database(sample_db, incremental=True)
+    assert report.stats['Shows checked this run'] == 1
+    assert report.total_shows == 7
+    assert report.warnings == [('gd1972-05-08.sbd.bertha.0001', 'Missing venue')]
+
+    # New rules re-check everything
+    monkeypatch.setattr(validation, 'RULES_VERSION', validation.RULES_VERSION + 1)
+    report = validation.validate_database(sample_db, incremental=True)
+    assert report.stats['Shows checked this run'] == 7
+
+
+def test_parallel_matches_serial(sample_db):
+    """Worker processes give the same outcome as checking in-process"""
+    execute(sample_db, "UPDATE shows SET avg_rating = 7 "
+                       "WHERE identifier = 'gd1969-02-27.sbd.fillmore.9999'")
+
+    serial = validation.validate_database(sample_db)
+    checked = validation.refresh_validation_state(sample_db, incremental=False,
+                                                  jobs=2, batch_size=3)
+    parallel = validation.validate_database(sample_db, incremental=True)
+
+    assert checked == 8
+    assert parallel.errors == serial.errors
+    assert parallel.warnings == serial.warnings
+
+
+def test_duplicate_checks(sample_db):
+    """Recordings group by venue; the primary key rules out duplicate ids"""
+    assert validation.find_duplicate_identifiers(sample_db) == []
+    assert validation.find_duplicate_shows(sample_db) == [
+        ('1977-05-08', 'Barton Hall, Cornell University', 2)
+    ]
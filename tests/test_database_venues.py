@@ -0,0 +1,116 @@
+"""
+Tests for normalized venues (src/database/venues.py and the venues table).
+"""
+
+import sqlite3
+
+from src.database import migrations, queries
+from src.database.venues import apply_known_aliases, rename_venue, resolve_venue
+
+
+def insert_show(conn, identifier, venue, city, state, date='1980-01-01'):
+    conn.execute("""
+        INSERT INTO shows (identifier, date, venue, city, state)
+        VALUES (?, ?, ?, ?, ?)
+    """, (identifier, date, venue, city, state))
+
+
+def venue_rows(conn):
+    return conn.execute(
+        "SELECT name, city, state, show_count FROM venues ORDER BY id"
+    ).fetchall()
+
+
+def test_existing_shows_linked(sample_db):
+    """Every sample show points at a venue with the right count"""
+    conn = sqlite3.connect(sample_db)
+    assert conn.execute("SELECT COUNT(*) FROM shows WHERE venue_id IS NULL").fetchone() == (0,)
+    assert ('Barton Hall, Cornell University', 'Ithaca', 'NY', 2) in venue_rows(conn)
+    assert queries.get_venue_count() == 7
+
+    venue_id = conn.execute(
+        "SELECT venue_id FROM shows WHERE identifier = 'gd1977-05-09.sbd.miller.5555'"
+    ).fetchone()[0]
+    assert queries.get_venue(venue_id)['name'] == 'War Memorial'
+    pages = list(queries.iter_shows_by_venue_id(venue_id))
+    assert [show['identifier'] for show in pages[0]] == ['gd1977-05-09.sbd.miller.5555']
+    conn.close()
+
+
+def test_spelling_variants_share_a_venue(sample_db):
+    """Case, punctuation, "The" and Theater/Theatre don't split a venue"""
+    conn = sqlite3.connect(sample_db)
+    insert_show(conn, 'a', 'Capitol Theater', 'Passaic', 'NJ')
+    insert_show(conn, 'b', 'The Capitol Theatre', 'Passaic', 'NJ')
+    insert_show(conn, 'c', 'CAPITOL THEATRE.', 'passaic', 'nj')
+    insert_show(conn, 'd', 'Capitol Theatre', 'Port Chester', 'NY')
+    conn.commit()
+
+    ids = dict(conn.execute(
+        "SELECT identifier, venue_id FROM shows WHERE identifier IN ('a', 'b', 'c', 'd')"))
+    assert ids['a'] == ids['b'] == ids['c']
+    assert ids['d'] != ids['a']  # Same name, different town
+    assert queries.get_venue(ids['a'])['show_count'] == 3
+
+    # Exact search matches every spelling of the name, in both towns
+    shows = queries.search_by_venue('the capitol theater', exact_match=True)
+    assert sorted(show['identifier'] for show in shows) == ['a', 'b', 'c', 'd']
+    conn.close()
+
+
+def test_counts_follow_updates_and_deletes(sample_db):
+    """show_count tracks re-pointed and deleted shows"""
+    conn = sqlite3.connect(sample_db)
+    conn.execute("""
+        UPDATE shows SET venue = 'Winterland Ballroom'
+        WHERE identifier = 'gd1978-12-31.sbd.winterland.777'
+    """)
+    conn.execute("DELETE FROM shows WHERE identifier = 'gd1977-05-08.aud.vernon.1234'")
+    conn.commit()
+
+    counts = {name: count for name, _, _, count in venue_rows(conn)}
+    assert counts['Winterland Arena'] == 0
+    assert counts['Winterland Ballroom'] == 1
+    assert counts['Barton Hall, Cornell University'] == 1
+    conn.close()
+
+
+def test_rename_merges_and_keeps_alias(sample_db):
+    """Folding an old name merges the venues; later imports follow the alias"""
+    conn = sqlite3.connect(sample_db)
+    insert_show(conn, 'old', 'Winterland Ballroom', 'San Francisco', 'CA')
+    assert apply_known_aliases(conn) == {'renamed': 0, 'merged': 1}
+    conn.commit()
+
+    assert conn.execute(
+        "SELECT venue FROM shows WHERE identifier = 'old'").fetchone() == ('Winterland Arena',)
+    assert queries.get_show_count_by_venue(None, 'Winterland') == 2
+
+    # The alias catches the old spelling on the way in
+    venue_id, name = resolve_venue(conn, 'Winterland Ballroom', 'San Francisco', 'CA')
+    assert name == 'Winterland Arena'
+    insert_show(conn, 'new', 'Winterland Ballroom', 'San Francisco', 'CA')
+    assert conn.execute(
+        "SELECT venue_id FROM shows WHERE identifier = 'new'").fetchone() == (venue_id,)
+
+    # A plain rename keeps the venue id
+    assert rename_venue(conn, venue_id, 'Winterland') == venue_id
+    assert resolve_venue(conn, 'Winterland Arena', 'San Francisco', 'CA') == \
+        (venue_id, 'Winterland')
+    conn.close()
+
+
+def test_migration_backfills_venues(tmp_path):
+    """Upgrading a 1.6 database links old rows to their most common spelling"""
+    conn = sqlite3.connect(str(tmp_path / 'shows.db'))
+    migrations.migrate(conn, target=7)
+    for identifier, venue in [('a', 'Spectrum'), ('b', 'The Spectrum'), ('c', 'Spectrum')]:
+        insert_show(conn, identifier, venue, 'Philadelphia', 'PA')
+    conn.commit()
+
+    migrations.migrate(conn)
+    assert venue_rows(conn) == [('Spectrum', 'Philadelphia', 'PA', 3)]
+    assert {row[0] for row in conn.execute("SELECT venue FROM shows")} == {'Spectrum'}
+    assert conn.execute(
+        "SELECT name FROM sqlite_master WHERE name = 'idx_venue'").fetchone() is None
+    conn.close()
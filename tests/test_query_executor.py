@@ -0,0 +1,97 @@
+"""
+Tests for the background query executor (src/ui/query_executor.py).
+"""
+
+import threading
+import time
+
+import pytest
+
+QtCore = pytest.importorskip('PyQt5.QtCore')
+
+from src.database import queries
+from src.ui.query_executor import QueryExecutor
+
+
+@pytest.fixture(scope='module')
+def app():
+    """Qt event loop for signal delivery"""
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+def _wait_for(app, condition, timeout=5.0):
+    """Process events until condition() is true"""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    return condition()
+
+
+def test_results_delivered_on_main_thread(app, sample_db):
+    """Callbacks run on the thread that owns the executor"""
+    executor = QueryExecutor()
+    results = []
+
+    executor.submit(queries.search_by_year, 1977,
+                    on_result=lambda shows: results.append(
+                        (threading.current_thread(), [show['date'] for show in shows])))
+
+    assert _wait_for(app, lambda: results)
+    assert results == [(threading.main_thread(),
+                        ['1977-05-08', '1977-05-08', '1977-05-09'])]
+    executor.shutdown()
+
+
+def test_superseded_results_are_dropped(app, sample_db):
+    """Only the newest request on a channel reports back"""
+    executor = QueryExecutor()
+    release = threading.Event()
+    results = []
+
+    def slow_query():
+        release.wait(5)
+        return 'stale'
+
+    first = executor.submit(slow_query, channel='content', on_result=results.append)
+    second = executor.submit(lambda: 'fresh', channel='content', on_result=results.append)
+    release.set()
+
+    assert _wait_for(app, lambda: results)
+    executor.pool.waitForDone(5000)
+    app.processEvents()
+    assert results == ['fresh']
+    assert not executor.is_pending(first) and not executor.is_pending(second)
+    executor.shutdown()
+
+
+def test_cancel_interrupts_running_query(app, sample_db):
+    """A running SQLite statement is interrupted on cancel"""
+    executor = QueryExecutor()
+    errors = []
+    outcomes = []
+
+    def endless_query():
+        with queries.DatabaseConnection() as cursor:
+            cursor.execute("""
+                WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n)
+                SELECT COUNT(*) FROM n
+            """)
+            return cursor.fetchone()
+
+    def run():
+        try:
+            return endless_query()
+        except Exception as e:
+            outcomes.append(e)
+            raise
+
+    request_id = executor.submit(run, on_result=outcomes.append, on_error=errors.append)
+    assert _wait_for(app, lambda: request_id in executor._running)
+
+    assert executor.cancel(request_id)
+    assert _wait_for(app, lambda: outcomes)
+    assert 'interrupted' in str(outcomes[0])
+    app.processEvents()
+    assert errors == []
+    executor.shutdown()